@@ -39,6 +39,15 @@ ytcfg_defaults["yt"] = {
     "thread_field_detection": False,
     "ignore_invalid_unit_operation_errors": False,
     "chunk_size": 1000,
+    "io_threads": 1,
+    "mmap_hdf5": False,
+    "prefetch_bytes": 2**28,
+    "chunk_bytes": 2**27,
+    "fast_grid_index": False,
+    "grid_index_cache": False,
+    "lazy_grid_objects": False,
+    "field_cache_dir": "",
+    "field_cache_max_bytes": 2**30,
     "xray_data_dir": "/does/not/exist",
     "supp_data_dir": "/does/not/exist",
     "default_colormap": "cmyt.arbre",
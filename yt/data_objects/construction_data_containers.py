@@ -53,9 +53,10 @@ from yt.utilities.lib.pixelization_routines import (
     normalization_3d_utility,
     pixelize_sph_kernel_arbitrary_grid,
 )
-from yt.utilities.lib.quad_tree import QuadTree
+from yt.utilities.lib.quad_tree import QuadTree, merge_quadtrees
 from yt.utilities.math_utils import compute_stddev_image
 from yt.utilities.minimal_representation import MinimalProjectionData
+from yt.utilities.parallel_tools import shared_memory_backend
 from yt.utilities.parallel_tools.parallel_analysis_interface import (
     communication_system,
     parallel_objects,
@@ -269,36 +270,44 @@ class YTProj(YTSelectionContainer2D):
         if isinstance(self.ds, ParticleDataset):
             return
         tree = self._get_tree(nfields + nsfields)
+        if self.method in ["max", "mip"]:
+            merge_style = -1
+            op = "max"
+        elif self.method == "min":
+            merge_style = -2
+            op = "min"
+        elif self.method == "integrate":
+            merge_style = 1
+            op = "sum"
+        else:
+            raise NotImplementedError
         # This only needs to be done if we are in parallel; otherwise, we can
         # safely build the mesh as we go.
         if communication_system.communicators[-1].size > 1:
             for chunk in self.data_source.chunks([], "io", local_only=False):
                 self._initialize_chunk(chunk, tree)
         _units_initialized = False
+        prefetch_fields = fields + sfields
+        if self.weight_field is not None:
+            prefetch_fields = prefetch_fields + [self.weight_field]
         with self.data_source._field_parameter_state(self.field_parameters):
-            for chunk in parallel_objects(
-                self.data_source.chunks([], "io", local_only=True)
-            ):
-                if not _units_initialized:
-                    self._initialize_projected_units(fields, chunk)
-                    _units_initialized = True
-                self._handle_chunk(chunk, fields + sfields, tree)
+            if shared_memory_backend.is_active():
+                self._handle_chunks_in_workers(fields, sfields, tree, merge_style)
+            else:
+                for chunk in parallel_objects(
+                    self.data_source.chunks(
+                        [], "io", local_only=True, prefetch_fields=prefetch_fields
+                    )
+                ):
+                    if not _units_initialized:
+                        self._initialize_projected_units(fields, chunk)
+                        _units_initialized = True
+                    self._handle_chunk(chunk, fields + sfields, tree)
         # if there's less than nprocs chunks, units won't be initialized
         # on all processors, so sync with _projected_units on rank 0
         projected_units = self.comm.mpi_bcast(self._projected_units)
         self._projected_units = projected_units
         # Note that this will briefly double RAM usage
-        if self.method in ["max", "mip"]:
-            merge_style = -1
-            op = "max"
-        elif self.method == "min":
-            merge_style = -2
-            op = "min"
-        elif self.method == "integrate":
-            merge_style = 1
-            op = "sum"
-        else:
-            raise NotImplementedError
         # TODO: Add the combine operation
         xax = self.ds.coordinates.x_axis[self.axis]
         yax = self.ds.coordinates.y_axis[self.axis]
@@ -386,6 +395,30 @@ class YTProj(YTSelectionContainer2D):
             pass
         return pw
 
+    def _handle_chunks_in_workers(self, fields, sfields, tree, merge_style):
+        # With the shared-memory backend, each worker process fills a tree of
+        # its own from a disjoint share of the io chunks.  The trees are then
+        # sent back and merged into tree.
+        nprocs = shared_memory_backend.num_procs
+        storage = {}
+        for sto, rank in parallel_objects(range(nprocs), storage=storage):
+            wtree = self._get_tree(len(fields) + len(sfields))
+            for ci, chunk in enumerate(self.data_source.chunks([], "io")):
+                if ci % nprocs != rank:
+                    continue
+                self._initialize_projected_units(fields, chunk)
+                self._handle_chunk(chunk, fields + sfields, wtree)
+            units = {f: str(u) for f, u in self._projected_units.items()}
+            sto.result = wtree.tobuffer(), units
+        for rank in sorted(storage):
+            buf, units = storage.pop(rank)
+            for field, unit in units.items():
+                unit = Unit(unit, registry=self.ds.unit_registry)
+                self._projected_units.setdefault(field, unit)
+            wtree = self._get_tree(len(fields) + len(sfields))
+            wtree.frombuffer(*buf, self.method)
+            merge_quadtrees(tree, wtree, merge_style)
+
     def _initialize_projected_units(self, fields, chunk):
         for field in self.data_source._determine_fields(fields):
             if field in self._projected_units:
@@ -19,6 +19,7 @@ from yt.units._numpy_wrapper_functions import uconcatenate
 from yt.utilities.amr_kdtree.api import AMRKDTree
 from yt.utilities.exceptions import (
     YTCouldNotGenerateField,
+    YTDataSelectorNotImplemented,
     YTException,
     YTFieldNotFound,
     YTFieldTypeNotFound,
@@ -305,7 +306,7 @@ class YTDataContainer(abc.ABC):
             raise YTSpatialFieldUnitError(field)
         units = finfo.units
         try:
-            rv = self.ds.arr(np.zeros(self.ires.size, dtype="float64"), units)
+            rv = self.ds.arr(np.zeros(self.ires.size, dtype=self.ds.field_dtype), units)
             accumulate = False
         except YTNonIndexedDataContainer:
             # In this case, we'll generate many tiny arrays of unknown size and
@@ -320,7 +321,9 @@ class YTDataContainer(abc.ABC):
                 for _chunk in self.chunks([], "spatial", ngz=0, preload_fields=deps):
                     o = self._current_chunk.objs[0]
                     if accumulate:
-                        rv = self.ds.arr(np.empty(o.ires.size, dtype="float64"), units)
+                        rv = self.ds.arr(
+                            np.empty(o.ires.size, dtype=self.ds.field_dtype), units
+                        )
                         outputs.append(rv)
                         ind = 0  # Does this work with mesh?
                     with o._activate_cache():
@@ -336,7 +339,7 @@ class YTDataContainer(abc.ABC):
                     wogz = gz._base_grid
                     if accumulate:
                         rv = self.ds.arr(
-                            np.empty(wogz.ires.size, dtype="float64"), units
+                            np.empty(wogz.ires.size, dtype=self.ds.field_dtype), units
                         )
                         outputs.append(rv)
                     ind += wogz.select(
@@ -550,7 +553,9 @@ class YTDataContainer(abc.ABC):
         fields : list of string or tuple field names, optional
             If this is supplied, it is the list of fields to be saved to
             disk.  If not supplied, all the fields that have been queried
-            will be saved.
+            will be saved.  For three-dimensional selections, the given
+            fields are read and written one io chunk at a time, so that
+            they are never held in memory all at once.
 
         Returns
         -------
@@ -579,17 +584,15 @@ class YTDataContainer(abc.ABC):
         keyword = f"{str(self.ds)}_{self._type_name}"
         filename = get_output_filename(filename, keyword, ".h5")
 
-        data = {}
         if fields is not None:
-            for f in self._determine_fields(fields):
-                data[f] = self[f]
+            data_fields = list(self._determine_fields(fields))
         else:
-            data.update(self.field_data)
+            data_fields = list(self.field_data.keys())
         # get the extra fields needed to reconstruct the container
         tds_fields = tuple(("index", t) for t in self._tds_fields)
-        for f in [f for f in self._container_fields + tds_fields if f not in data]:
-            data[f] = self[f]
-        data_fields = list(data.keys())
+        for f in self._container_fields + tds_fields:
+            if f not in data_fields:
+                data_fields.append(f)
 
         need_grid_positions = False
         need_particle_positions = False
@@ -615,22 +618,24 @@ class YTDataContainer(abc.ABC):
             for ax in self.ds.coordinates.axis_order:
                 for ptype in ptypes:
                     p_field = (ptype, f"particle_position_{ax}")
-                    if p_field in self.ds.field_info and p_field not in data:
-                        data_fields.append(field)
+                    if p_field in self.ds.field_info and p_field not in data_fields:
+                        data_fields.append(p_field)
                         ftypes[p_field] = p_field[0]
-                        data[p_field] = self[p_field]
         if need_grid_positions:
             for ax in self.ds.coordinates.axis_order:
                 g_field = ("index", ax)
-                if g_field in self.ds.field_info and g_field not in data:
+                if g_field in self.ds.field_info and g_field not in data_fields:
                     data_fields.append(g_field)
                     ftypes[g_field] = "grid"
-                    data[g_field] = self[g_field]
                 g_field = ("index", "d" + ax)
-                if g_field in self.ds.field_info and g_field not in data:
+                if g_field in self.ds.field_info and g_field not in data_fields:
                     data_fields.append(g_field)
                     ftypes[g_field] = "grid"
-                    data[g_field] = self[g_field]
+
+        if fields is not None and self._can_chunk_io():
+            data = self._iter_io_chunk_data(data_fields)
+        else:
+            data = {f: self[f] for f in data_fields}
 
         extra_attrs = {
             arg: getattr(self, arg, None) for arg in self._con_args + self._tds_attrs
@@ -645,6 +650,22 @@ class YTDataContainer(abc.ABC):
 
         return filename
 
+    def _can_chunk_io(self):
+        # Only three-dimensional containers that select their data can be
+        # read one io chunk at a time; covering grids, for instance, cannot.
+        if self._dimensionality != 3:
+            return False
+        try:
+            self.selector
+        except YTDataSelectorNotImplemented:
+            return False
+        return True
+
+    def _iter_io_chunk_data(self, fields):
+        # Yields the values of the fields over each io chunk in turn.
+        for chunk in self.chunks(fields, "io"):
+            yield {field: chunk[field] for field in fields}
+
     def to_glue(self, fields, label="yt", data_collection=None):
         """
         Takes specific *fields* in the container and exports them to
@@ -1179,6 +1200,7 @@ class YTDataContainer(abc.ABC):
         deposition="ngp",
         *,
         override_bins=None,
+        quantiles=None,
     ):
         r"""
         Create a 1, 2, or 3D profile object from this data_source.
@@ -1229,6 +1251,10 @@ class YTDataContainer(abc.ABC):
             If set, ignores n_bins and extrema settings and uses the
             supplied bins to profile the field. If a units dict is provided,
             bins are understood to be in the units specified in the dictionary.
+        quantiles : list of floats
+            If set, the (weighted) quantiles of the fields in every bin,
+            between 0 and 1, are also computed.  They can be accessed with
+            profile.quantile(<field_name>, q).
 
         Examples
         --------
@@ -1260,6 +1286,7 @@ class YTDataContainer(abc.ABC):
             fractional,
             deposition,
             override_bins=override_bins,
+            quantiles=quantiles,
         )
         return p
 
@@ -1,3 +1,5 @@
+import copy
+
 import numpy as np
 
 from yt.funcs import camelcase_to_underscore, iter_fields
@@ -28,11 +30,65 @@ def get_position_fields(field, data):
     return position_fields
 
 
+class _PendingQuantity(Exception):
+    # Raised when a quantity evaluated by DerivedQuantityCollection.compute
+    # needs the result of a pass that has not been made yet.
+    pass
+
+
+class _FusedQuantities:
+    """
+    Evaluates several derived quantities of one data source together, with
+    a single pass over its chunks for all of them.
+    """
+
+    def __init__(self, data_source):
+        self.data_source = data_source
+        self.pending = {}
+        self.results = {}
+
+    def get(self, dq, args, kwargs):
+        key = (type(dq).__name__, repr(args), repr(sorted(kwargs.items())))
+        if key in self.results:
+            return self.results[key]
+        # Quantities keep the state set by count_values on themselves, so we
+        # hold on to a copy of it until the pass is made.
+        self.pending.setdefault(key, (copy.copy(dq), args, kwargs))
+        raise _PendingQuantity
+
+    def run(self):
+        requests = list(self.pending.items())
+        self.pending = {}
+        prefetch_fields = []
+        for _, (dq, args, kwargs) in requests:
+            for field in dq.prefetch_fields(*args, **kwargs):
+                if field not in prefetch_fields:
+                    prefetch_fields.append(field)
+        chunks = self.data_source.chunks(
+            [],
+            chunking_style=self.data_source._derived_quantity_chunking,
+            prefetch_fields=prefetch_fields,
+        )
+        storage = {}
+        for sto, ds in parallel_objects(chunks, -1, storage=storage):
+            sto.result = [
+                dq.process_chunk(ds, *args, **kwargs)
+                for _, (dq, args, kwargs) in requests
+            ]
+        for i, (key, (dq, _args, _kwargs)) in enumerate(requests):
+            self.results[key] = dq._reduce_storage(
+                {chunk: values[i] for chunk, values in storage.items()}
+            )
+
+
 class DerivedQuantity(ParallelAnalysisInterface):
     num_vals = -1
 
     def __init__(self, data_source):
         self.data_source = data_source
+        # Set when this quantity is evaluated by
+        # DerivedQuantityCollection.compute, along with others.
+        self._fused = None
 
     def __init_subclass__(cls, *args, **kwargs):
         super().__init_subclass__(*args, **kwargs)
@@ -42,17 +98,28 @@ class DerivedQuantity(ParallelAnalysisInterface):
     def count_values(self, *args, **kwargs):
         return
 
+    def prefetch_fields(self, *args, **kwargs):
+        # The fields accessed by process_chunk, which are read ahead of time
+        return []
+
     def __call__(self, *args, **kwargs):
         """Calculate results for the derived quantity"""
         # create the index if it doesn't exist yet
         self.data_source.ds.index
         self.count_values(*args, **kwargs)
+        if self._fused is not None:
+            return self._fused.get(self, args, kwargs)
         chunks = self.data_source.chunks(
-            [], chunking_style=self.data_source._derived_quantity_chunking
+            [],
+            chunking_style=self.data_source._derived_quantity_chunking,
+            prefetch_fields=self.prefetch_fields(*args, **kwargs),
         )
         storage = {}
         for sto, ds in parallel_objects(chunks, -1, storage=storage):
             sto.result = self.process_chunk(ds, *args, **kwargs)
+        return self._reduce_storage(storage)
+
+    def _reduce_storage(self, storage):
         # Now storage will have everything, and will be done via pickling, so
         # the units will be preserved.  (Credit to Nathan for this
         # idea/implementation.)
@@ -90,6 +157,62 @@ class DerivedQuantityCollection:
     def keys(self):
         return derived_quantity_registry.keys()
 
+    def compute(self, quantities):
+        r"""
+        Calculates several derived quantities with a single pass over the
+        data, rather than one pass for each of them.
+
+        Parameters
+        ----------
+        quantities : list
+            The quantities to calculate.  Each one is either the name of a
+            quantity, as a string, or a tuple of the name, a sequence of
+            positional arguments and, optionally, a dict of keyword arguments.
+
+        Returns
+        -------
+        A list of the values of the quantities, in the order they were given.
+
+        Examples
+        --------
+
+        >>> ds = load("IsolatedGalaxy/galaxy0030/galaxy0030")
+        >>> sp = ds.sphere("max", (10, "kpc"))
+        >>> mass, com, ext = sp.quantities.compute(
+        ...     [
+        ...         "total_mass",
+        ...         ("center_of_mass", (), {"use_particles": True}),
+        ...         ("extrema", ([("gas", "density"), ("gas", "temperature")],)),
+        ...     ]
+        ... )
+
+        """
+        names = {camelcase_to_underscore(k): k for k in self.keys()}
+        requests = []
+        for quantity in quantities:
+            if isinstance(quantity, str):
+                quantity = (quantity,)
+            name, args, kwargs = (tuple(quantity) + ((), {}))[:3]
+            requests.append((names.get(name, name), tuple(args), dict(kwargs)))
+        self.data_source.ds.index
+        fused = _FusedQuantities(self.data_source)
+        results = {}
+        # Quantities that need several passes (such as those built on others)
+        # take one round each; all quantities share the pass of every round.
+        while len(results) < len(requests):
+            for i, (name, args, kwargs) in enumerate(requests):
+                if i in results:
+                    continue
+                dq = self[name]
+                dq._fused = fused
+                try:
+                    results[i] = dq(*args, **kwargs)
+                except _PendingQuantity:
+                    pass
+            if fused.pending:
+                fused.run()
+        return [results[i] for i in range(len(requests))]
+
 
 class WeightedAverageQuantity(DerivedQuantity):
     r"""
@@ -127,6 +250,9 @@ class WeightedAverageQuantity(DerivedQuantity):
         # This is a list now
         self.num_vals = len(fields) + 1
 
+    def prefetch_fields(self, fields, weight):
+        return fields + [weight]
+
     def __call__(self, fields, weight):
         fields = list(iter_fields(fields))
         rv = super().__call__(fields, weight)
@@ -166,6 +292,9 @@ class TotalQuantity(DerivedQuantity):
         # This is a list now
         self.num_vals = len(fields)
 
+    def prefetch_fields(self, fields):
+        return fields
+
     def __call__(self, fields):
         fields = list(iter_fields(fields))
         rv = super().__call__(fields)
@@ -199,14 +328,17 @@ class TotalMass(TotalQuantity):
     def __call__(self):
         self.data_source.ds.index
         fi = self.data_source.ds.field_info
-        if ("gas", "mass") in fi:
-            gas = super().__call__([("gas", "mass")])
-        else:
-            gas = self.data_source.ds.quan(0.0, "g")
-        if ("nbody", "particle_mass") in fi:
-            part = super().__call__([("nbody", "particle_mass")])
-        else:
-            part = self.data_source.ds.quan(0.0, "g")
+        fields = [f for f in (("gas", "mass"), ("nbody", "particle_mass")) if f in fi]
+        masses = {}
+        # Both masses are summed in the same pass
+        if fields:
+            rv = super().__call__(fields)
+            if len(fields) == 1:
+                rv = [rv]
+            masses = dict(zip(fields, rv, strict=True))
+        zero = self.data_source.ds.quan(0.0, "g")
+        gas = masses.get(("gas", "mass"), zero)
+        part = masses.get(("nbody", "particle_mass"), zero)
         return self.data_source.ds.arr([gas, part])
 
 
@@ -255,6 +387,15 @@ class CenterOfMass(DerivedQuantity):
         if self.use_particles:
             self.num_vals += 4
 
+    def prefetch_fields(self, use_gas=True, use_particles=False, particle_type="nbody"):
+        fields = []
+        if self.use_gas:
+            fields += [("gas", ax) for ax in "xyz"] + [("gas", "mass")]
+        if self.use_particles:
+            fields += [(particle_type, f"particle_position_{ax}") for ax in "xyz"]
+            fields.append((particle_type, "particle_mass"))
+        return fields
+
     def process_chunk(
         self, data, use_gas=True, use_particles=False, particle_type="nbody"
     ):
@@ -334,6 +475,16 @@ class BulkVelocity(DerivedQuantity):
         if use_particles and "nbody" in self.data_source.ds.particle_types:
             self.num_vals += 4
 
+    def prefetch_fields(self, use_gas=True, use_particles=False, particle_type="nbody"):
+        fields = []
+        if use_gas:
+            fields += [("gas", f"velocity_{ax}") for ax in "xyz"]
+            fields.append(("gas", "mass"))
+        if use_particles and "nbody" in self.data_source.ds.particle_types:
+            fields += [(particle_type, f"particle_velocity_{ax}") for ax in "xyz"]
+            fields.append((particle_type, "particle_mass"))
+        return fields
+
     def process_chunk(
         self, data, use_gas=True, use_particles=False, particle_type="nbody"
     ):
@@ -411,6 +562,9 @@ class WeightedStandardDeviation(DerivedQuantity):
         # This is a list now
         self.num_vals = 2 * len(fields) + 1
 
+    def prefetch_fields(self, fields, weight):
+        return fields + [weight]
+
     def __call__(self, fields, weight):
         fields = list(iter_fields(fields))
         units = [self.data_source.ds._get_field_info(field).units for field in fields]
@@ -516,6 +670,19 @@ class AngularMomentumVector(DerivedQuantity):
             num_vals += 4
         self.num_vals = num_vals
 
+    def prefetch_fields(self, use_gas=True, use_particles=True, particle_type="all"):
+        fields = []
+        if self.use_gas:
+            fields += [("gas", f"specific_angular_momentum_{axis}") for axis in "xyz"]
+            fields.append(("gas", "mass"))
+        if self.use_particles:
+            fields += [
+                (self.particle_type, f"particle_specific_angular_momentum_{axis}")
+                for axis in "xyz"
+            ]
+            fields.append((self.particle_type, "particle_mass"))
+        return fields
+
     def process_chunk(
         self, data, use_gas=True, use_particles=False, particle_type="all"
     ):
@@ -594,6 +761,9 @@ class Extrema(DerivedQuantity):
     def count_values(self, fields, non_zero, *, check_finite=False):
         self.num_vals = len(fields) * 2
 
+    def prefetch_fields(self, fields, non_zero, *, check_finite=False):
+        return fields
+
     def __call__(self, fields, non_zero=False, *, check_finite=False):
         fields = list(iter_fields(fields))
         rv = super().__call__(fields, non_zero, check_finite=check_finite)
@@ -654,6 +824,9 @@ class SampleAtMaxFieldValues(DerivedQuantity):
         # field itself, then index, then the number of sample fields
         self.num_vals = 1 + len(sample_fields)
 
+    def prefetch_fields(self, field, sample_fields):
+        return [field] + list(sample_fields)
+
     def __call__(self, field, sample_fields):
         rv = super().__call__(field, sample_fields)
         if len(rv) == 1:
@@ -698,6 +871,16 @@ class MaxLocation(SampleAtMaxFieldValues):
 
     """
 
+    def count_values(self, field, sample_fields=None):
+        if sample_fields is None:
+            sample_fields = get_position_fields(field, self.data_source)
+        super().count_values(field, sample_fields)
+
+    def prefetch_fields(self, field, sample_fields=None):
+        if sample_fields is None:
+            sample_fields = get_position_fields(field, self.data_source)
+        return super().prefetch_fields(field, sample_fields)
+
     def __call__(self, field):
         # Make sure we have an index
         self.data_source.index
@@ -754,6 +937,16 @@ class MinLocation(SampleAtMinFieldValues):
 
     """
 
+    def count_values(self, field, sample_fields=None):
+        if sample_fields is None:
+            sample_fields = get_position_fields(field, self.data_source)
+        super().count_values(field, sample_fields)
+
+    def prefetch_fields(self, field, sample_fields=None):
+        if sample_fields is None:
+            sample_fields = get_position_fields(field, self.data_source)
+        return super().prefetch_fields(field, sample_fields)
+
     def __call__(self, field):
         # Make sure we have an index
         self.data_source.index
@@ -805,6 +998,24 @@ class SpinParameter(DerivedQuantity):
     def count_values(self, **kwargs):
         self.num_vals = 3
 
+    def prefetch_fields(self, use_gas=True, use_particles=True, particle_type="nbody"):
+        finfo = self.data_source.ds.field_info
+        fields = []
+        if use_gas and ("gas", "mass") in finfo:
+            fields += [
+                ("gas", "kinetic_energy_density"),
+                ("gas", "volume"),
+                ("gas", "angular_momentum_magnitude"),
+                ("gas", "mass"),
+            ]
+        if use_particles and (particle_type, "particle_mass") in finfo:
+            fields += [
+                (particle_type, "particle_velocity_magnitude"),
+                (particle_type, "particle_mass"),
+                (particle_type, "particle_angular_momentum_magnitude"),
+            ]
+        return fields
+
     def process_chunk(
         self, data, use_gas=True, use_particles=True, particle_type="nbody"
     ):
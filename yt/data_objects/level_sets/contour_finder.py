@@ -7,9 +7,35 @@ from yt.utilities.lib.contour_finding import (
     ContourTree,
     TileContourTree,
     link_node_contours,
-    update_joins,
 )
 from yt.utilities.lib.partitioned_grid import PartitionedGrid
+from yt.utilities.parallel_tools.parallel_analysis_interface import parallel_objects
+
+
+def _label_tile(data_source, field, gct, mask, tile):
+    # Identifies the contours within a single tile, numbered from 1.
+    g, _node, (sl, dims, _gi) = tile
+    g.field_parameters.update(data_source.field_parameters)
+    values = g[field][sl].astype("float64")
+    contour_ids = np.zeros(dims, "int64") - 1
+    ncontours = gct.identify_contours(values, contour_ids, mask, 0)
+    return contour_ids, ncontours
+
+
+def _get_final_ids(joins, final_joins, total_contours):
+    # Maps every contour id to the one its contour is joined to, and then to
+    # its index (from 1) among the final joins, so that the contour ids of
+    # all tiles are relabeled with a single lookup.
+    final_ids = np.arange(total_contours + 1, dtype="int64")
+    if final_joins.size == 0:
+        # No cell is within the contour bounds, so there is nothing to relabel
+        return final_ids
+    final_ids[joins[:, 0]] = joins[:, 1]
+    ind = np.searchsorted(final_joins, final_ids)
+    ind[ind == final_joins.size] = 0
+    found = final_joins[ind] == final_ids
+    final_ids[found] = ind[found] + 1
+    return final_ids
 
 
 def identify_contours(data_source, field, min_val, max_val, cached_fields=None):
@@ -20,17 +46,24 @@ def identify_contours(data_source, field, min_val, max_val, cached_fields=None):
     node_ids = []
     DLE = data_source.ds.domain_left_edge
     masks = {g.id: m for g, m in data_source.blocks}
-    for g, node, (sl, dims, gi) in data_source.tiles.slice_traverse():
-        g.field_parameters.update(data_source.field_parameters)
+    tiles = list(data_source.tiles.slice_traverse())
+    # Contours are identified within each tile independently, so tiles are
+    # distributed among the available processors.  They are numbered from 1
+    # in each tile, and offset below so that they are unique.
+    storage = {}
+    for sto, (i, tile) in parallel_objects(enumerate(tiles), storage=storage):
+        g, _node, (sl, _dims, _gi) = tile
+        mask = masks[g.id][sl].astype("uint8")
+        sto.result_id = i
+        sto.result = _label_tile(data_source, field, gct, mask, tile)
+    for i, (g, node, (sl, dims, gi)) in enumerate(tiles):
         node.node_ind = len(node_ids)
         nid = node.node_id
         node_ids.append(nid)
-        values = g[field][sl].astype("float64")
-        contour_ids = np.zeros(dims, "int64") - 1
+        contour_ids, ncontours = storage.pop(i)
+        contour_ids[contour_ids != -1] += total_contours
+        total_contours += ncontours
         mask = masks[g.id][sl].astype("uint8")
-        total_contours += gct.identify_contours(
-            values, contour_ids, mask, total_contours
-        )
         new_contours = tree.cull_candidates(contour_ids)
         tree.add_contours(new_contours)
         # Now we can create a partitioned grid with the contours.
@@ -53,10 +86,12 @@ def identify_contours(data_source, field, min_val, max_val, cached_fields=None):
     contour_ids = defaultdict(list)
     pbar = get_pbar("Updating joins ... ", len(contours))
     final_joins = np.unique(joins[:, 1])
+    final_ids = _get_final_ids(joins, final_joins, total_contours)
     for i, nid in enumerate(sorted(contours)):
         level, node_ind, pg, sl = contours[nid]
         ff = pg.my_data[0].view("int64")
-        update_joins(joins, ff, final_joins)
+        in_contour = ff != -1
+        ff[in_contour] = final_ids[ff[in_contour]]
         contour_ids[pg.parent_grid_id].append((sl, ff))
         pbar.update(i + 1)
     pbar.finish()
@@ -7,6 +7,7 @@ from numpy.testing import assert_array_equal, assert_equal
 
 from yt.data_objects.level_sets.api import Clump, add_clump_info, find_clumps
 from yt.data_objects.level_sets.clump_info_items import clump_info_registry
+from yt.data_objects.level_sets.contour_finder import identify_contours
 from yt.fields.derived_field import ValidateParameter
 from yt.loaders import load, load_uniform_grid
 from yt.testing import requires_file, requires_module
@@ -193,3 +194,47 @@ def test_clump_field_parameters():
 
     for c1, c2 in zip(leaf_clumps_1, leaf_clumps_2, strict=True):
         assert_array_equal(c1["gas", "density"], c2["gas", "density"])
+
+
+def test_identify_contours_across_grids():
+    n_c = 16
+    dims = (n_c, n_c, n_c)
+    density = np.ones(dims)
+    # one blob straddling all of the grids, and one within a single grid
+    density[6:10, 6:10, 6:10] = 10.0
+    density[1, 1, 1] = 10.0
+    ds = load_uniform_grid({"density": density}, dims, nprocs=8)
+    ad = ds.all_data()
+
+    n_contours, contours = identify_contours(ad, ("gas", "density"), 5.0, 20.0)
+    assert_equal(n_contours, 2)
+    labels = []
+    for cids in contours.values():
+        grid_labels = set()
+        for _sl, ff in cids:
+            grid_labels.update(np.unique(ff[ff != -1]))
+        labels.append(grid_labels)
+    assert_equal(len(labels), 8)
+    # the straddling blob carries the same label in every grid
+    assert_equal(set.union(*labels), {1, 2})
+    assert_equal(len(set.intersection(*labels)), 1)
+
+
+def test_identify_contours_above_maximum():
+    n_c = 16
+    dims = (n_c, n_c, n_c)
+    density = np.ones(dims)
+    density[6:10, 6:10, 6:10] = 10.0
+    ds = load_uniform_grid({"density": density}, dims, nprocs=8)
+    ad = ds.all_data()
+
+    # no cell is within the bounds, as for the leaves of a clump tree
+    n_contours, contours = identify_contours(ad, ("gas", "density"), 20.0, 40.0)
+    assert_equal(n_contours, 0)
+    for cids in contours.values():
+        for _sl, ff in cids:
+            assert (ff == -1).all()
+
+    master_clump = Clump(ad, ("gas", "density"))
+    master_clump.find_children(20.0)
+    assert_equal(master_clump.children, [])
@@ -32,6 +32,15 @@ class ParticleTrajectories:
     ptype : str, optional
         Only use this particle type. Default: None, which uses all particle type.
 
+    Notes
+    -----
+    For particle datasets split over several files, the data files holding
+    each particle are looked up in an index of the particle ids, so that only
+    the files holding the tracked particles are read.  This index is built
+    the first time trajectories are extracted from a dataset, and cached
+    next to its bitmap index, in a file suffixed with
+    ``.<ptype>.particle_index.npz``.
+
     Examples
     --------
     >>> my_fns = glob.glob("orbit_hdf5_chk_00[0-9][0-9]")
@@ -89,6 +98,7 @@ class ParticleTrajectories:
             "particle_position_z",
         ):
             fds[field] = dd_first._determine_fields((self.ptype, field))[0]
+        self._index_field = fds["particle_index"]
 
         # Note: we explicitly pass dynamic=False to prevent any change in piter from
         # breaking the assumption that the same processors load the same datasets
@@ -97,7 +107,7 @@ class ParticleTrajectories:
         for i, (sto, ds) in enumerate(
             self.data_series.piter(storage=my_storage, dynamic=False)
         ):
-            dd = ds.all_data()
+            dd = self._get_data_object(ds)
             newtags = dd[fds["particle_index"]].d.astype("int64")
             mask = np.isin(newtags, indices, assume_unique=True)
             sort = np.argsort(newtags[mask])
@@ -146,6 +156,15 @@ class ParticleTrajectories:
         # Instantiate fields the caller requested
         self._get_data(fields)
 
+    def _get_data_object(self, ds):
+        # The data object the particles are read from.  Particle datasets
+        # split over several files only read the files holding the tracked
+        # particles, as found in their particle id index.
+        dd = ds.all_data()
+        if hasattr(ds.index, "_select_particle_ids"):
+            ds.index._select_particle_ids(dd, self._index_field, self.indices)
+        return dd
+
     def has_key(self, key):
         return key in self.field_data
 
@@ -259,7 +278,7 @@ class ParticleTrajectories:
             pfield = {}
 
             if new_particle_fields:  # there's at least one particle field
-                dd = ds.all_data()
+                dd = self._get_data_object(ds)
                 for field in new_particle_fields:
                     # This is easy... just get the particle fields
                     pfield[field] = dd[fds[field]].d[mask][sort]
@@ -333,8 +352,9 @@ class ParticleTrajectories:
         ... )
         >>> plt.savefig("orbit")
         """
-        mask = np.isin(self.indices, (index,), assume_unique=True)
-        if not np.any(mask):
+        # indices are sorted, so the trajectory is found by bisection
+        i = np.searchsorted(self.indices, index)
+        if i == self.num_indices or self.indices[i] != index:
             print(f"The particle index {index} is not in the list!")
             raise IndexError
         fields = sorted(self.field_data.keys())
@@ -342,7 +362,7 @@ class ParticleTrajectories:
         traj[self.ptype, "particle_time"] = self.times
         traj[self.ptype, "particle_index"] = index
         for field in fields:
-            traj[field] = self[field][mask, :][0]
+            traj[field] = self[field][i, :]
         return traj
 
     @parallel_root_only
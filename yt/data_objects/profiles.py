@@ -59,6 +59,31 @@ def preserve_source_parameters(func):
     return save_state
 
 
+def _histogram_quantiles(hist, edges, log, quantiles):
+    # Interpolates the quantiles of the distributions given by the rows of
+    # hist, within the histogram bin each of them falls in.
+    if log:
+        edges = np.log10(edges)
+    cdf = np.cumsum(hist, axis=-1)
+    total = cdf[:, -1]
+    rows = np.arange(hist.shape[0])
+    values = np.zeros((hist.shape[0], quantiles.size), dtype="float64")
+    for j, q in enumerate(quantiles):
+        target = q * total
+        ind = (cdf < target[:, None]).sum(axis=-1)
+        np.clip(ind, 0, hist.shape[1] - 1, out=ind)
+        below = np.where(ind > 0, cdf[rows, ind - 1], 0.0)
+        in_bin = hist[rows, ind]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            frac = np.where(in_bin > 0, (target - below) / in_bin, 0.5)
+        np.clip(frac, 0.0, 1.0, out=frac)
+        values[:, j] = edges[ind] + frac * (edges[ind + 1] - edges[ind])
+    if log:
+        values = 10**values
+    values[total == 0] = 0.0
+    return values
+
+
 class ProfileFieldAccumulator:
     def __init__(self, n_fields, size):
         shape = size + (n_fields,)
@@ -100,11 +125,142 @@ class ProfileND(ParallelAnalysisInterface):
         for f in fields:
             self.field_info[f] = self.data_source.ds.field_info[f]
         temp_storage = ProfileFieldAccumulator(len(fields), self.size)
-        citer = self.data_source.chunks([], "io")
+        prefetch_fields = fields + list(self.bin_fields)
+        if self.weight_field is not None:
+            prefetch_fields.append(self.weight_field)
+        citer = self.data_source.chunks([], "io", prefetch_fields=prefetch_fields)
         for chunk in parallel_objects(citer):
             self._bin_chunk(chunk, fields, temp_storage)
         self._finalize_storage(fields, temp_storage)
 
+    def add_quantiles(
+        self, fields, quantiles=(0.05, 0.5, 0.95), n_bins=1024, extrema=None, logs=None
+    ):
+        r"""Add weighted quantiles of fields to the profile
+
+        The values of each field are accumulated, chunk by chunk, in a
+        histogram of *n_bins* bins for every bin of the profile, from which
+        the quantiles are interpolated.  Memory use therefore does not depend
+        on the size of the data source, and the quantiles are accurate to
+        about the width of a histogram bin.  Values are weighted by the
+        weight field of the profile, if any.
+
+        Parameters
+        ----------
+        fields : list of field names
+            The fields to compute quantiles of.
+        quantiles : list of floats
+            The quantiles to compute, between 0 and 1.
+            Default: (0.05, 0.5, 0.95).
+        n_bins : int
+            The number of histogram bins the values of each field are
+            accumulated in.  Default: 1024.
+        extrema : dict of min, max tuples
+            The range of the histogram of each field, keyed by field name.
+            Values outside of it are counted in the first or last histogram
+            bin.  Defaults to the extrema of the field in the data source.
+        logs : dict of boolean values
+            Whether the histogram bins of each field are spaced
+            logarithmically, keyed by field name.  Defaults to the take_log
+            attribute of the field.
+
+        Examples
+        --------
+
+        >>> ds = load("IsolatedGalaxy/galaxy0030/galaxy0030")
+        >>> sp = ds.sphere("max", (20, "kpc"))
+        >>> prof = create_profile(
+        ...     sp, ("index", "radius"), [("gas", "temperature")], n_bins=32
+        ... )
+        >>> prof.add_quantiles([("gas", "temperature")], quantiles=[0.05, 0.5, 0.95])
+        >>> median = prof.quantile(("gas", "temperature"), 0.5)
+
+        """
+        fields = self.data_source._determine_fields(fields)
+        quantiles = np.asarray(quantiles, dtype="float64")
+        if np.any(quantiles < 0) or np.any(quantiles > 1):
+            raise ValueError("Quantiles must be between 0 and 1.")
+        extrema = sanitize_field_tuple_keys(extrema, self.data_source) or {}
+        logs = sanitize_field_tuple_keys(logs, self.data_source) or {}
+        missing = [f for f in fields if f not in extrema]
+        if missing:
+            ex = self.data_source.quantities.extrema(missing)
+            if len(missing) == 1:
+                ex = [ex]
+            extrema.update(zip(missing, ex, strict=True))
+        edges = []
+        for field in fields:
+            finfo = self.data_source.ds.field_info[field]
+            self.field_info[field] = finfo
+            mi, ma = extrema[field]
+            mi, ma = _sanitize_min_max_units(mi, ma, finfo, self.ds.unit_registry)
+            log = logs.get(field, finfo.take_log) and mi > 0
+            edges.append((self._get_bins(mi.d, ma.d, n_bins, log), log))
+
+        nprof = int(np.prod(self.size))
+        hist = np.zeros((len(fields), nprof * n_bins), dtype="float64")
+        prefetch_fields = fields + list(self.bin_fields)
+        if self.weight_field is not None:
+            prefetch_fields.append(self.weight_field)
+        citer = self.data_source.chunks([], "io", prefetch_fields=prefetch_fields)
+        for chunk in parallel_objects(citer):
+            rv = self._get_data(chunk, fields)
+            if rv is None:
+                continue
+            fdata, wdata, bin_fields = rv
+            bin_ind = self._get_bin_indices(bin_fields) * n_bins
+            for i, (field_edges, _log) in enumerate(edges):
+                hind = np.digitize(fdata[:, i], field_edges) - 1
+                np.clip(hind, 0, n_bins - 1, out=hind)
+                hist[i] += np.bincount(
+                    bin_ind + hind, weights=wdata, minlength=hist.shape[1]
+                )
+        # Histograms simply add up across processors
+        hist = self.comm.mpi_allreduce(hist, op="sum")
+
+        if getattr(self, "quantiles", None) is None:
+            self.quantiles = YTFieldData()
+            # The quantiles computed for each field, along the last axis of
+            # its entry in self.quantiles
+            self.quantile_values = {}
+        for i, field in enumerate(fields):
+            field_edges, log = edges[i]
+            values = _histogram_quantiles(
+                hist[i].reshape(nprof, n_bins), field_edges, log, quantiles
+            )
+            self.quantiles[field] = array_like_field(
+                self.data_source, values.reshape(self.size + (quantiles.size,)), field
+            )
+            self.quantile_values[field] = quantiles
+            if field not in self.field_units:
+                self.field_units[field] = self.quantiles[field].units
+            if isinstance(field, tuple):
+                self.field_map[field[1]] = field
+            else:
+                self.field_map[field] = field
+
+    def quantile(self, field, q):
+        """Returns the *q* quantile of *field* in each bin of the profile
+
+        The quantile must have been computed with add_quantiles.  Bins with
+        no data are set to zero.
+        """
+        field = self.field_map.get(field[1] if isinstance(field, tuple) else field)
+        if field is None or field not in getattr(self, "quantiles", {}):
+            raise KeyError(f"No quantiles have been computed for {field}.")
+        (ind,) = np.nonzero(np.isclose(self.quantile_values[field], q))
+        if ind.size == 0:
+            raise KeyError(f"The {q} quantile has not been computed.")
+        return self.quantiles[field][..., ind[0]].in_units(self.field_units[field])
+
+    def _get_bin_indices(self, bin_fields):
+        # Flattened indices of the profile bins the (filtered) data fall in
+        inds = []
+        for field, data, ax in zip(self.bin_fields, bin_fields, "xyz", strict=False):
+            data.convert_to_units(self.field_info[field].output_units)
+            inds.append(np.digitize(data, getattr(self, f"{ax}_bins")) - 1)
+        return np.ravel_multi_index(inds, self.size)
+
     def set_field_unit(self, field, new_unit):
         """Sets a new unit for the requested field
 
@@ -934,6 +1090,16 @@ class ParticleProfile(Profile2D):
             weight_field=weight_field,
         )
 
+    def add_quantiles(self, fields, *args, **kwargs):
+        # With ngp deposition, each particle falls in a single bin like the
+        # values of any other profile.
+        if self.deposition == "cic":
+            raise ValueError(
+                "Quantiles are not supported with cic deposition, as particles "
+                "are deposited in several bins."
+            )
+        super().add_quantiles(fields, *args, **kwargs)
+
     # Either stick the particle field in the nearest bin,
     # or spread it out using the 2D CIC deposition function
     def _bin_chunk(self, chunk, fields, storage):
@@ -1215,6 +1381,7 @@ def create_profile(
     fractional=False,
     deposition="ngp",
     override_bins=None,
+    quantiles=None,
 ):
     r"""
     Create a 1, 2, or 3D profile object.
@@ -1268,6 +1435,12 @@ def create_profile(
         If set, ignores n_bins and extrema settings and uses the
         supplied bins to profile the field. If a units dict is provided,
         bins are understood to be in the units specified in the dictionary.
+    quantiles : list of floats
+        If set, the (weighted) quantiles of the fields in every bin, between 0
+        and 1, are also computed in a bounded amount of memory.  They can be
+        accessed with profile.quantile(<field_name>, q).  See
+        :meth:`~yt.data_objects.profiles.ProfileND.add_quantiles`.  They
+        are not supported with 'cic' deposition.
 
 
     Examples
@@ -1344,6 +1517,8 @@ def create_profile(
                     "The accumulation and fractional keyword arguments must be "
                     "False for CIC deposition"
                 )
+            if quantiles is not None:
+                raise ValueError("Quantiles are not supported with CIC deposition")
         cls = ParticleProfile
     elif len(bin_fields) == 2:
         cls = Profile2D
@@ -1475,6 +1650,8 @@ def create_profile(
     obj.fractional = fractional
     if fields is not None:
         obj.add_fields(list(fields))
+        if quantiles is not None:
+            obj.add_quantiles(list(fields), quantiles)
     for field in fields:
         if fractional:
             obj.field_data[field] /= obj.field_data[field].sum()
@@ -98,7 +98,9 @@ class YTCutRegion(YTSelectionContainer3D):
 
     def chunks(self, fields, chunking_style, **kwargs):
         # We actually want to chunk the sub-chunk, not ourselves.  We have no
-        # chunks to speak of, as we do not data IO.
+        # chunks to speak of, as we do not data IO.  For the same reason, the
+        # fields read for each chunk are not prefetched.
+        kwargs.pop("prefetch_fields", None)
         for chunk in self.index._chunk(self.base_object, chunking_style, **kwargs):
             with self.base_object._chunked_read(chunk):
                 with self._chunked_read(chunk):
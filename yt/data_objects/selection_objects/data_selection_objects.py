@@ -29,6 +29,7 @@ from yt.utilities.exceptions import (
     YTFieldUnitError,
     YTFieldUnitParseError,
 )
+from yt.utilities.field_cache import get_field_cache
 from yt.utilities.lib.marching_cubes import march_cubes_grid, march_cubes_grid_flux
 from yt.utilities.logger import ytLogger as mylog
 from yt.utilities.parallel_tools.parallel_analysis_interface import (
@@ -100,7 +101,20 @@ class YTSelectionContainer(YTDataContainer, ParallelAnalysisInterface, abc.ABC):
         chunk_ind = kwargs.pop("chunk_ind", None)
         if chunk_ind is not None:
             chunk_ind = list(always_iterable(chunk_ind))
-        for ci, chunk in enumerate(self.index._chunk(self, chunking_style, **kwargs)):
+        # prefetch_fields can be supplied for the fields that will be accessed
+        # on each chunk, if they are not the ones we read up front.
+        prefetch_fields = kwargs.pop("prefetch_fields", None)
+        if prefetch_fields is None:
+            prefetch_fields = fields
+        if kwargs.get("chunk_sizing") == "memory" and "nfields" not in kwargs:
+            # Chunks are sized from the number of on-disk fields read for them
+            fluids, particles = self.index._get_prefetch_fields(self, prefetch_fields)
+            kwargs["nfields"] = len(fluids) + len(particles) or len(prefetch_fields)
+        chunks = self.index._chunk(self, chunking_style, **kwargs)
+        if chunking_style == "io" and chunk_ind is None and len(prefetch_fields) > 0:
+            # Read the fields of upcoming chunks while this one is processed
+            chunks = self.index._prefetch_chunks(self, chunks, prefetch_fields)
+        for ci, chunk in enumerate(chunks):
             if chunk_ind is not None and ci not in chunk_ind:
                 continue
             with self._chunked_read(chunk):
@@ -184,6 +198,24 @@ class YTSelectionContainer(YTDataContainer, ParallelAnalysisInterface, abc.ABC):
             return
         elif self._locked:
             raise GenerationInProgress(fields)
+        field_cache = get_field_cache()
+        cache_keys = {}
+        if field_cache is not None:
+            for field in fields_to_get + fields_to_generate:
+                key = field_cache.entry_key(self, field)
+                if key is None:
+                    continue
+                cached = field_cache.load(key)
+                if cached is None:
+                    cache_keys[field] = key
+                else:
+                    self.field_data[field] = self.ds.arr(*cached)
+            fields_to_get = [f for f in fields_to_get if f not in self.field_data]
+            fields_to_generate = [
+                f for f in fields_to_generate if f not in self.field_data
+            ]
+            if len(fields_to_get) == 0 and len(fields_to_generate) == 0:
+                return
         # Track which ones we want in the end
         ofields = set(list(self.field_data.keys()) + fields_to_get + fields_to_generate)
         # At this point, we want to figure out *all* our dependencies.
@@ -221,6 +253,9 @@ class YTSelectionContainer(YTDataContainer, ParallelAnalysisInterface, abc.ABC):
         for field in list(self.field_data.keys()):
             if field not in ofields:
                 self.field_data.pop(field)
+        for field, key in cache_keys.items():
+            if field in self.field_data:
+                field_cache.store(key, self.field_data[field])
 
     def _get_bbox(self):
         """
@@ -330,6 +365,18 @@ class YTSelectionContainer(YTDataContainer, ParallelAnalysisInterface, abc.ABC):
                         raise YTFieldUnitError(fi, fd.units) from e
                     except UnitParseError as e:
                         raise YTFieldUnitParseError(fi) from e
+                    if (
+                        self.ds.field_dtype == np.float32
+                        and fd.dtype == np.float64
+                        and fi.sampling_type in ("cell", "local")
+                        and field[0] != "index"
+                    ):
+                        # Derived fields are stored in the precision of the
+                        # dataset, even if they were computed in double
+                        # precision, e.g. after a multiplication by a
+                        # float64 scalar.  Index fields (positions, widths,
+                        # ...) are kept in double precision.
+                        fd = fd.astype(np.float32)
                     self.field_data[field] = fd
                 except GenerationInProgress as gip:
                     for f in gip.fields:
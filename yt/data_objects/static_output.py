@@ -10,6 +10,8 @@ import warnings
 import weakref
 from collections import defaultdict
 from collections.abc import MutableMapping
+from contextlib import contextmanager
+from contextvars import ContextVar
 from functools import cached_property
 from importlib.util import find_spec
 from stat import ST_CTIME
@@ -90,6 +92,26 @@ else:
 
 _cached_datasets: MutableMapping[int | str, "Dataset"] = weakref.WeakValueDictionary()
 
+# The field precision requested for the datasets being instantiated, which is
+# part of the key they are cached with.
+_requested_field_dtype: ContextVar[np.dtype | None] = ContextVar(
+    "_requested_field_dtype", default=None
+)
+
+
+@contextmanager
+def requested_field_dtype(field_dtype):
+    """
+    Datasets instantiated within this context have the given field
+    precision, and are cached separately from those of other precisions.
+    """
+    token = _requested_field_dtype.set(field_dtype)
+    try:
+        yield
+    finally:
+        _requested_field_dtype.reset(token)
+
+
 # we set this global to None as a place holder
 # its actual instantiation is delayed until after yt.__init__
 # is completed because we need yt.config.ytcfg to be instantiated first
@@ -175,6 +197,9 @@ class Dataset(abc.ABC):
     # _instantiated represents an instantiation time (since Epoch)
     # the default is a place holder sentinel, falsy value
     _instantiated: float = 0
+    # The floating point precision fields are read and generated in; see
+    # yt.load's field_dtype argument
+    field_dtype = np.dtype("float64")
     _particle_type_counts = None
     _proj_type = "quad_proj"
     _ionization_label_format = "roman_numeral"
@@ -196,8 +221,12 @@ class Dataset(abc.ABC):
     domain_center = MutableAttribute(True)
 
     def __new__(cls, filename=None, *args, **kwargs):
+        field_dtype = _requested_field_dtype.get()
+        if field_dtype is None:
+            field_dtype = cls.field_dtype
         if not isinstance(filename, str):
             obj = object.__new__(cls)
+            obj.field_dtype = field_dtype
             # The Stream frontend uses a StreamHandler object to pass metadata
             # to __init__.
             is_stream = hasattr(filename, "get_fields") and hasattr(
@@ -207,7 +236,7 @@ class Dataset(abc.ABC):
                 obj.__init__(filename, *args, **kwargs)
             return obj
         apath = os.path.abspath(os.path.expanduser(filename))
-        cache_key = (apath, pickle.dumps(args), pickle.dumps(kwargs))
+        cache_key = (apath, pickle.dumps(args), pickle.dumps(kwargs), field_dtype.str)
         if ytcfg.get("yt", "skip_dataset_cache"):
             obj = object.__new__(cls)
         elif cache_key not in _cached_datasets:
@@ -215,7 +244,8 @@ class Dataset(abc.ABC):
             if not obj._skip_cache:
                 _cached_datasets[cache_key] = obj
         else:
-            obj = _cached_datasets[cache_key]
+            return _cached_datasets[cache_key]
+        obj.field_dtype = field_dtype
         return obj
 
     def __init_subclass__(cls, *args, **kwargs):
@@ -1,6 +1,12 @@
 from numpy.testing import assert_equal
 
-from yt.testing import fake_random_ds
+from yt.config import ytcfg
+from yt.testing import (
+    fake_hexahedral_ds,
+    fake_octree_ds,
+    fake_particle_ds,
+    fake_random_ds,
+)
 from yt.units._numpy_wrapper_functions import uconcatenate
 
 
@@ -42,6 +48,39 @@ def test_chunking():
             assert_equal(coords["i"]["io"], coords["i"]["spatial"])
 
 
+def test_memory_chunking():
+    old_value = ytcfg["yt", "chunk_bytes"]
+    try:
+        ds = fake_random_ds(32, nprocs=8)
+        field = ("gas", "density")
+        # Two fields of 16**3 float64 values fit in each chunk twice
+        ytcfg["yt", "chunk_bytes"] = 2 * 2 * 8 * 16**3
+        sp = ds.sphere("c", 0.4)
+        fields = [field, ("gas", "velocity_x")]
+        nchunks = 0
+        vals = {f: [] for f in fields}
+        for chunk in sp.chunks(fields, "io", chunk_sizing="memory"):
+            nchunks += 1
+            for f in fields:
+                vals[f].append(chunk[f])
+        assert 1 < nchunks < len(ds.index.grids)
+        for f in fields:
+            assert_equal(uconcatenate(vals[f]), ds.sphere("c", 0.4)[f])
+
+        for ds, field in [
+            (fake_particle_ds(), ("io", "particle_mass")),
+            (fake_octree_ds(), ("gas", "density")),
+            (fake_hexahedral_ds(), ("connect1", "elem")),
+        ]:
+            ad = ds.all_data()
+            for chunk_bytes in (0, 2**30):
+                ytcfg["yt", "chunk_bytes"] = chunk_bytes
+                vals = [c[field] for c in ad.chunks(field, "io", chunk_sizing="memory")]
+                assert_equal(uconcatenate(vals), ds.all_data()[field])
+    finally:
+        ytcfg["yt", "chunk_bytes"] = old_value
+
+
 def test_ds_hold():
     ds1 = fake_random_ds(64)
     ds2 = fake_random_ds(128)
@@ -296,3 +296,35 @@ def test_derived_quantities_with_particle_types():
         ),
         1309.164886405665,
     )
+
+
+def test_compute():
+    for nprocs in [1, 8]:
+        ds = fake_random_ds(
+            16,
+            nprocs=nprocs,
+            fields=("density", "velocity_x", "velocity_y", "velocity_z"),
+            units=("g/cm**3", "cm/s", "cm/s", "cm/s"),
+            particles=16**3,
+        )
+        sp = ds.sphere("c", (0.25, "unitary"))
+        fields = [("gas", "density"), ("gas", "velocity_x")]
+        quantities = [
+            ("total_mass", (), {}),
+            ("center_of_mass", (), {"use_particles": True}),
+            ("bulk_velocity", (), {}),
+            ("extrema", (fields,), {}),
+            ("weighted_average_quantity", (fields, ("gas", "mass")), {}),
+            ("weighted_standard_deviation", (fields, ("gas", "mass")), {}),
+        ]
+        # Keyword arguments are optional
+        requests = [
+            (q, args, kwargs) if kwargs else (q, args) for q, args, kwargs in quantities
+        ]
+        rv = sp.quantities.compute(requests)
+        for value, (q, args, kwargs) in zip(rv, quantities, strict=True):
+            ref = getattr(sp.quantities, q)(*args, **kwargs)
+            assert_equal(np.array(value), np.array(ref))
+        # A quantity can be requested by name alone, and more than once
+        total, total_again = sp.quantities.compute(["total_mass", "total_mass"])
+        assert_equal(total, total_again)
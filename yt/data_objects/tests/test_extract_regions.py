@@ -1,6 +1,7 @@
 import numpy as np
 from numpy.testing import assert_almost_equal, assert_equal
 
+from yt.data_objects.profiles import create_profile
 from yt.loaders import load
 from yt.testing import (
     fake_amr_ds,
@@ -68,6 +69,36 @@ def test_cut_region():
         assert_equal(p2["gas", "density"].max() > 0.25, True)
 
 
+def test_cut_region_quantities_and_profiles():
+    ds = fake_random_ds(
+        16, nprocs=4, fields=("density", "temperature"), units=("g/cm**3", "K")
+    )
+    dd = ds.all_data()
+    cr = dd.cut_region(["obj['gas', 'temperature'] > 0.5"])
+    mask = dd["gas", "temperature"] > 0.5
+    density = dd["gas", "density"][mask]
+
+    assert_almost_equal(cr.quantities.total_quantity(("gas", "density")), density.sum())
+    mi, ma = cr.quantities.extrema(("gas", "density"))
+    assert_equal(mi, density.min())
+    assert_equal(ma, density.max())
+
+    prof = create_profile(
+        cr, ("gas", "temperature"), ("gas", "density"), weight_field=None
+    )
+    assert_almost_equal(prof["gas", "density"].sum(), density.sum())
+
+
+def test_cut_region_projection():
+    ds = fake_random_ds(16, nprocs=4, fields=("density",), units=("g/cm**3",))
+    cr = ds.all_data().cut_region(["obj['gas', 'density'] > 0.5"])
+    p = ds.proj(("gas", "density"), 2, data_source=cr, method="max")
+    assert_equal(p["gas", "density"].min() > 0.5, True)
+    assert_equal(p["gas", "density"].max(), cr["gas", "density"].max())
+    p = ds.proj(("index", "ones"), 2, data_source=cr, method="sum")
+    assert_equal(p["index", "ones"].sum(), cr["index", "ones"].size)
+
+
 def test_region_and_particles():
     ds = fake_amr_ds(particles=10000)
 
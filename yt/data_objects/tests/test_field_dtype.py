@@ -0,0 +1,87 @@
+import os
+import shutil
+import tempfile
+
+import numpy as np
+from numpy.testing import assert_allclose, assert_equal
+
+from yt.config import ytcfg
+from yt.loaders import load
+from yt.testing import fake_amr_ds, fake_random_ds, requires_module
+
+
+def _make_pair(make_ds, **kwargs):
+    ds64 = make_ds(**kwargs)
+    ds32 = make_ds(**kwargs)
+    ds32.field_dtype = np.dtype("float32")
+    return ds32, ds64
+
+
+def test_field_dtype_fields():
+    for make_ds in (fake_random_ds, fake_amr_ds):
+        kwargs = {"fields": ("density", "velocity_x", "velocity_y", "velocity_z")}
+        kwargs["units"] = ("g/cm**3", "cm/s", "cm/s", "cm/s")
+        if make_ds is fake_random_ds:
+            kwargs["ndims"] = 16
+            kwargs["nprocs"] = 4
+        ds32, ds64 = _make_pair(make_ds, **kwargs)
+        sp32 = ds32.sphere("c", 0.3)
+        sp64 = ds64.sphere("c", 0.3)
+        for field in [("gas", "density"), ("gas", "velocity_magnitude")]:
+            assert sp32[field].dtype == np.float32
+            assert sp64[field].dtype == np.float64
+            assert sp32[field].units == sp64[field].units
+            assert_allclose(sp32[field], sp64[field], rtol=1e-6)
+        # Positions and reductions stay in double precision
+        assert sp32["index", "x"].dtype == np.float64
+        assert_equal(sp32["index", "x"], sp64["index", "x"])
+        assert_allclose(
+            sp32.quantities.weighted_average_quantity(
+                ("gas", "density"), ("index", "cell_volume")
+            ),
+            sp64.quantities.weighted_average_quantity(
+                ("gas", "density"), ("index", "cell_volume")
+            ),
+            rtol=1e-6,
+        )
+
+
+def test_field_dtype_frb():
+    ds32, ds64 = _make_pair(fake_random_ds, ndims=16, nprocs=4)
+    frb32 = ds32.slice(2, 0.5).to_frb(1.0, 32)
+    frb64 = ds64.slice(2, 0.5).to_frb(1.0, 32)
+    assert frb32["gas", "density"].dtype == np.float32
+    assert frb64["gas", "density"].dtype == np.float64
+    assert_allclose(frb32["gas", "density"], frb64["gas", "density"], rtol=1e-6)
+
+
+@requires_module("h5py")
+def test_field_dtype_load():
+    tmpdir = tempfile.mkdtemp()
+    curdir = os.getcwd()
+    os.chdir(tmpdir)
+
+    ds = fake_random_ds(16)
+    cg = ds.covering_grid(0, ds.domain_left_edge, ds.domain_dimensions)
+    fn = cg.save_as_dataset(fields=[("gas", "density")])
+
+    skip_cache = ytcfg["yt", "skip_dataset_cache"]
+    ytcfg["yt", "skip_dataset_cache"] = False
+    try:
+        ds64 = load(fn)
+        ds32 = load(fn, field_dtype="float32")
+        # Datasets of different precisions are cached separately
+        assert ds32 is not ds64
+        assert ds32.field_dtype == np.float32
+        assert ds64.field_dtype == np.float64
+        assert load(fn) is ds64
+        assert load(fn, field_dtype="float32") is ds32
+        assert ds64.r["grid", "density"].dtype == np.float64
+        assert ds32.r["grid", "density"].dtype == np.float32
+        assert load(fn).r["grid", "density"].dtype == np.float64
+    finally:
+        ytcfg["yt", "skip_dataset_cache"] = skip_cache
+
+    os.chdir(curdir)
+    if tmpdir != ".":
+        shutil.rmtree(tmpdir)
@@ -1,10 +1,11 @@
 import numpy as np
 import pytest
-from numpy.testing import assert_raises
+from numpy.testing import assert_equal, assert_raises
 
 from yt.data_objects.particle_filters import particle_filter
 from yt.data_objects.time_series import DatasetSeries
-from yt.testing import fake_particle_ds
+from yt.loaders import load
+from yt.testing import fake_particle_ds, requires_file, requires_module_pytest
 from yt.utilities.exceptions import YTIllDefinedParticleData
 
 pfields = [
@@ -147,3 +148,26 @@ def test_time_and_index(particle_trajectories_test_dataset, ptype):
     for field in ["particle_time", "particle_index"]:
         assert (ptype, field) in traj.keys(), f"Missing ({ptype},{field})"
         assert (field) not in traj.keys(), f"{field} present as bare string"
+
+
+@requires_module_pytest("h5py")
+@requires_file("snapshot_033/snap_033.0.hdf5")
+def test_particle_id_index(tmp_path):
+    # Only the data files holding the tracked particles are read, and the
+    # trajectories match the positions read from the whole dataset.
+    fn = "snapshot_033/snap_033.0.hdf5"
+    ds = load(fn, index_filename=str(tmp_path / "snap.ewah"))
+    ad = ds.all_data()
+    ids = ad["all", "particle_index"].d.astype("int64")
+    pos = ad["all", "particle_position_x"].d
+    tracked = np.sort(ids[:: ids.size // 50])
+
+    trajs = DatasetSeries([ds]).particle_trajectories(tracked.copy())
+    order = np.argsort(ids)
+    ref = pos[order][np.searchsorted(ids[order], tracked)]
+    assert_equal(trajs["all", "particle_position_x"][:, 0].d, ref)
+    assert (tmp_path / "snap.all.particle_index.npz").exists()
+
+    dd = ds.all_data()
+    ds.index._select_particle_ids(dd, ("all", "particle_index"), tracked[:1])
+    assert len(dd["all", "particle_index"]) < ids.size
@@ -1,8 +1,13 @@
 import numpy as np
-from numpy.testing import assert_equal
+from numpy.testing import assert_allclose, assert_equal
 
 import yt
-from yt.testing import fake_random_ds
+from yt.testing import (
+    fake_amr_ds,
+    fake_octree_ds,
+    fake_random_ds,
+    fake_sph_grid_ds,
+)
 
 
 def setup_module():
@@ -78,3 +83,36 @@ def test_fast_find_field_values_at_points():
     assert_equal(len(ppos_den_vel), 2)
     assert_equal(ppos_den_vel[0], ppos_den)
     assert_equal(ppos_den_vel[1], ppos_vel)
+
+
+def test_find_field_values_at_points_matches_point():
+    np.random.seed(0x4D3D3D3)
+    fields = [("gas", "density"), ("index", "grid_level")]
+    kwargs = {"fields": ("density",), "units": ("g/cm**3",)}
+    for ds in (
+        fake_random_ds(32, nprocs=8, **kwargs),
+        fake_amr_ds(**kwargs),
+        fake_octree_ds(),
+    ):
+        ppos = np.random.random((20, 3)) * ds.domain_width + ds.domain_left_edge
+        den, level = ds.find_field_values_at_points(fields, ppos)
+        for i, pos in enumerate(ppos):
+            assert_equal(den[i], ds.point(pos)["gas", "density"])
+            assert_equal(level[i], ds.point(pos)["index", "grid_level"])
+
+
+def test_find_field_values_at_points_sph():
+    np.random.seed(0x4D3D3D3)
+    # Smoothing lengths large enough for the kernels to overlap
+    ds = fake_sph_grid_ds(hsml_factor=30.0)
+    ppos = ds.arr(0.5 + 2 * np.random.random((20, 3)), "cm")
+    fields = [("gas", "temperature"), ("gas", "density")]
+    # The SPH index is called directly, so that it can't fall back to probing
+    # one point at a time
+    temp, dens = ds.index._find_field_values_at_points(fields, ppos)
+    # With normalization, constant fields are interpolated exactly
+    assert str(temp.units) == "K"
+    assert str(dens.units) == "g/cm**3"
+    assert_allclose(temp.d, 1.0)
+    assert_allclose(dens.d, 1.0)
+    assert_equal(ds.find_field_values_at_points(fields[0], ppos), temp)
@@ -4,7 +4,7 @@ import tempfile
 import unittest
 
 import numpy as np
-from numpy.testing import assert_equal, assert_raises
+from numpy.testing import assert_allclose, assert_equal, assert_raises
 
 import yt
 from yt.data_objects.particle_filters import add_particle_filter
@@ -749,3 +749,74 @@ def test_export_pandas():
         prof.standard_deviation["gas", "density"].d,
         np.nan_to_num(df3["density_stddev"]),
     )
+
+
+def test_profile_quantiles():
+    ds = fake_random_ds(32, fields=_fields, units=_units, nprocs=8)
+    ad = ds.all_data()
+    quantiles = [0.05, 0.5, 0.95]
+    profile = create_profile(
+        ad,
+        ("gas", "density"),
+        ("gas", "temperature"),
+        n_bins=4,
+        logs={("gas", "density"): False},
+        weight_field=None,
+        quantiles=quantiles,
+    )
+    assert_equal(profile.quantiles["gas", "temperature"].shape, (4, 3))
+    rho = ad["gas", "density"]
+    temp = ad["gas", "temperature"].d
+    for i in range(4):
+        in_bin = (rho > profile.x_bins[i]) & (rho < profile.x_bins[i + 1])
+        ref = np.quantile(temp[in_bin], quantiles)
+        for q, r in zip(quantiles, ref, strict=True):
+            value = profile.quantile(("gas", "temperature"), q)[i]
+            assert_allclose(value.d, r, rtol=0.05)
+    assert_raises(KeyError, profile.quantile, ("gas", "temperature"), 0.25)
+
+    # Quantiles of another field do not change those already computed
+    profile.add_quantiles([("stream", "dinosaurs")], quantiles=[0.25])
+    assert_equal(profile.quantiles["stream", "dinosaurs"].shape, (4, 1))
+    assert_equal(
+        profile.quantile(("gas", "temperature"), 0.95),
+        profile.quantiles["gas", "temperature"][..., 2],
+    )
+    assert_raises(KeyError, profile.quantile, ("stream", "dinosaurs"), 0.5)
+
+
+def test_particle_profile_quantiles():
+    ds = fake_random_ds(16, particles=10000)
+    ad = ds.all_data()
+    bin_fields = [("all", "particle_position_x"), ("all", "particle_position_y")]
+    logs = dict.fromkeys(bin_fields, False)
+    field = ("all", "particle_mass")
+    profile = create_profile(
+        ad, bin_fields, field, n_bins=2, logs=logs, weight_field=None, quantiles=[0.5]
+    )
+    px = ad[bin_fields[0]]
+    py = ad[bin_fields[1]]
+    mass = ad[field].d
+    for i in range(2):
+        for j in range(2):
+            in_bin = (
+                (px > profile.x_bins[i])
+                & (px < profile.x_bins[i + 1])
+                & (py > profile.y_bins[j])
+                & (py < profile.y_bins[j + 1])
+            )
+            value = profile.quantile(field, 0.5)[i, j]
+            assert_allclose(value.d, np.median(mass[in_bin]), rtol=0.05)
+
+    # Particles are spread over several bins with cic deposition
+    assert_raises(
+        ValueError,
+        create_profile,
+        ad,
+        bin_fields,
+        field,
+        logs=logs,
+        weight_field=None,
+        deposition="cic",
+        quantiles=[0.5],
+    )
@@ -3,6 +3,7 @@ import tempfile
 from unittest import mock
 
 import numpy as np
+import pytest
 from numpy.testing import assert_equal
 
 from yt.testing import assert_rel_equal, fake_amr_ds, fake_random_ds
@@ -177,3 +178,31 @@ def test_min_level():
 
     proj = ds.proj(("gas", "density"), 2, method="max")
     assert proj["index", "grid_level"].min() == ds.index.min_level
+
+
+def test_shared_memory_projection():
+    from yt.utilities.parallel_tools import shared_memory_backend
+
+    if not hasattr(os, "fork"):
+        pytest.skip("fork is not available on this platform")
+    ds = fake_amr_ds(fields=[("gas", "density")], units=["mp/cm**3"])
+    field = ("gas", "density")
+    kwargs = [
+        {"method": "integrate"},
+        {"method": "integrate", "weight_field": ("gas", "cell_volume")},
+        {"method": "max"},
+        {"method": "min"},
+    ]
+    ref = [ds.proj(field, 2, **kw) for kw in kwargs]
+    old_value = shared_memory_backend.num_procs
+    shared_memory_backend.enable(3)
+    try:
+        projs = [ds.proj(field, 2, **kw) for kw in kwargs]
+    finally:
+        shared_memory_backend.num_procs = old_value
+    for proj, rproj in zip(projs, ref, strict=True):
+        order = np.lexsort((proj["px"], proj["py"]))
+        rorder = np.lexsort((rproj["px"], rproj["py"]))
+        for f in ["px", "py", "pdx", field]:
+            assert_rel_equal(proj[f][order], rproj[f][rorder], 12)
+        assert proj[field].units == rproj[field].units
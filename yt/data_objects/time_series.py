@@ -23,6 +23,7 @@ from yt.utilities.object_registries import (
     derived_quantity_registry,
     simulation_time_series_registry,
 )
+from yt.utilities.parallel_tools import shared_memory_backend
 from yt.utilities.parallel_tools.parallel_analysis_interface import (
     communication_system,
     parallel_objects,
@@ -265,7 +266,9 @@ class DatasetSeries:
             enabled.  This requires one dedicated processor; if this
             is enabled with a set of 128 processors available, only
             127 will be available to iterate over objects as one will
-            be load balancing the rest.
+            be load balancing the rest.  With the multiprocessing backend
+            (see :func:`~yt.utilities.parallel_tools.parallel_analysis_interface.enable_parallelism`)
+            no processor is dedicated to load balancing.
 
 
         Examples
@@ -309,6 +312,10 @@ class DatasetSeries:
                 njobs = -1
             else:
                 njobs = self.parallel
+        elif shared_memory_backend.is_active():
+            # Forked workers claim datasets from a shared counter, so no
+            # processor needs to be set aside for load balancing.
+            njobs = -1
         else:
             my_communicator = communication_system.communicators[-1]
             nsize = my_communicator.size
@@ -372,14 +379,16 @@ class DatasetSeries:
         obj = cls(filenames, parallel=parallel)
         return obj
 
-    def _load(self, output_fn, *, hint: str | None = None, **kwargs):
+    def _load(self, output_fn, *, hint: str | None = None, field_dtype=None, **kwargs):
+        from yt.data_objects.static_output import requested_field_dtype
         from yt.loaders import load
 
         if self._dataset_cls is not None:
-            return self._dataset_cls(output_fn, **kwargs)
+            with requested_field_dtype(field_dtype):
+                return self._dataset_cls(output_fn, **kwargs)
         elif self._mixed_dataset_types:
-            return load(output_fn, hint=hint, **kwargs)
-        ds = load(output_fn, hint=hint, **kwargs)
+            return load(output_fn, hint=hint, field_dtype=field_dtype, **kwargs)
+        ds = load(output_fn, hint=hint, field_dtype=field_dtype, **kwargs)
         self._dataset_cls = ds.__class__
         return ds
 
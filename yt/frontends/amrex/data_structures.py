@@ -388,6 +388,7 @@ class BoxlibHierarchy(GridIndex):
         # each level is one group with ngrids on it.
         # each grid has self.dimensionality number of lines of 2 reals
         self.grids = []
+        self._level_header_files = []
         grid_counter = 0
         for level in range(self.max_level + 1):
             vals = next(header_file).split()
@@ -409,6 +410,7 @@ class BoxlibHierarchy(GridIndex):
             # Now we get to the level header filename, which we open and parse.
             fn = os.path.join(self.dataset.output_dir, next(header_file).strip())
             level_header_file = open(fn + "_H")
+            self._level_header_files.append(fn + "_H")
             level_dir = os.path.dirname(fn)
             # We skip the first two lines, which contain BoxLib header file
             # version and 'how' the data was written
@@ -491,10 +493,61 @@ class BoxlibHierarchy(GridIndex):
         mylog.debug("FAB header suggests dtype of %s", dtype)
         self._dtype = np.dtype(dtype)
 
+    @property
+    def _index_cache_filename(self):
+        return f"{self.header_filename}.yt_grids"
+
+    @property
+    def _index_cache_files(self):
+        return [self.header_filename] + self._level_header_files
+
+    def _get_index_cache_state(self):
+        state = super()._get_index_cache_state()
+        state["grid_start_index"] = self.grid_start_index
+        state["level_dds"] = self.level_dds
+        state["grid_filenames"] = np.array([g.filename for g in self.grids])
+        state["grid_offsets"] = np.array(
+            [g._base_offset for g in self.grids], dtype="int64"
+        )
+        ids, counts = self._pack_grid_ids([g._parent_id for g in self.grids])
+        state["grid_parent_ids"] = ids
+        state["grid_parent_counts"] = counts
+        ids, counts = self._pack_grid_ids([g._children_ids for g in self.grids])
+        state["grid_children_ids"] = ids
+        state["grid_children_counts"] = counts
+        return state
+
+    def _set_index_cache_state(self, state):
+        super()._set_index_cache_state(state)
+        self.max_level = self.dataset._max_level
+        self.dimensionality = self.dataset.dimensionality
+        self.float_type = "float64"
+        self.grid_start_index = state["grid_start_index"]
+        self.level_dds = state["level_dds"]
+        parents = self._unpack_grid_ids(
+            state["grid_parent_ids"], state["grid_parent_counts"]
+        )
+        children = self._unpack_grid_ids(
+            state["grid_children_ids"], state["grid_children_counts"]
+        )
+        self.grids = np.empty(self.num_grids, dtype="object")
+        for i in range(self.num_grids):
+            go = self.grid(
+                i, int(state["grid_offsets"][i]), str(state["grid_filenames"][i]), self
+            )
+            go.Level = int(self.grid_levels[i, 0])
+            go._parent_id = parents[i].tolist()
+            go._children_ids = children[i]
+            self.grids[i] = go
+        self._prepare_grid_objects()
+
     def _populate_grid_objects(self):
         mylog.debug("Creating grid objects")
         self.grids = np.array(self.grids, dtype="object")
         self._reconstruct_parent_child()
+        self._prepare_grid_objects()
+
+    def _prepare_grid_objects(self):
         for i, grid in enumerate(self.grids):
             if (i % 1e4) == 0:
                 mylog.debug("Prepared % 7i / % 7i grids", i, self.num_grids)
@@ -119,17 +119,6 @@ class ARTIndex(OctreeIndex):
                 g = og
             yield YTDataChunk(dobj, "spatial", [g], None)
 
-    def _chunk_io(self, dobj, cache=True, local_only=False):
-        """
-        Since subsets are calculated per domain,
-        i.e. per file, yield each domain at a time to
-        organize by IO. We will eventually chunk out NMSU ART
-        to be level-by-level.
-        """
-        oobjs = getattr(dobj._current_chunk, "objs", dobj._chunk_info)
-        for subset in oobjs:
-            yield YTDataChunk(dobj, "io", [subset], None, cache=cache)
-
 
 class ARTDataset(Dataset):
     _index_class: type[Index] = ARTIndex
@@ -317,11 +317,21 @@ class ARTIOIndex(Index):
                 g = og
             yield YTDataChunk(dobj, "spatial", [g], None, cache=True)
 
-    def _chunk_io(self, dobj, cache=True, local_only=False):
+    def _chunk_io(
+        self, dobj, cache=True, local_only=False, chunk_sizing="auto", nfields=1
+    ):
         # _current_chunk is made from identify_base_chunk
         oobjs = getattr(dobj._current_chunk, "objs", dobj._chunk_info)
-        for chunk in oobjs:
-            yield YTDataChunk(dobj, "io", [chunk], None, cache=cache)
+        if chunk_sizing == "auto":
+            chunks = ([subset] for subset in oobjs)
+        elif chunk_sizing == "memory":
+            chunks = self._memory_chunks(oobjs, _subset_cell_count, nfields)
+        else:
+            raise RuntimeError(
+                f"{chunk_sizing} is an invalid value for the 'chunk_sizing' argument."
+            )
+        for subsets in chunks:
+            yield YTDataChunk(dobj, "io", subsets, None, cache=cache)
 
     def _read_fluid_fields(self, fields, dobj, chunk=None):
         if len(fields) == 0:
@@ -355,6 +365,14 @@ class ARTIOIndex(Index):
         return pos, dds
 
 
+def _subset_cell_count(subset):
+    # An upper bound on the number of cells of an ARTIO subset, before any
+    # selection: the root cells of its SFC range, or the zones of its octs.
+    if isinstance(subset, ARTIORootMeshSubset):
+        return subset.sfc_end - subset.sfc_start + 1
+    return subset.oct_handler.nocts * subset._num_zones**3
+
+
 class ARTIODataset(Dataset):
     _handle = None
     _index_class = ARTIOIndex
@@ -76,3 +76,14 @@ def test_particle_derived_field():
     ad = ds.all_data()
 
     assert_allclose_units(ad["STAR", "age"].in_units("Myr"), ad["STAR", "new_field"])
+
+
+@requires_file(sizmbhloz)
+def test_memory_chunk_sizing():
+    ds = load(sizmbhloz)
+    sp = ds.sphere("c", (100, "kpc"))
+    field = ("gas", "density")
+    ref = sum(c[field].sum() for c in sp.chunks(field, "io"))
+    chunks = list(sp.chunks(field, "io", chunk_sizing="memory"))
+    assert len(chunks) > 0
+    assert_allclose_units(sum(c[field].sum() for c in chunks), ref)
@@ -454,7 +454,14 @@ class AthenaHierarchy(GridIndex):
         mask[grid_ind] = True
         return [g for g in self.grids[mask] if g.Level == grid.Level + 1]
 
-    def _chunk_io(self, dobj, cache=True, local_only=False):
+    def _chunk_io(
+        self, dobj, cache=True, local_only=False, chunk_sizing="auto", nfields=1
+    ):
+        if chunk_sizing != "auto":
+            yield from super()._chunk_io(
+                dobj, cache, local_only, chunk_sizing=chunk_sizing, nfields=nfields
+            )
+            return
         gobjs = getattr(dobj._current_chunk, "objs", dobj._chunk_info)
         for subset in gobjs:
             yield YTDataChunk(
@@ -49,6 +49,9 @@ class IOHandlerAthenaPP(BaseIOHandler):
             dname, fdi = self.ds._field_map[fname]
             if dname != last_dname:
                 ds = f[f"/{dname}"]
+                mapped = self._mmap_hdf5_dataset(ds)
+                if mapped is not None:
+                    ds = mapped
             ind = 0
             for chunk in chunks:
                 for gs in grid_sequences(chunk.objs):
@@ -183,7 +183,14 @@ class ChimeraUNSIndex(UnstructuredIndex):
             if np.shape(f["abundance"]["nse_c"]) != np.shape(f["fluid"]["rho_c"]):
                 self.field_list += [("chimera", "nse_c")]
 
-    def _chunk_io(self, dobj, cache=True, local_only=False):  # Creates Data chunk
+    def _chunk_io(
+        self, dobj, cache=True, local_only=False, chunk_sizing="auto", nfields=1
+    ):  # Creates Data chunk
+        if chunk_sizing != "auto":
+            yield from super()._chunk_io(
+                dobj, cache, local_only, chunk_sizing=chunk_sizing, nfields=nfields
+            )
+            return
         gobjs = getattr(dobj._current_chunk, "objs", dobj._chunk_info)
         for subset in gobjs:
             yield YTDataChunk(
@@ -86,7 +86,7 @@ class IOHandlerChomboHDF5(BaseIOHandler):
         self._particle_field_index = field_dict
         return self._particle_field_index
 
-    def _read_data(self, grid, field):
+    def _read_data(self, grid, field, mmap=False):
         lstring = f"level_{grid.Level}"
         lev = self._handle[lstring]
         dims = grid.ActiveDimensions
@@ -99,7 +99,14 @@ class IOHandlerChomboHDF5(BaseIOHandler):
             grid_offset = lev[self._offset_string][grid._level_id]
         start = grid_offset + self.field_dict[field] * boxsize
         stop = start + boxsize
-        data = lev[self._data_string][start:stop]
+        data = lev[self._data_string]
+        if mmap:
+            # The memory-mapped view is read-only, so this is only used when
+            # the data is selected into another array.
+            mapped = self._mmap_hdf5_dataset(data)
+            if mapped is not None:
+                data = mapped
+        data = data[start:stop]
         data_no_ghost = data.reshape(shape, order="F")
         ghost_slice = tuple(
             slice(g, g + d) for g, d in zip(self.ghost, dims, strict=True)
@@ -138,7 +145,7 @@ class IOHandlerChomboHDF5(BaseIOHandler):
                 nd = 0
                 for field in fields:
                     ftype, fname = field
-                    data = self._read_data(g, fname)
+                    data = self._read_data(g, fname, mmap=True)
                     nd = g.select(selector, data, rv[field], ind)  # caches
                 ind += nd
         return rv
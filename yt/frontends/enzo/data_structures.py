@@ -161,6 +161,45 @@ class EnzoHierarchy(GridIndex):
         # sync it back
         self.dataset.dataset_type = self.dataset_type
 
+    @property
+    def _index_cache_filename(self):
+        return f"{self.index_filename}.yt_grids"
+
+    @property
+    def _index_cache_files(self):
+        return [self.index_filename]
+
+    def _get_index_cache_state(self):
+        state = super()._get_index_cache_state()
+        state["grid_filenames"] = np.array([g.filename or "" for g in self.grids])
+        state["grid_parent_ids"] = np.array(
+            [g._parent_id for g in self.grids], dtype="int64"
+        )
+        ids, counts = self._pack_grid_ids([g._children_ids for g in self.grids])
+        state["grid_children_ids"] = ids
+        state["grid_children_counts"] = counts
+        for ptype, count in getattr(self, "grid_active_particle_count", {}).items():
+            state[f"grid_active_particle_count_{ptype}"] = count
+        return state
+
+    def _set_index_cache_state(self, state):
+        super()._set_index_cache_state(state)
+        for ptype in getattr(self, "grid_active_particle_count", {}):
+            count = state[f"grid_active_particle_count_{ptype}"]
+            self.grid_active_particle_count[ptype] = count
+        children = self._unpack_grid_ids(
+            state["grid_children_ids"], state["grid_children_counts"]
+        )
+        self.grids = np.empty(self.num_grids, dtype="object")
+        for i in range(self.num_grids):
+            g = self.grid(i + 1, self)
+            g.Level = int(self.grid_levels[i, 0])
+            g._parent_id = int(state["grid_parent_ids"][i])
+            g._children_ids = children[i].tolist()
+            self.grids[i] = g
+        self.filenames = [[str(fn) or None] for fn in state["grid_filenames"]]
+        self._populate_grid_objects()
+
     def _count_grids(self):
         self.num_grids = None
         test_grid = test_grid_id = None
@@ -533,6 +572,7 @@ class EnzoHierarchy(GridIndex):
 
 class EnzoHierarchyInMemory(EnzoHierarchy):
     grid = EnzoGridInMemory
+    _index_cache_filename = None
 
     @cached_property
     def enzo(self):
@@ -617,7 +657,14 @@ class EnzoHierarchyInMemory(EnzoHierarchy):
             random_sample = np.mgrid[0 : max(len(my_grids) - 1, 1)].astype("int32")
         return my_grids[random_sample,]
 
-    def _chunk_io(self, dobj, cache=True, local_only=False):
+    def _chunk_io(
+        self, dobj, cache=True, local_only=False, chunk_sizing="auto", nfields=1
+    ):
+        if chunk_sizing != "auto":
+            yield from super()._chunk_io(
+                dobj, cache, local_only, chunk_sizing=chunk_sizing, nfields=nfields
+            )
+            return
         gfiles = defaultdict(list)
         gobjs = getattr(dobj._current_chunk, "objs", dobj._chunk_info)
         for g in gobjs:
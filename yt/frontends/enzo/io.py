@@ -166,6 +166,13 @@ class IOHandlerPackedHDF5(BaseIOHandler):
                 data[:] = 0
                 return data.T
             raise
+        mapped = self._mmap_hdf5_dataset(dg)
+        if mapped is not None:
+            if close:
+                fid.close()
+            # The mapped values keep their on-disk type, so we convert them
+            # like the h5py read below does (a no-op when the types match).
+            return mapped.astype(self._field_dtype, copy=False).T
         dg.read(h5py.h5s.ALL, h5py.h5s.ALL, data)
         # I don't know why, but on some installations of h5py this works, but
         # on others, nope.  Doesn't seem to be a version thing.
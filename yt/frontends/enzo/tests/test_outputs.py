@@ -1,8 +1,14 @@
+import os
+import shutil
+import tempfile
+
 import numpy as np
 from numpy.testing import assert_almost_equal, assert_array_equal, assert_equal
 
+from yt.config import ytcfg
 from yt.frontends.enzo.api import EnzoDataset
 from yt.frontends.enzo.fields import NODAL_FLAGS
+from yt.loaders import load
 from yt.testing import (
     assert_allclose_units,
     requires_file,
@@ -302,3 +308,34 @@ def test_nonzero_omega_radiation():
         4,
         err_msg="Simulation time not consistent with cosmology calculator.",
     )
+
+
+@requires_module("h5py")
+@requires_file(enzotiny)
+def test_grid_index_cache():
+    # Work on a copy, so that the cache is not written next to the test data
+    tmpdir = tempfile.mkdtemp()
+    old_value = ytcfg["yt", "grid_index_cache"]
+    ytcfg["yt", "grid_index_cache"] = True
+    try:
+        ds0 = data_dir_load(enzotiny)
+        shutil.copytree(ds0.directory, os.path.join(tmpdir, "DD0046"))
+        fn = os.path.join(tmpdir, "DD0046", "DD0046")
+        ds1 = load(fn)
+        ds1.index
+        assert os.path.isdir(f"{fn}.hierarchy.yt_grids")
+        ds2 = load(fn)
+        # The hierarchy is read back memory-mapped rather than parsed
+        assert isinstance(ds2.index.grid_dimensions, np.memmap)
+        for attr in ds2.index._index_properties:
+            assert_array_equal(getattr(ds2.index, attr), getattr(ds1.index, attr))
+        for g1, g2 in zip(ds1.index.grids, ds2.index.grids, strict=True):
+            assert_equal(g2.filename, g1.filename)
+            assert_equal(g2.Level, g1.Level)
+            assert_equal(g2._parent_id, g1._parent_id)
+            assert_equal(g2._children_ids, g1._children_ids)
+        field = ("gas", "density")
+        assert_array_equal(ds2.r[field], ds1.r[field])
+    finally:
+        ytcfg["yt", "grid_index_cache"] = old_value
+        shutil.rmtree(tmpdir)
@@ -239,7 +239,14 @@ class FITSHierarchy(GridIndex):
     def _setup_data_io(self):
         self.io = io_registry[self.dataset_type](self.dataset)
 
-    def _chunk_io(self, dobj, cache=True, local_only=False):
+    def _chunk_io(
+        self, dobj, cache=True, local_only=False, chunk_sizing="auto", nfields=1
+    ):
+        if chunk_sizing != "auto":
+            yield from super()._chunk_io(
+                dobj, cache, local_only, chunk_sizing=chunk_sizing, nfields=nfields
+            )
+            return
         # local_only is only useful for inline datasets and requires
         # implementation by subclasses.
         gfiles = defaultdict(list)
@@ -67,6 +67,9 @@ class IOHandlerFLASH(BaseIOHandler):
                 # inside because we may exhaust our chunks.
                 ftype, fname = field
                 ds = f[f"/{fname}"]
+                mapped = self._mmap_hdf5_dataset(ds)
+                if mapped is not None:
+                    ds = mapped
                 for gs in grid_sequences(chunk.objs):
                     start = gs[0].id - gs[0]._id_offset
                     end = gs[-1].id - gs[-1]._id_offset + 1
@@ -181,7 +184,8 @@ class IOHandlerFLASH(BaseIOHandler):
             data = ds[obj.id - obj._id_offset, :, :, :].transpose()
         else:
             data = ds[offset, :, :, :].transpose()
-        return data.astype("=f8")
+        # Native float64 data, including memory-mapped data, is not copied
+        return np.asarray(data, dtype="=f8")
 
     def _read_chunk_data(self, chunk, fields):
         f = self._handle
@@ -123,6 +123,35 @@ def test_particle_subselection():
     psc.run_defaults()
 
 
+@requires_file(snap_33)
+def test_parallel_index_build():
+    # The particle index built by the workers of the shared-memory backend
+    # matches the one built serially.
+    from numpy.testing import assert_equal
+
+    from yt.utilities.parallel_tools import shared_memory_backend
+
+    if not hasattr(os, "fork"):
+        return
+    tmpdir = tempfile.mkdtemp()
+    try:
+        ds = data_dir_load(snap_33, kwargs={"index_filename": f"{tmpdir}/serial"})
+        ref = ds.index.regions
+        old_value = shared_memory_backend.num_procs
+        shared_memory_backend.enable(3)
+        try:
+            ds = data_dir_load(snap_33, kwargs={"index_filename": f"{tmpdir}/par"})
+            regions = ds.index.regions
+        finally:
+            shared_memory_backend.num_procs = old_value
+        assert_equal(regions.masks, ref.masks)
+        assert_equal(regions.particle_counts, ref.particle_counts)
+        with open(f"{tmpdir}/serial", "rb") as f1, open(f"{tmpdir}/par", "rb") as f2:
+            assert f1.read() == f2.read()
+    finally:
+        shutil.rmtree(tmpdir)
+
+
 @requires_ds(BE_Gadget)
 def test_bigendian_field_access():
     ds = data_dir_load(BE_Gadget)
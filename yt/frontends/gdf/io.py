@@ -77,6 +77,13 @@ class IOHandlerGDFHDF5(BaseParticleIOHandler):
                     dg = h5py.h5d.open(
                         fid, bytes(_field_dname(grid.id, fname), "utf-8")
                     )
+                    mapped = self._mmap_hdf5_dataset(dg)
+                    if mapped is not None:
+                        if self.ds.field_ordering == 1:
+                            mapped = mapped.swapaxes(0, 2)
+                        # caches
+                        nd = grid.select(selector, mapped, rv[field], ind)
+                        continue
                     dg.read(h5py.h5s.ALL, h5py.h5s.ALL, data)
                     # caches
                     nd = grid.select(selector, data_view, rv[field], ind)
@@ -6,6 +6,7 @@ import numpy as np
 
 from yt.data_objects.static_output import ParticleDataset, ParticleFile
 from yt.frontends.sph.fields import SPHFieldInfo
+from yt.funcs import setdefaultattr
 from yt.geometry.particle_geometry_handler import ParticleIndex
 from yt.utilities.on_demand_imports import _requests as requests
 
@@ -14,9 +15,16 @@ class HTTPParticleFile(ParticleFile):
     pass
 
 
+class HTTPParticleIndex(ParticleIndex):
+    @property
+    def chunksize(self):
+        # Remote files are fetched whole, so they are not split into chunks
+        return 0
+
+
 class HTTPStreamDataset(ParticleDataset):
     _load_requirements = ["requests"]
-    _index_class = ParticleIndex
+    _index_class = HTTPParticleIndex
     _file_class = HTTPParticleFile
     _field_info_class = SPHFieldInfo
     _particle_mass_name = "Mass"
@@ -31,8 +39,14 @@ class HTTPStreamDataset(ParticleDataset):
         unit_system="cgs",
         index_order=None,
         index_filename=None,
+        max_workers=4,
+        cache_dir=None,
     ):
         self.base_url = base_url
+        # Number of fields fetched concurrently, and an optional local
+        # directory in which downloaded fields are kept between sessions.
+        self.max_workers = max_workers
+        self.cache_dir = cache_dir
         super().__init__(
             "",
             dataset_type=dataset_type,
@@ -81,19 +95,13 @@ class HTTPStreamDataset(ParticleDataset):
 
         self.file_count = header["num_files"]
 
-    def _set_units(self):
-        length_unit = float(self.parameters["units"]["length"])
-        time_unit = float(self.parameters["units"]["time"])
-        mass_unit = float(self.parameters["units"]["mass"])
-        density_unit = mass_unit / length_unit**3
-        velocity_unit = length_unit / time_unit
-        self._unit_base = {}
-        self._unit_base["cm"] = 1.0 / length_unit
-        self._unit_base["s"] = 1.0 / time_unit
-        super()._set_units()
-        self.conversion_factors["velocity"] = velocity_unit
-        self.conversion_factors["mass"] = mass_unit
-        self.conversion_factors["density"] = density_unit
+    def _set_code_unit_attributes(self):
+        # The index file gives the code units in cgs
+        units = self.parameters["units"]
+        setdefaultattr(self, "length_unit", self.quan(float(units["length"]), "cm"))
+        setdefaultattr(self, "time_unit", self.quan(float(units["time"]), "s"))
+        setdefaultattr(self, "mass_unit", self.quan(float(units["mass"]), "g"))
+        setdefaultattr(self, "velocity_unit", self.length_unit / self.time_unit)
 
     @classmethod
     def _is_valid(cls, filename: str, *args, **kwargs) -> bool:
@@ -1,3 +1,9 @@
+import hashlib
+import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 
 from yt.funcs import mylog
@@ -8,23 +14,107 @@ from yt.utilities.on_demand_imports import _requests as requests
 class IOHandlerHTTPStream(BaseParticleIOHandler):
     _dataset_type = "http_particle_stream"
     _vector_fields = {"Coordinates": 3, "Velocity": 3, "Velocities": 3}
+    # Size of the blocks responses are streamed in
+    _block_size = 1 << 20
+    # How many data files are fetched ahead of the one being processed
+    _prefetch_files = 1
 
     def __init__(self, ds):
         self._url = ds.base_url
-        # This should eventually manage the IO and cache it
+        self._max_workers = ds.max_workers
+        self._cache_dir = ds.cache_dir
+        self._session = None
+        self._lock = threading.Lock()
         self.total_bytes = 0
         super().__init__(ds)
 
+    @property
+    def session(self):
+        # All requests share one session, so that connections to the server
+        # are kept alive and pooled between the fetching threads.
+        if self._session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=self._max_workers, pool_maxsize=self._max_workers
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._session = session
+        return self._session
+
+    def _field_shape(self, data_file, field):
+        ptype, fname = field
+        count = self._count_particles(data_file)[ptype]
+        if fname in self._vector_fields:
+            return (count, self._vector_fields[fname])
+        return (count,)
+
+    def _stream(self, url, write, offset=0):
+        # Streams the response into *write* block by block, asking the server
+        # to resume from *offset* if it is nonzero.  Returns the offset the
+        # response actually started from.
+        headers = {}
+        if offset > 0:
+            headers["Range"] = f"bytes={offset}-"
+        mylog.info("Loading URL %s", url)
+        with self.session.get(url, stream=True, headers=headers) as resp:
+            if resp.status_code == 200:
+                offset = 0
+            elif resp.status_code != 206:
+                raise RuntimeError(f"Could not load {url} ({resp.status_code})")
+            start = offset
+            for block in resp.iter_content(chunk_size=self._block_size):
+                write(offset, block)
+                offset += len(block)
+        with self._lock:
+            self.total_bytes += offset - start
+        return start, offset
+
     def _open_stream(self, data_file, field):
-        # This does not actually stream yet!
         ftype, fname = field
-        s = f"{self._url}/{data_file.file_id}/{ftype}/{fname}"
-        mylog.info("Loading URL %s", s)
-        resp = requests.get(s)
-        if resp.status_code != 200:
-            raise RuntimeError
-        self.total_bytes += len(resp.content)
-        return resp.content
+        url = f"{self._url}/{data_file.file_id}/{ftype}/{fname}"
+        shape = self._field_shape(data_file, field)
+        if self._cache_dir is not None:
+            return self._open_cached_stream(url, shape)
+        arr = np.empty(shape, dtype="float64")
+        buf = memoryview(arr).cast("B")
+
+        def write(offset, block):
+            buf[offset : offset + len(block)] = block
+
+        _, end = self._stream(url, write)
+        if end != buf.nbytes:
+            raise RuntimeError(f"Expected {buf.nbytes} bytes from {url}, got {end}")
+        return arr
+
+    def _open_cached_stream(self, url, shape):
+        # Fields are downloaded into a local cache, and read back memory-mapped.
+        # An interrupted download is resumed with a byte-range request.
+        key = hashlib.md5(f"{self.ds.unique_identifier}:{url}".encode()).hexdigest()
+        fn = os.path.join(self._cache_dir, key)
+        nbytes = int(np.prod(shape)) * 8
+        if not os.path.exists(fn) or os.path.getsize(fn) != nbytes:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            part = f"{fn}.part"
+            offset = 0
+            if os.path.exists(part):
+                offset = os.path.getsize(part)
+                if offset >= nbytes:
+                    offset = 0
+            with open(part, "r+b" if offset > 0 else "wb") as fh:
+
+                def write(offset, block):
+                    fh.seek(offset)
+                    fh.write(block)
+
+                _, end = self._stream(url, write, offset)
+                fh.truncate(end)
+            if end != nbytes:
+                raise RuntimeError(f"Expected {nbytes} bytes from {url}, got {end}")
+            os.replace(part, fn)
+        if nbytes == 0:
+            return np.empty(shape, dtype="float64")
+        return np.memmap(fn, dtype="float64", mode="r", shape=shape)
 
     def _identify_fields(self, data_file):
         f = []
@@ -32,32 +122,77 @@ class IOHandlerHTTPStream(BaseParticleIOHandler):
             f.append((str(ftype), str(fname)))
         return f, {}
 
-    def _read_particle_coords(self, chunks, ptf):
-        for data_file in self._sorted_chunk_iterator(chunks):
-            for ptype in ptf:
-                s = self._open_stream(data_file, (ptype, "Coordinates"))
-                c = np.frombuffer(s, dtype="float64")
-                c.shape = (c.shape[0] / 3.0, 3)
-                yield ptype, (c[:, 0], c[:, 1], c[:, 2]), 0.0
+    def _prefetch(self, executor, data_files, fields):
+        # Fetches all of the fields of a data file concurrently, and keeps
+        # _prefetch_files data files in flight ahead of the one being
+        # processed, so that memory stays bounded.
+        queue = deque()
+        for data_file in data_files:
+            futures = {
+                field: executor.submit(self._open_stream, data_file, field)
+                for field in fields
+            }
+            queue.append((data_file, futures))
+            if len(queue) > self._prefetch_files:
+                yield queue.popleft()
+        while queue:
+            yield queue.popleft()
 
-    def _read_particle_fields(self, chunks, ptf, selector):
-        # Now we have all the sizes, and we can allocate
-        for data_file in self._sorted_chunk_iterator(chunks):
+    def _prefetch_selected(self, executor, data_files, ptf, selector):
+        # Coordinates are fetched ahead, and the other fields of a data file
+        # are only fetched for the particle types it has selected particles
+        # of.  Yields the masks of those particle types and the fetches.
+        fields = [(ptype, "Coordinates") for ptype in sorted(ptf)]
+        queue = deque()
+        for data_file, coords in self._prefetch(executor, data_files, fields):
+            masks = {}
+            futures = {}
             for ptype, field_list in sorted(ptf.items()):
-                s = self._open_stream(data_file, (ptype, "Coordinates"))
-                c = np.frombuffer(s, dtype="float64")
-                c.shape = (c.shape[0] / 3.0, 3)
+                c = coords[ptype, "Coordinates"].result()
                 mask = selector.select_points(c[:, 0], c[:, 1], c[:, 2], 0.0)
                 del c
                 if mask is None:
                     continue
+                masks[ptype] = mask
                 for field in field_list:
-                    s = self._open_stream(data_file, (ptype, field))
-                    c = np.frombuffer(s, dtype="float64")
-                    if field in self._vector_fields:
-                        c.shape = (c.shape[0] / 3.0, 3)
-                    data = c[mask, ...]
-                    yield (ptype, field), data
+                    futures[ptype, field] = executor.submit(
+                        self._open_stream, data_file, (ptype, field)
+                    )
+            queue.append((masks, futures))
+            if len(queue) > self._prefetch_files:
+                yield queue.popleft()
+        while queue:
+            yield queue.popleft()
+
+    def _yield_coordinates(self, data_file):
+        ptypes = sorted(self._count_particles(data_file))
+        fields = [(ptype, "Coordinates") for ptype in ptypes]
+        with ThreadPoolExecutor(self._max_workers) as executor:
+            for _, futures in self._prefetch(executor, [data_file], fields):
+                for (ptype, _), future in futures.items():
+                    yield ptype, np.asarray(future.result())
+
+    def _read_particle_coords(self, chunks, ptf):
+        fields = [(ptype, "Coordinates") for ptype in sorted(ptf)]
+        data_files = self._sorted_chunk_iterator(chunks)
+        with ThreadPoolExecutor(self._max_workers) as executor:
+            for _, futures in self._prefetch(executor, data_files, fields):
+                for (ptype, _), future in futures.items():
+                    c = future.result()
+                    yield ptype, (c[:, 0], c[:, 1], c[:, 2]), 0.0
+
+    def _read_particle_fields(self, chunks, ptf, selector):
+        data_files = self._sorted_chunk_iterator(chunks)
+        with ThreadPoolExecutor(self._max_workers) as executor:
+            for masks, futures in self._prefetch_selected(
+                executor, data_files, ptf, selector
+            ):
+                for ptype, field_list in sorted(ptf.items()):
+                    if ptype not in masks:
+                        continue
+                    for field in field_list:
+                        data = futures[ptype, field].result()[masks[ptype], ...]
+                        yield (ptype, field), data
 
     def _count_particles(self, data_file):
         return self.ds.parameters["particle_count"][data_file.file_id]
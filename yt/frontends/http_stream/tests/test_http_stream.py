@@ -0,0 +1,154 @@
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pytest
+from numpy.testing import assert_equal
+
+from yt.testing import requires_module_pytest as requires_module
+
+NUM_FILES = 3
+NUM_PARTICLES = 1000
+
+
+def _make_catalog():
+    prng = np.random.RandomState(0x4D3D3D3)
+    fields = {}
+    for file_id in range(NUM_FILES):
+        fields[file_id, "io", "Coordinates"] = prng.random_sample((NUM_PARTICLES, 3))
+        fields[file_id, "io", "Mass"] = prng.random_sample(NUM_PARTICLES)
+    header = {
+        "domain_left_edge": [0.0, 0.0, 0.0],
+        "domain_right_edge": [1.0, 1.0, 1.0],
+        "current_time": 0.0,
+        "cosmological_simulation": 0,
+        "current_redshift": 0.0,
+        "omega_lambda": 0.0,
+        "omega_matter": 0.0,
+        "hubble_constant": 0.0,
+        "num_files": NUM_FILES,
+        "units": {"length": 1.0, "time": 1.0, "mass": 1.0},
+        "field_list": [["io", "Coordinates"], ["io", "Mass"]],
+        "particle_count": {str(i): {"io": NUM_PARTICLES} for i in range(NUM_FILES)},
+        "unique_identifier": "http_stream_test",
+    }
+    return header, fields
+
+
+class _CatalogHandler(BaseHTTPRequestHandler):
+    # A minimal stand-in for a particle catalog server, which honors
+    # byte-range requests.
+    header = None
+    fields = None
+    requests = None
+
+    def do_GET(self):
+        self.requests.append((self.path, self.headers.get("Range")))
+        if self.path == "/yt_index.json":
+            body = json.dumps(self.header).encode()
+        else:
+            file_id, ptype, fname = self.path.strip("/").split("/")
+            body = self.fields[int(file_id), ptype, fname].tobytes()
+        status = 200
+        rng = self.headers.get("Range")
+        if rng is not None:
+            body = body[int(rng[len("bytes=") :].rstrip("-")) :]
+            status = 206
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def catalog_server():
+    header, fields = _make_catalog()
+    handler = type(
+        "Handler",
+        (_CatalogHandler,),
+        {"header": header, "fields": fields, "requests": []},
+    )
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", fields, handler.requests
+    server.shutdown()
+    server.server_close()
+
+
+def _check_dataset(ds, fields):
+    ad = ds.all_data()
+    mass = np.concatenate([fields[i, "io", "Mass"] for i in range(NUM_FILES)])
+    pos = np.concatenate([fields[i, "io", "Coordinates"] for i in range(NUM_FILES)])
+    assert_equal(np.sort(ad["io", "Mass"].d), np.sort(mass))
+    assert_equal(np.sort(ad["io", "particle_position_x"].d), np.sort(pos[:, 0]))
+
+    sp = ds.sphere([0.5, 0.5, 0.5], 0.25)
+    r = np.sqrt(((pos - 0.5) ** 2).sum(axis=1))
+    assert_equal(np.sort(sp["io", "Mass"].d), np.sort(mass[r <= 0.25]))
+
+
+@requires_module("requests")
+def test_http_stream(catalog_server, tmp_path):
+    from yt.frontends.http_stream.api import HTTPStreamDataset
+
+    url, fields, _ = catalog_server
+    ds = HTTPStreamDataset(url, index_filename=str(tmp_path / "index.ewah"))
+    _check_dataset(ds, fields)
+    assert ds.index.io.total_bytes > 0
+
+
+@requires_module("requests")
+def test_http_stream_cache(catalog_server, tmp_path):
+    from yt.frontends.http_stream.api import HTTPStreamDataset
+
+    url, fields, requests = catalog_server
+    kwargs = {
+        "cache_dir": str(tmp_path / "cache"),
+        "index_filename": str(tmp_path / "index.ewah"),
+    }
+    ds = HTTPStreamDataset(url, **kwargs)
+    io = ds.index.io
+    data_file = ds.index.data_files[0]
+
+    # Leave a partial download behind, which should be resumed.
+    fn = io._open_cached_stream(f"{url}/0/io/Mass", (NUM_PARTICLES,)).filename
+    with open(fn, "rb") as fh:
+        head = fh.read(100)
+    with open(f"{fn}.part", "wb") as fh:
+        fh.write(head)
+    os.remove(fn)
+    del requests[:]
+    assert_equal(io._open_stream(data_file, ("io", "Mass")), fields[0, "io", "Mass"])
+    assert requests == [("/0/io/Mass", "bytes=100-")]
+
+    _check_dataset(ds, fields)
+    # Everything is now served from the local cache
+    del requests[:]
+    ds = HTTPStreamDataset(url, **kwargs)
+    _check_dataset(ds, fields)
+    assert requests == [("/yt_index.json", None)]
+
+
+@requires_module("requests")
+def test_http_stream_unselected_files(catalog_server, tmp_path):
+    from yt.frontends.http_stream.api import HTTPStreamDataset
+
+    url, _, requests = catalog_server
+    ds = HTTPStreamDataset(url, index_filename=str(tmp_path / "index.ewah"))
+    ad = ds.all_data()
+    ds.index._identify_base_chunk(ad)
+    chunks = list(ds.index._chunk_io(ad))
+    # A sphere far too small to hold any particle
+    sp = ds.sphere([0.5, 0.5, 0.5], 1e-12)
+    del requests[:]
+    rv = list(ds.index.io._read_particle_fields(chunks, {"io": ["Mass"]}, sp.selector))
+    assert rv == []
+    # Only the coordinates are fetched for files without selected particles
+    assert len(requests) == NUM_FILES
+    assert all(path.endswith("/Coordinates") for path, _ in requests)
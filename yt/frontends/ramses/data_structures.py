@@ -8,6 +8,7 @@ from pathlib import Path
 import numpy as np
 
 from yt.arraytypes import blankRecordArray
+from yt.config import ytcfg
 from yt.data_objects.index_subobjects.octree_subset import OctreeSubset
 from yt.data_objects.particle_filters import add_particle_filter
 from yt.data_objects.static_output import Dataset
@@ -703,11 +704,6 @@ class RAMSESIndex(OctreeIndex):
                 g = og
             yield YTDataChunk(dobj, "spatial", [g], None)
 
-    def _chunk_io(self, dobj, cache=True, local_only=False):
-        oobjs = getattr(dobj._current_chunk, "objs", dobj._chunk_info)
-        for subset in oobjs:
-            yield YTDataChunk(dobj, "io", [subset], None, cache=cache)
-
     def _initialize_level_stats(self):
         levels = sum(dom.level_count for dom in self.domains)
         desc = {"names": ["numcells", "level"], "formats": ["int64"] * 2}
@@ -800,6 +796,7 @@ class RAMSESDataset(Dataset):
         default_species_fields=None,
         self_shielding=None,
         use_conformal_time=None,
+        io_threads=None,
     ):
         # Here we want to initiate a traceback, if the reader is not built.
         if isinstance(fields, str):
@@ -820,6 +817,10 @@ class RAMSESDataset(Dataset):
         self_shielding:
         If set to True, assume gas is self-shielded above 0.01 mp/cm^3.
         This affects the fields related to cooling and the mean molecular weight.
+
+        io_threads:
+        Number of threads used to read the domain files concurrently.  If set
+        to None, the value of the ``io_threads`` configuration option is used.
         """
 
         self._fields_in_file = fields
@@ -828,6 +829,9 @@ class RAMSESDataset(Dataset):
         self._extra_particle_fields = extra_particle_fields
         self.force_cosmological = cosmological
         self._bbox = bbox
+        if io_threads is None:
+            io_threads = ytcfg.get("yt", "io_threads")
+        self.io_threads = int(io_threads)
 
         self._force_max_level = self._sanitize_max_level(
             max_level, max_level_convention
@@ -1,4 +1,5 @@
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from typing import TYPE_CHECKING, Union
 
@@ -177,11 +178,31 @@ def _ramses_particle_csv_file_handler(
 class IOHandlerRAMSES(BaseIOHandler):
     _dataset_type = "ramses"
 
+    def _map_domains(self, func, items):
+        # Yields func(item) for each of the items, in order.  With more than
+        # one I/O thread, the items (which each read a different domain file)
+        # are processed concurrently, with a bounded number of them in flight
+        # so that memory use stays under control.
+        nthreads = self.ds.io_threads
+        if nthreads <= 1:
+            for item in items:
+                yield func(item)
+            return
+        with ThreadPoolExecutor(nthreads) as executor:
+            queue = deque()
+            for item in items:
+                queue.append(executor.submit(func, item))
+                if len(queue) >= 2 * nthreads:
+                    yield queue.popleft().result()
+            while queue:
+                yield queue.popleft().result()
+
     def _read_fluid_selection(self, chunks, selector, fields, size):
         tr = defaultdict(list)
 
         # Set of field types
         ftypes = {f[0] for f in fields}
+        tasks = []
         for chunk in chunks:
             # Gather fields by type to minimize i/o operations
             for ft in ftypes:
@@ -200,24 +221,34 @@ class IOHandlerRAMSES(BaseIOHandler):
                     if fname is None:
                         raise YTFieldTypeNotFound(ft)
 
-                    # Now we read the entire thing
-                    with FortranFile(fname) as fd:
-                        # This contains the boundary information, so we skim through
-                        # and pick off the right vectors
-                        rv = subset.fill(fd, field_subs, selector, file_handler)
-                    for ft, f in field_subs:
-                        d = rv.pop(f)
-                        if d.size == 0:
-                            continue
-                        mylog.debug(
-                            "Filling %s with %s (%0.3e %0.3e) (%s zones)",
-                            f,
-                            d.size,
-                            d.min(),
-                            d.max(),
-                            d.size,
-                        )
-                        tr[ft, f].append(d)
+                    tasks.append((subset, field_subs, file_handler))
+
+        def fill(task):
+            subset, field_subs, file_handler = task
+            # Now we read the entire thing
+            with FortranFile(file_handler.fname) as fd:
+                # This contains the boundary information, so we skim through
+                # and pick off the right vectors
+                return subset.fill(fd, field_subs, selector, file_handler)
+
+        # Results come back in the order of the tasks, so that the
+        # concatenated fields do not depend on the number of threads.
+        for (_, field_subs, _), rv in zip(
+            tasks, self._map_domains(fill, tasks), strict=True
+        ):
+            for ft, f in field_subs:
+                d = rv.pop(f)
+                if d.size == 0:
+                    continue
+                mylog.debug(
+                    "Filling %s with %s (%0.3e %0.3e) (%s zones)",
+                    f,
+                    d.size,
+                    d.min(),
+                    d.max(),
+                    d.size,
+                )
+                tr[ft, f].append(d)
         d = {}
         for field in fields:
             tmp = tr.pop(field, None)
@@ -232,19 +263,20 @@ class IOHandlerRAMSES(BaseIOHandler):
             for ptype, field_list in ptf.items()
             for ax in "xyz"
         ]
-        for chunk in chunks:
-            for subset in chunk.objs:
-                rv = self._read_particle_subset(subset, fields)
-                for ptype in sorted(ptf):
-                    yield (
-                        ptype,
-                        (
-                            rv[ptype, pn % "x"],
-                            rv[ptype, pn % "y"],
-                            rv[ptype, pn % "z"],
-                        ),
-                        0.0,
-                    )
+        subsets = [subset for chunk in chunks for subset in chunk.objs]
+        for rv in self._map_domains(
+            lambda subset: self._read_particle_subset(subset, fields), subsets
+        ):
+            for ptype in sorted(ptf):
+                yield (
+                    ptype,
+                    (
+                        rv[ptype, pn % "x"],
+                        rv[ptype, pn % "y"],
+                        rv[ptype, pn % "z"],
+                    ),
+                    0.0,
+                )
 
     def _read_particle_fields(self, chunks, ptf, selector):
         pn = "particle_position_%s"
@@ -271,19 +303,20 @@ class IOHandlerRAMSES(BaseIOHandler):
                         yield (ptype, field), data
 
             else:
-                for chunk in chunks:
-                    for subset in chunk.objs:
-                        rv = self._read_particle_subset(subset, fields)
-                        for ptype, field_list in sorted(ptf.items()):
-                            x, y, z = (
-                                np.asarray(rv[ptype, pn % ax], "=f8") for ax in "xyz"
-                            )
-                            mask = selector.select_points(x, y, z, 0.0)
-                            if mask is None:
-                                mask = []
-                            for field in field_list:
-                                data = np.asarray(rv.pop((ptype, field))[mask], "=f8")
-                                yield (ptype, field), data
+                subsets = [subset for chunk in chunks for subset in chunk.objs]
+                for rv in self._map_domains(
+                    lambda subset: self._read_particle_subset(subset, fields), subsets
+                ):
+                    for ptype, field_list in sorted(ptf.items()):
+                        x, y, z = (
+                            np.asarray(rv[ptype, pn % ax], "=f8") for ax in "xyz"
+                        )
+                        mask = selector.select_points(x, y, z, 0.0)
+                        if mask is None:
+                            mask = []
+                        for field in field_list:
+                            data = np.asarray(rv.pop((ptype, field))[mask], "=f8")
+                            yield (ptype, field), data
 
     def _read_particle_subset(self, subset, fields):
         """Read the particle files."""
@@ -812,3 +812,22 @@ def test_order_does_not_matter():
             _sp1 = ds1.all_data()
 
         sp0["gas", "velocity_x"].max().to("km/s")
+
+
+@requires_file(output_00080)
+def test_threaded_io():
+    ds_serial = yt.load(output_00080, io_threads=1)
+    ds_threaded = yt.load(output_00080, io_threads=4)
+    assert ds_threaded.io_threads == 4
+
+    fields = [
+        ("gas", "density"),
+        ("ramses", "x-velocity"),
+        ("io", "particle_mass"),
+        ("io", "particle_position_x"),
+    ]
+    for ds_args in (("c", 0.1), ("c", 0.3)):
+        sp_serial = ds_serial.sphere(*ds_args)
+        sp_threaded = ds_threaded.sphere(*ds_args)
+        for field in fields:
+            assert_equal(sp_threaded[field], sp_serial[field])
@@ -3,7 +3,7 @@ import os
 import numpy as np
 
 from yt.data_objects.static_output import ParticleDataset
-from yt.funcs import mylog
+from yt.funcs import ensure_numpy_array, iter_fields, mylog
 from yt.geometry.particle_geometry_handler import ParticleIndex
 
 
@@ -142,3 +142,65 @@ class SPHParticleIndex(ParticleIndex):
         self._generate_kdtree(fname)
 
         return self._kdtree
+
+    def _find_field_values_at_points(self, fields, coords):
+        r"""Find the value of fields at a set of coordinates.
+
+        The fields are interpolated at all of the points at once with the
+        SPH gather approach, reading every field in a single pass over the
+        particles.  Returns the values [field1, field2,...] of the fields at
+        the given (x, y, z) points.
+        """
+        from yt.geometry.coordinates.cartesian_coordinates import all_data
+        from yt.utilities.lib.pixelization_routines import (
+            interpolate_sph_positions_gather,
+        )
+
+        coords = self.ds.arr(ensure_numpy_array(coords), "code_length")
+        coords = np.ascontiguousarray(coords.reshape(-1, 3).d, dtype="float64")
+        fields = list(iter_fields(fields))
+        # The kdtree is only built over the first SPH particle type
+        ptype = self.ds._sph_ptypes[0]
+        fnames = []
+        for field in fields:
+            finfo = self.ds._get_field_info(field)
+            ftype, fname = finfo.alias_name if finfo.is_alias else finfo.name
+            if ftype not in (ptype, "gas"):
+                raise KeyError(f"{ftype} is not a SPH particle type!")
+            fnames.append(fname)
+
+        fields_to_get = [
+            "particle_position",
+            "density",
+            "particle_mass",
+            "smoothing_length",
+        ] + fnames
+        all_fields = all_data(self.ds, ptype, fields_to_get, kdtree=True)
+        normalize = getattr(self.ds, "use_sph_normalization", True)
+        # There cannot be more neighbors than particles
+        num_neighbors = min(
+            getattr(self.ds, "num_neighbors", 32), all_fields["particle_mass"].size
+        )
+        kernel_name = getattr(self.ds, "kernel_name", "cubic")
+
+        out = []
+        for field, fname in zip(fields, fnames, strict=True):
+            units = self.ds._get_field_info(field).units
+            buff = np.zeros(coords.shape[0], dtype="float64")
+            interpolate_sph_positions_gather(
+                buff,
+                all_fields["particle_position"],
+                coords,
+                all_fields["smoothing_length"],
+                all_fields["particle_mass"],
+                all_fields["density"],
+                all_fields[fname].in_units(units),
+                self.kdtree,
+                use_normalization=normalize,
+                kernel_name=kernel_name,
+                num_neigh=num_neighbors,
+            )
+            out.append(self.ds.arr(buff, units))
+        if len(fields) == 1:
+            return out[0]
+        return out
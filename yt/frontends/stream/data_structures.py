@@ -11,6 +11,7 @@ import numpy as np
 from more_itertools import always_iterable
 
 from yt._typing import AxisOrder, FieldKey
+from yt.config import ytcfg
 from yt.data_objects.field_data import YTFieldData
 from yt.data_objects.index_subobjects.grid_patch import AMRGridPatch
 from yt.data_objects.index_subobjects.octree_subset import OctreeSubset
@@ -25,7 +26,7 @@ from yt.frontends.sph.data_structures import SPHParticleIndex
 from yt.funcs import setdefaultattr
 from yt.geometry.api import Geometry
 from yt.geometry.geometry_handler import Index, YTDataChunk
-from yt.geometry.grid_geometry_handler import GridIndex
+from yt.geometry.grid_geometry_handler import GridIndex, LazyGridArray
 from yt.geometry.oct_container import OctreeContainer
 from yt.geometry.oct_geometry_handler import OctreeIndex
 from yt.geometry.unstructured_mesh_handler import UnstructuredIndex
@@ -163,6 +164,7 @@ class StreamHierarchy(GridIndex):
         self.stream_handler = ds.stream_handler
         self.float_type = "float64"
         self.directory = os.getcwd()
+        self._lazy_grids = ytcfg.get("yt", "lazy_grid_objects")
         GridIndex.__init__(self, ds, dataset_type)
 
     def _count_grids(self):
@@ -201,6 +203,9 @@ class StreamHierarchy(GridIndex):
             self.grid = StreamStretchedGrid
         else:
             self.grid_cell_widths = None
+        if self._lazy_grids:
+            self._parse_lazy_index()
+            return
         mylog.debug("Copying reverse tree")
         self.grids = []
         # We enumerate, so it's 0-indexed id and 1-indexed pid
@@ -232,6 +237,45 @@ class StreamHierarchy(GridIndex):
         self.grids = temp_grids
         mylog.debug("Prepared")
 
+    def _parse_lazy_index(self):
+        # Grid objects are only created when they are first accessed, and are
+        # linked together through the grid arrays rather than one another.
+        if self.stream_handler.parent_ids is None:
+            mylog.debug("Reconstructing parent-child relationships")
+            self.stream_handler.parent_ids = self._find_parent_ids()
+        self.grid_parent_ids = np.asarray(self.stream_handler.parent_ids, "int64")
+        self._setup_grid_links()
+        self._clamp_grid_edges()
+        self.max_level = self.grid_levels.max()
+        self.grids = LazyGridArray(self.num_grids, self._create_grid)
+
+    def _find_parent_ids(self):
+        parent_ids = np.zeros(self.num_grids, "int64") - 1
+        mask = np.empty(self.num_grids, dtype="int32")
+        for i in range(self.num_grids):
+            get_box_grids_level(
+                self.grid_left_edge[i, :],
+                self.grid_right_edge[i, :],
+                self.grid_levels[i].item() + 1,
+                self.grid_left_edge,
+                self.grid_right_edge,
+                self.grid_levels,
+                mask,
+            )
+            parent_ids[mask.astype("bool")] = i
+        return parent_ids
+
+    def _create_grid(self, i):
+        grid = self.grid(i, self)
+        grid.Level = self.grid_levels[i, 0]
+        grid._parent_id = int(self.grid_parent_ids[i])
+        grid._children_ids = self._get_grid_children(i).tolist()
+        grid.filename = None
+        grid._prepare_grid()
+        grid._setup_dx()
+        grid.proc_num = self.grid_procs[i]
+        return grid
+
     def _reconstruct_parent_child(self):
         mask = np.empty(len(self.grids), dtype="int32")
         mylog.debug("First pass; identifying child grids")
@@ -270,8 +314,9 @@ class StreamHierarchy(GridIndex):
         self.field_list = list(fl)
 
     def _populate_grid_objects(self):
-        for g in self.grids:
-            g._setup_dx()
+        if not self._lazy_grids:
+            for g in self.grids:
+                g._setup_dx()
         self.max_level = self.grid_levels.max()
 
     def _setup_data_io(self):
@@ -282,7 +327,7 @@ class StreamHierarchy(GridIndex):
 
     def _reset_particle_count(self):
         self.grid_particle_count[:] = self.stream_handler.particle_count
-        for i, grid in enumerate(self.grids):
+        for i, grid in self._loaded_grids():
             grid.NumberOfParticles = self.grid_particle_count[i, 0]
 
     def update_data(self, data):
@@ -906,11 +951,6 @@ class StreamOctreeHandler(OctreeIndex):
                 g = og
             yield YTDataChunk(dobj, "spatial", [g])
 
-    def _chunk_io(self, dobj, cache=True, local_only=False):
-        oobjs = getattr(dobj._current_chunk, "objs", dobj._chunk_info)
-        for subset in oobjs:
-            yield YTDataChunk(dobj, "io", [subset], None, cache=cache)
-
     def _setup_classes(self):
         dd = self._get_data_reader_dict()
         super()._setup_classes(dd)
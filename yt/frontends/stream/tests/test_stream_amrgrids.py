@@ -1,7 +1,9 @@
 import numpy as np
-from numpy.testing import assert_raises
+from numpy.testing import assert_equal, assert_raises
 
 from yt import ProjectionPlot, load_amr_grids
+from yt.config import ytcfg
+from yt.testing import fake_amr_ds
 from yt.utilities.exceptions import YTIllDefinedAMR, YTIntDomainOverflow
 
 
@@ -82,3 +84,34 @@ def test_validation():
         )
 
     assert_raises(YTIllDefinedAMR, load_grids)
+
+
+def test_lazy_grid_objects():
+    fields = [("gas", "density"), ("index", "ones")]
+    ds = fake_amr_ds(fields=fields[:1], units=["g/cm**3"])
+    old_value = ytcfg["yt", "lazy_grid_objects"]
+    ytcfg["yt", "lazy_grid_objects"] = True
+    try:
+        ds_lazy = fake_amr_ds(fields=fields[:1], units=["g/cm**3"])
+        index = ds_lazy.index
+        assert_equal(index.grid_left_edge, ds.index.grid_left_edge)
+        assert_equal(index.grid_right_edge, ds.index.grid_right_edge)
+        # Only the grids a selection touches (and their parents) are created
+        sp = ds_lazy.sphere([0.1, 0.1, 0.1], 0.05)
+        sp_ref = ds.sphere([0.1, 0.1, 0.1], 0.05)
+        for field in fields:
+            assert_equal(sp[field], sp_ref[field])
+        assert 0 < len(list(index.grids.loaded())) < index.num_grids
+        for i, g in index.grids.loaded():
+            g_ref = ds.index.grids[i]
+            assert_equal(g.id, g_ref.id)
+            assert_equal(g.Level, g_ref.Level)
+            assert_equal(g._parent_id, g_ref._parent_id)
+            assert_equal(sorted(g._children_ids), sorted(g_ref._children_ids))
+            assert_equal(g.dds, g_ref.dds)
+        ad, ad_ref = ds_lazy.all_data(), ds.all_data()
+        for field in fields:
+            assert_equal(ad[field], ad_ref[field])
+        assert_equal(index.get_smallest_dx(), ds.index.get_smallest_dx())
+    finally:
+        ytcfg["yt", "lazy_grid_objects"] = old_value
@@ -728,6 +728,11 @@ class YTNonspatialHierarchy(YTDataHierarchy):
         fields_to_return = self.io._read_fluid_selection(dobj, selector, fields_to_read)
         return fields_to_return, fields_to_generate
 
+    def _get_prefetch_fields(self, dobj, fields):
+        # Non-spatial data are read whole, with particle fields going through
+        # _read_fluid_fields as well, so there is nothing to prefetch.
+        return [], []
+
 
 class YTNonspatialDataset(YTGridDataset):
     """Dataset for general array data."""
@@ -231,8 +231,13 @@ class IOHandlerYTDataContainerHDF5(BaseIOHandler):
                         continue
 
                 for field in field_list:
-                    data = f[ptype][field][mask].astype("float64", copy=False)
-                    data_return[ptype, field] = data
+                    if isinstance(mask, slice):
+                        data = f[ptype][field][mask]
+                    else:
+                        data = _read_selected_chunks(
+                            f[ptype][field], data_file.start, mask
+                        )
+                    data_return[ptype, field] = data.astype("float64", copy=False)
 
         return data_return
 
@@ -311,6 +316,33 @@ def _get_position_array(ptype, f, ax, index_mask=None):
     return f[ptype][pos_name + ax][index_mask].astype("float64")
 
 
+def _read_selected_chunks(dataset, start, mask):
+    """
+    Read the elements of *dataset* selected by the boolean *mask*, which
+    starts at element *start*, touching only the HDF5 chunks that contain
+    selected elements.  For unchunked datasets, only the range spanning the
+    selected elements is read.
+    """
+    start = start or 0
+    selected = np.flatnonzero(mask)
+    if selected.size == 0:
+        return dataset[:0]
+    if dataset.chunks is None:
+        lo, hi = selected[0], selected[-1] + 1
+        return dataset[start + lo : start + hi][mask[lo:hi]]
+    # Group the chunks holding selected elements into contiguous runs so that
+    # each run is read with a single hyperslab selection.
+    rows = dataset.chunks[0]
+    chunk_ids = np.unique((selected + start) // rows)
+    breaks = np.flatnonzero(np.diff(chunk_ids) > 1) + 1
+    data = []
+    for run in np.split(chunk_ids, breaks):
+        lo = max(run[0] * rows - start, 0)
+        hi = min((run[-1] + 1) * rows - start, mask.size)
+        data.append(dataset[start + lo : start + hi][mask[lo:hi]])
+    return np.concatenate(data)
+
+
 def _get_position_array_units(ptype, f, ax):
     if ptype == "grid":
         pos_name = ""
@@ -3,8 +3,9 @@ import shutil
 import tempfile
 
 import numpy as np
-from numpy.testing import assert_array_equal
+from numpy.testing import assert_array_equal, assert_raises
 
+from yt.frontends.ytdata.utilities import save_as_dataset
 from yt.loaders import load, load_uniform_grid
 from yt.testing import (
     assert_fname,
@@ -12,6 +13,7 @@ from yt.testing import (
     requires_file,
     requires_module,
 )
+from yt.units.yt_array import YTArray
 from yt.utilities.answer_testing.framework import data_dir_load
 from yt.visualization.plot_window import ProjectionPlot, SlicePlot
 
@@ -129,3 +131,86 @@ def test_non_square_frb():
     os.chdir(curdir)
     if tmpdir != ".":
         shutil.rmtree(tmpdir)
+
+
+@requires_module("h5py")
+def test_streamed_container_dataset():
+    from yt.utilities.on_demand_imports import _h5py as h5py
+
+    tmpdir = tempfile.mkdtemp()
+    curdir = os.getcwd()
+    os.chdir(tmpdir)
+
+    ds = fake_random_ds(32, nprocs=8)
+    sp = ds.sphere(ds.domain_center, 0.3)
+    fields = [("gas", "density"), ("gas", "velocity_x")]
+    fn = sp.save_as_dataset(fields=fields)
+
+    # the fields are written in compressed, chunked datasets
+    with h5py.File(fn, mode="r") as f:
+        dset = f["grid"]["density"]
+        assert dset.chunks is not None
+        assert dset.compression == "gzip"
+        assert dset.shuffle
+        assert f["grid"].attrs["num_elements"] == sp["gas", "density"].size
+
+    sp_ds = load(fn)
+    for field in fields:
+        assert_array_equal(np.sort(sp[field]), np.sort(sp_ds.data[field]))
+
+    # selective reads only need the chunks holding the selected elements
+    sub = ds.sphere(ds.domain_center, 0.1)
+    sub_ds = sp_ds.sphere(sp_ds.domain_center, 0.1)
+    for field in fields:
+        assert_array_equal(np.sort(sub[field].d), np.sort(sub_ds["grid", field[1]].d))
+
+    os.chdir(curdir)
+    if tmpdir != ".":
+        shutil.rmtree(tmpdir)
+
+
+@requires_module("h5py")
+def test_covering_grid_dataset():
+    tmpdir = tempfile.mkdtemp()
+    curdir = os.getcwd()
+    os.chdir(tmpdir)
+
+    # covering grids have no selector, so their fields are not streamed
+    ds = fake_random_ds(16, nprocs=8)
+    cg = ds.covering_grid(level=0, left_edge=[0.25] * 3, dims=[8] * 3)
+    fields = [("gas", "density"), ("gas", "velocity_x")]
+    fn = cg.save_as_dataset(fields=fields)
+    cg_ds = load(fn)
+    for field in fields:
+        assert_array_equal(cg[field], cg_ds.data[field])
+
+    os.chdir(curdir)
+    if tmpdir != ".":
+        shutil.rmtree(tmpdir)
+
+
+@requires_module("h5py")
+def test_streamed_pieces_units():
+    tmpdir = tempfile.mkdtemp()
+    curdir = os.getcwd()
+    os.chdir(tmpdir)
+
+    # later pieces are converted to the units of the first one
+    pieces = [
+        {"length": YTArray(np.ones(4), "cm")},
+        {"length": YTArray(np.ones(4), "m")},
+    ]
+    fn = save_as_dataset({}, "pieces.h5", pieces)
+    new_ds = load(fn)
+    length = new_ds.data["data", "length"]
+    assert str(length.units) == "cm"
+    assert_array_equal(length.d, [1.0] * 4 + [100.0] * 4)
+
+    # pieces that cannot be stored in the same units are rejected
+    for second in [YTArray(np.ones(4), "g"), np.ones(4)]:
+        pieces = [{"length": YTArray(np.ones(4), "cm")}, {"length": second}]
+        assert_raises(ValueError, save_as_dataset, {}, "bad.h5", pieces)
+
+    os.chdir(curdir)
+    if tmpdir != ".":
+        shutil.rmtree(tmpdir)
@@ -1,3 +1,9 @@
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from unyt.exceptions import UnitConversionError
+
 from yt.units.yt_array import YTArray
 from yt.utilities.logger import ytLogger as mylog
 from yt.utilities.on_demand_imports import _h5py as h5py
@@ -19,8 +25,11 @@ def save_as_dataset(ds, filename, data, field_types=None, extra_attrs=None):
         parameters.
     filename : str
         The name of the file to be written.
-    data : dict
-        A dictionary of field arrays to be saved.
+    data : dict or iterable of dicts
+        A dictionary of field arrays to be saved.  If an iterable of
+        dictionaries is given, their arrays are appended to the fields
+        one dictionary at a time, so that the fields never have to be
+        held in memory all at once.
     field_types: dict, optional
         A dictionary denoting the group name to which each field is to
         be saved. When the resulting dataset is reloaded, this will be
@@ -125,28 +134,166 @@ def save_as_dataset(ds, filename, data, field_types=None, extra_attrs=None):
     if "data_type" not in extra_attrs:
         fh.attrs["data_type"] = "yt_array_data"
 
-    for field in data:
-        if field_types is None:
-            field_type = "data"
-        else:
-            field_type = field_types[field]
-        if field_type not in fh:
-            fh.create_group(field_type)
+    if isinstance(data, dict):
+        data = [data]
+    writers = {}
+    # Compression happens outside of hdf5, concurrently for all of the
+    # chunks that are ready to be written.
+    with ThreadPoolExecutor() as executor:
+        for chunk in data:
+            jobs = []
+            for field, values in chunk.items():
+                if field not in writers:
+                    if field_types is None:
+                        field_type = "data"
+                    else:
+                        field_type = field_types[field]
+                    if field_type not in fh:
+                        fh.create_group(field_type)
+
+                    if isinstance(field, tuple):
+                        field_name = field[1]
+                    else:
+                        field_name = field
+                    writers[field] = _FieldWriter(fh[field_type], str(field_name))
+                writers[field].append(values)
+                jobs.extend(writers[field].flush(executor))
+            _write_chunks(jobs)
+        jobs = []
+        for writer in writers.values():
+            jobs.extend(writer.flush(executor, final=True))
+        _write_chunks(jobs)
+
+    for writer in writers.values():
+        dataset = writer.close()
+        if "num_elements" not in writer.group.attrs:
+            writer.group.attrs["num_elements"] = dataset.size
+    fh.close()
+    return filename
 
-        if isinstance(field, tuple):
-            field_name = field[1]
-        else:
-            field_name = field
 
+# The target size of the hdf5 chunks of saved fields, in bytes
+_chunk_bytes = 1 << 20
+_compression_level = 4
+
+
+class _FieldWriter:
+    r"""Append arrays to a resizable, chunked and compressed hdf5 dataset.
+
+    Arrays are buffered until they fill whole hdf5 chunks.  These are
+    then passed through the shuffle and deflate filters of the dataset
+    by hand, so that they can be compressed concurrently, and written
+    directly into the file.
+    """
+
+    def __init__(self, group, name):
+        self.group = group
+        self.name = name
+        self.dataset = None
+        self.units = None
+        # rows appended, and rows handed off to be written
+        self.size = 0
+        self._flushed = 0
+        self._buffer = []
+        self._last = None
+
+    def append(self, data):
+        units = ""
+        if isinstance(data, YTArray) and not data.units.is_dimensionless:
+            units = str(data.units)
+        if self.units is None:
+            self.units = units
+        elif units != self.units:
+            # Later pieces are stored in the units of the first one
+            msg = (
+                f"Cannot append data with units '{units}' to field "
+                f"'{self.name}' with units '{self.units}'."
+            )
+            if not (units and self.units):
+                raise ValueError(msg)
+            try:
+                data = data.to(self.units)
+            except UnitConversionError as e:
+                raise ValueError(msg) from e
+        data = np.asarray(data)
         # for python3
-        if data[field].dtype.kind == "U":
-            data[field] = data[field].astype("|S")
+        if data.dtype.kind == "U":
+            data = data.astype("|S")
+        self._last = data
+        if data.ndim == 0 or data.size == 0:
+            return
+        if self.dataset is None:
+            rows = max(1, _chunk_bytes // data[:1].nbytes)
+            self.dataset = self.group.create_dataset(
+                self.name,
+                shape=(0,) + data.shape[1:],
+                maxshape=(None,) + data.shape[1:],
+                dtype=data.dtype,
+                chunks=(rows,) + data.shape[1:],
+                compression="gzip",
+                compression_opts=_compression_level,
+                shuffle=True,
+            )
+        self._buffer.append(data.astype(self.dataset.dtype, copy=False))
+        self.size += data.shape[0]
+
+    def flush(self, executor, final=False):
+        r"""Submit the compression of all of the whole chunks buffered.
+
+        If final is True, the remainder is submitted as a last partial
+        chunk.  Returns a list of (writer, offset, future) jobs.
+        """
+        if self.dataset is None:
+            return []
+        rows = self.dataset.chunks[0]
+        pending = self.size - self._flushed
+        if pending == 0 or (pending < rows and not final):
+            return []
+        data = np.concatenate(self._buffer)
+        if final:
+            count = pending
+        else:
+            count = pending - pending % rows
+        jobs = []
+        for start in range(0, count, rows):
+            chunk = data[start : start + rows]
+            future = executor.submit(_compress_chunk, chunk, rows)
+            jobs.append((self, self._flushed + start, future))
+        self._buffer = [data[count:]]
+        self._flushed += count
+        return jobs
+
+    def write(self, offset, chunk):
+        if self.dataset.shape[0] < self.size:
+            self.dataset.resize(self.size, axis=0)
+        offsets = (offset,) + (0,) * (self.dataset.ndim - 1)
+        self.dataset.id.write_direct_chunk(offsets, chunk)
+
+    def close(self):
+        if self.dataset is None:
+            # Scalars, and fields without any element, are not chunked
+            self.dataset = self.group.create_dataset(self.name, data=self._last)
+        else:
+            self.dataset.resize(self.size, axis=0)
+        self.dataset.attrs["units"] = self.units
+        return self.dataset
 
-        _yt_array_hdf5(fh[field_type], field_name, data[field])
-        if "num_elements" not in fh[field_type].attrs:
-            fh[field_type].attrs["num_elements"] = data[field].size
-    fh.close()
-    return filename
+
+def _compress_chunk(chunk, rows):
+    # hdf5 stores the chunks at the edge of the dataset whole
+    if chunk.shape[0] < rows:
+        full = np.zeros((rows,) + chunk.shape[1:], dtype=chunk.dtype)
+        full[: chunk.shape[0]] = chunk
+        chunk = full
+    chunk = np.ascontiguousarray(chunk)
+    # The shuffle filter groups the n-th bytes of all of the elements
+    shuffled = chunk.view(np.uint8).reshape(-1, chunk.dtype.itemsize).T
+    return zlib.compress(shuffled.tobytes(), _compression_level)
+
+
+def _write_chunks(jobs):
+    for writer, offset, future in jobs:
+        writer.write(offset, future.result())
 
 
 def _hdf5_yt_array(fh, field, ds=None):
@@ -183,36 +330,6 @@ def _hdf5_yt_array(fh, field, ds=None):
     return new_arr(fh[field][()], units)
 
 
-def _yt_array_hdf5(fh, field, data):
-    r"""Save a YTArray to an open hdf5 file or group.
-
-    Save a YTArray to an open hdf5 file or group, and save the
-    units to a "units" attribute.
-
-    Parameters
-    ----------
-    fh : an open hdf5 file or hdf5 group
-        The hdf5 file or group to which the data will be written.
-    field : str
-        The name of the field to be saved.
-    data : YTArray
-        The data array to be saved.
-
-    Returns
-    -------
-    dataset : hdf5 dataset
-        The created hdf5 dataset.
-
-    """
-
-    dataset = fh.create_dataset(str(field), data=data)
-    units = ""
-    if isinstance(data, YTArray):
-        units = str(data.units)
-    dataset.attrs["units"] = units
-    return dataset
-
-
 def _yt_array_hdf5_attr(fh, attr, val):
     r"""Save a YTArray or YTQuantity as an hdf5 attribute.
 
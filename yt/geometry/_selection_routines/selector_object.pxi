@@ -517,7 +517,7 @@ cdef class SelectorObject:
         cdef np.float64_t right_edge[3]
         cdef np.float64_t dds[3]
         cdef int dim[3]
-        cdef int this_level = 0, level, i
+        cdef int this_level = 0, level, i, j, k
         cdef np.float64_t pos[3]
         level = data.grid.level
         if level < self.min_level or level > self.max_level:
@@ -531,15 +531,18 @@ cdef class SelectorObject:
             dds[i] = (right_edge[i] - left_edge[i])/data.grid.dims[i]
             dim[i] = data.grid.dims[i]
         with nogil:
-            pos[0] = left_edge[0] + dds[0] * 0.5
+            # Cell centers are computed the same way as in
+            # fill_mask_selector_regular_grid so that visiting a grid gives
+            # exactly the same selection as masking it.
             data.pos[0] = 0
             for i in range(dim[0]):
-                pos[1] = left_edge[1] + dds[1] * 0.5
+                pos[0] = left_edge[0] + (i + 0.5) * dds[0]
                 data.pos[1] = 0
                 for j in range(dim[1]):
-                    pos[2] = left_edge[2] + dds[2] * 0.5
+                    pos[1] = left_edge[1] + (j + 0.5) * dds[1]
                     data.pos[2] = 0
                     for k in range(dim[2]):
+                        pos[2] = left_edge[2] + (k + 0.5) * dds[2]
                         # We short-circuit if we have a cache; if we don't, we
                         # only set selected to true if it's *not* masked by a
                         # child and it *is* selected.
@@ -557,11 +560,8 @@ cdef class SelectorObject:
                                 selected = 0
                         func(data, selected)
                         data.global_index += 1
-                        pos[2] += dds[2]
                         data.pos[2] += 1
-                    pos[1] += dds[1]
                     data.pos[1] += 1
-                pos[0] += dds[0]
                 data.pos[0] += 1
 
     @cython.boundscheck(False)
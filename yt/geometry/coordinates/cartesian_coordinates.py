@@ -8,6 +8,7 @@ from yt.utilities.lib.pixelization_routines import (
     interpolate_sph_grid_gather,
     normalization_2d_utility,
     pixelize_cartesian,
+    pixelize_cartesian_multi,
     pixelize_cartesian_nodal,
     pixelize_element_mesh,
     pixelize_element_mesh_line,
@@ -22,6 +23,7 @@ from yt.utilities.nodal_data_utils import get_nodal_data
 from .coordinate_handler import (
     CoordinateHandler,
     _get_coord_fields,
+    _get_pixelization_data,
     _get_vert_fields,
     cartesian_to_cylindrical,
     cylindrical_to_cartesian,
@@ -249,6 +251,88 @@ class CartesianCoordinateHandler(CoordinateHandler):
         else:
             return buff
 
+    def pixelize_multi(
+        self,
+        dimension,
+        data_source,
+        fields,
+        bounds,
+        size,
+        antialias=True,
+        periodic=True,
+    ):
+        # The fields pixelize would hand to pixelize_cartesian are pixelized
+        # together, in a single pass over the cells of data_source.
+        batched = [
+            field
+            for field in fields
+            if self._is_cartesian_pixelized(data_source, field, dimension)
+        ]
+        if len(batched) < 2:
+            batched = []
+        images = {}
+        if batched:
+            buff = np.full((size[1], size[0], len(batched)), np.nan, dtype="float64")
+            data = np.stack(
+                [_get_pixelization_data(data_source, field) for field in batched],
+                axis=1,
+            )
+            period2 = self.period[:2].copy()  # dummy here
+            period2[0] = self.period[self.x_axis[dimension]]
+            period2[1] = self.period[self.y_axis[dimension]]
+            if hasattr(period2, "in_units"):
+                period2 = period2.in_units("code_length").d
+            mask = pixelize_cartesian_multi(
+                buff,
+                data_source["px"],
+                data_source["py"],
+                data_source["pdx"],
+                data_source["pdy"],
+                data,
+                bounds,
+                int(antialias),
+                period2,
+                int(periodic),
+                return_mask=True,
+            )
+            del data
+            for i, field in enumerate(batched):
+                images[field] = (np.ascontiguousarray(buff[:, :, i]), mask.copy())
+        for field in fields:
+            if field not in images:
+                images[field] = self.pixelize(
+                    dimension,
+                    data_source,
+                    field,
+                    bounds,
+                    size,
+                    antialias,
+                    periodic,
+                    return_mask=True,
+                )
+        return [images[field] for field in fields]
+
+    def _is_cartesian_pixelized(self, data_source, field, dimension):
+        # Whether pixelize hands field to pixelize_cartesian
+        from yt.frontends.sph.data_structures import ParticleDataset
+        from yt.frontends.stream.data_structures import StreamParticlesDataset
+
+        index = data_source.ds.index
+        if hasattr(index, "meshes") and not isinstance(
+            index.meshes[0], SemiStructuredMesh
+        ):
+            return False
+        if self.axis_id.get(dimension, dimension) is None:
+            return False
+        field = data_source._determine_fields(field)[0]
+        finfo = data_source.ds._get_field_info(field)
+        if np.any(finfo.nodal_flag):
+            return False
+        particle_datasets = (ParticleDataset, StreamParticlesDataset)
+        return not (
+            isinstance(data_source.ds, particle_datasets) and finfo.is_sph_field
+        )
+
     def pixelize_line(self, field, start_point, end_point, npoints):
         """
         Method for sampling datasets along a line in preparation for
@@ -657,7 +741,7 @@ class CartesianCoordinateHandler(CoordinateHandler):
                 data_source["py"],
                 data_source["pdx"],
                 data_source["pdy"],
-                data_source[field],
+                _get_pixelization_data(data_source, field),
                 bounds,
                 int(antialias),
                 period2,
@@ -789,7 +873,7 @@ class CartesianCoordinateHandler(CoordinateHandler):
                 data_source.center,
                 data_source._inv_mat,
                 indices,
-                data_source[field],
+                _get_pixelization_data(data_source, field),
                 bounds,
             )
         return buff, mask
@@ -16,6 +16,12 @@ def _unknown_coord(field, data):
     raise YTCoordinateNotImplemented
 
 
+def _get_pixelization_data(data_source, field):
+    # The pixelization routines work in double precision, whatever the
+    # precision the field was read in.
+    return np.asarray(data_source[field], dtype="float64")
+
+
 def _get_coord_fields(axi, units="code_length"):
     def _dds(field, data):
         rv = data.ds.arr(data.fwidth[..., axi].copy(), units)
@@ -193,6 +199,35 @@ class CoordinateHandler(abc.ABC):
         # pixelizer
         pass
 
+    def pixelize_multi(
+        self,
+        dimension,
+        data_source,
+        fields,
+        bounds,
+        size,
+        antialias=True,
+        periodic=True,
+    ):
+        """
+        Pixelizes several fields of data_source, returning a list of the
+        image and mask of each.  Coordinate handlers that can pixelize several
+        fields at once override this.
+        """
+        return [
+            self.pixelize(
+                dimension,
+                data_source,
+                field,
+                bounds,
+                size,
+                antialias,
+                periodic,
+                return_mask=True,
+            )
+            for field in fields
+        ]
+
     @abc.abstractmethod
     def pixelize_line(self, field, start_point, end_point, npoints):
         pass
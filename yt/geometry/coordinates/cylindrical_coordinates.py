@@ -7,6 +7,7 @@ from yt.utilities.lib.pixelization_routines import pixelize_cartesian, pixelize_
 from .coordinate_handler import (
     CoordinateHandler,
     _get_coord_fields,
+    _get_pixelization_data,
     _get_polar_bounds,
     _setup_dummy_cartesian_coords_and_widths,
     _setup_polar_coordinates,
@@ -136,7 +137,7 @@ class CylindricalCoordinateHandler(CoordinateHandler):
             data_source["py"],
             data_source["pdx"],
             data_source["pdy"],
-            data_source[field],
+            _get_pixelization_data(data_source, field),
             bounds,
             int(antialias),
             period,
@@ -152,7 +153,7 @@ class CylindricalCoordinateHandler(CoordinateHandler):
             data_source["pdx"],
             data_source["py"],
             data_source["pdy"],
-            data_source[field],
+            _get_pixelization_data(data_source, field),
             bounds,
             return_mask=True,
         )
@@ -6,6 +6,7 @@ from yt.utilities.lib.pixelization_routines import pixelize_cartesian, pixelize_
 from .coordinate_handler import (
     CoordinateHandler,
     _get_coord_fields,
+    _get_pixelization_data,
     _setup_dummy_cartesian_coords_and_widths,
 )
 
@@ -273,7 +274,7 @@ class GeographicCoordinateHandler(CoordinateHandler):
             py,
             pdx,
             pdy,
-            data_source[field],
+            _get_pixelization_data(data_source, field),
             bounds,
             int(antialias),
             period,
@@ -305,7 +306,7 @@ class GeographicCoordinateHandler(CoordinateHandler):
             data_source["pdy"],
             px,
             pdx,
-            data_source[field],
+            _get_pixelization_data(data_source, field),
             bounds,
             return_mask=True,
         )
@@ -7,6 +7,7 @@ from yt.utilities.lib.pixelization_routines import pixelize_aitoff, pixelize_cyl
 from .coordinate_handler import (
     CoordinateHandler,
     _get_coord_fields,
+    _get_pixelization_data,
     _get_polar_bounds,
     _setup_dummy_cartesian_coords_and_widths,
     _setup_polar_coordinates,
@@ -135,7 +136,7 @@ class SphericalCoordinateHandler(CoordinateHandler):
             colatitude=data_source["px"],
             dcolatitude=data_source["pdx"],
             buff_size=size,
-            field=data_source[field],
+            field=_get_pixelization_data(data_source, field),
             bounds=bounds,
             input_img=None,
             azimuth_offset=0,
@@ -154,7 +155,7 @@ class SphericalCoordinateHandler(CoordinateHandler):
                 data_source["pdx"],
                 data_source["py"],
                 data_source["pdy"],
-                data_source[field],
+                _get_pixelization_data(data_source, field),
                 bounds,
                 return_mask=True,
             )
@@ -166,7 +167,7 @@ class SphericalCoordinateHandler(CoordinateHandler):
                 data_source["pdx"],
                 data_source["py"],
                 data_source["pdy"],
-                data_source[field],
+                _get_pixelization_data(data_source, field),
                 bounds,
                 return_mask=True,
             ).T
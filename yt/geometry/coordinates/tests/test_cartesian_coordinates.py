@@ -29,3 +29,28 @@ def test_cartesian_coordinates():
     assert_equal(
         dd["index", "cell_volume"].sum(dtype="float64"), ds.domain_width.prod()
     )
+
+
+def test_pixelize_multi():
+    # Pixelizing several fields at once gives the same images as pixelizing
+    # them one at a time.
+    ds = fake_amr_ds(fields=["Density", "Temperature"], units=["g/cm**3", "K"])
+    fields = [("stream", "Density"), ("stream", "Temperature")]
+    for antialias in (True, False):
+        for data_source in (ds.slice(2, 0.5), ds.proj(("stream", "Density"), 2)):
+            bounds = (0.1, 0.7, 0.2, 0.9)
+            images = ds.coordinates.pixelize_multi(
+                2, data_source, fields, bounds, (40, 32), antialias
+            )
+            for field, (buff, mask) in zip(fields, images, strict=True):
+                ref, ref_mask = ds.coordinates.pixelize(
+                    2,
+                    data_source,
+                    field,
+                    bounds,
+                    (40, 32),
+                    antialias,
+                    return_mask=True,
+                )
+                assert_equal(buff, ref)
+                assert_equal(mask, ref_mask)
@@ -1,6 +1,9 @@
 import abc
 import os
+import threading
 import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
@@ -8,7 +11,7 @@ from yt._maintenance.deprecation import issue_deprecation_warning
 from yt.config import ytcfg
 from yt.units._numpy_wrapper_functions import uconcatenate
 from yt.units.yt_array import YTArray
-from yt.utilities.exceptions import YTFieldNotFound
+from yt.utilities.exceptions import YTFieldNotFound, YTFieldTypeNotFound
 from yt.utilities.io_handler import io_registry
 from yt.utilities.logger import ytLogger as mylog
 from yt.utilities.on_demand_imports import _h5py as h5py
@@ -28,6 +31,9 @@ class Index(ParallelAnalysisInterface, abc.ABC):
         ParallelAnalysisInterface.__init__(self)
         self.dataset = weakref.proxy(ds)
         self.ds = self.dataset
+        # Serializes reads between the main thread and the thread prefetching
+        # upcoming chunks, as IO handlers are not generally thread-safe.
+        self._io_lock = threading.RLock()
 
         self._initialize_state_variables()
 
@@ -216,32 +222,193 @@ class Index(ParallelAnalysisInterface, abc.ABC):
         fields_to_read, fields_to_generate = self._split_fields(fields)
         if len(fields_to_read) == 0:
             return {}, fields_to_generate
+        fields_to_return = _pop_prefetched(chunk, fields_to_read)
+        fields_to_read = [f for f in fields_to_read if f not in fields_to_return]
+        if len(fields_to_read) == 0:
+            return fields_to_return, fields_to_generate
         selector = dobj.selector
         if chunk is None:
             self._identify_base_chunk(dobj)
-        chunks = self._chunk_io(dobj, cache=False)
-        fields_to_return = self.io._read_particle_selection(
-            chunks, selector, fields_to_read
-        )
+        chunks = self._particle_chunk_io(dobj, fields_to_read)
+        with self._io_lock:
+            fields_to_return.update(
+                self.io._read_particle_selection(chunks, selector, fields_to_read)
+            )
         return fields_to_return, fields_to_generate
 
+    def _particle_chunk_io(self, dobj, fields):
+        # The io chunks particle fields are read from; indices that know
+        # which chunks hold which particle types can skip the others.
+        return self._chunk_io(dobj, cache=False)
+
     def _read_fluid_fields(self, fields, dobj, chunk=None):
         if len(fields) == 0:
             return {}, []
         fields_to_read, fields_to_generate = self._split_fields(fields)
         if len(fields_to_read) == 0:
             return {}, fields_to_generate
+        fields_to_return = _pop_prefetched(chunk, fields_to_read)
+        fields_to_read = [f for f in fields_to_read if f not in fields_to_return]
+        if len(fields_to_read) == 0:
+            return fields_to_return, fields_to_generate
         selector = dobj.selector
         if chunk is None:
             self._identify_base_chunk(dobj)
             chunk_size = dobj.size
         else:
             chunk_size = chunk.data_size
-        fields_to_return = self.io._read_fluid_selection(
-            self._chunk_io(dobj), selector, fields_to_read, chunk_size
-        )
+        with self._io_lock:
+            fields_to_return.update(
+                self._apply_field_dtype(
+                    self.io._read_fluid_selection(
+                        self._chunk_io(dobj), selector, fields_to_read, chunk_size
+                    )
+                )
+            )
         return fields_to_return, fields_to_generate
 
+    def _apply_field_dtype(self, fields):
+        if self.ds.field_dtype == np.float32:
+            # Not every IO handler reads into buffers of the requested
+            # precision, so we convert whatever comes back in double precision.
+            for field, data in fields.items():
+                if data.dtype == np.float64:
+                    fields[field] = data.astype(np.float32)
+        return fields
+
+    def _get_prefetch_fields(self, dobj, fields):
+        # Returns the fluid and particle fields that have to be read from disk
+        # to compute fields.
+        fluids, particles = [], []
+        try:
+            fields = dobj._identify_dependencies(
+                dobj._determine_fields(fields), dobj._spatial
+            )
+            for field in fields:
+                if self.ds._get_field_info(field).sampling_type == "particle":
+                    particles.append(field)
+                else:
+                    fluids.append(field)
+            fluids, _ = self._split_fields(fluids)
+            particles, _ = self._split_fields(particles)
+        except (YTFieldNotFound, YTFieldTypeNotFound):
+            # Prefetching is only an optimization: we let the regular read
+            # path report the missing fields.
+            return [], []
+        # Indexes that read their fields in their own way are not prefetched,
+        # since prefetching goes straight to the io handler.
+        if type(self)._read_fluid_fields is not Index._read_fluid_fields:
+            fluids = []
+        if type(self)._read_particle_fields is not Index._read_particle_fields:
+            particles = []
+        return fluids, particles
+
+    def _memory_chunks(self, objs, nvalues, nfields):
+        """
+        Groups consecutive objs into io chunks, so that reading nfields fields
+        for each of them fits within the chunk_bytes budget.  nvalues(obj) is
+        the number of values a single field has for obj.
+        """
+        budget = ytcfg.get("yt", "chunk_bytes")
+        value_bytes = max(nfields, 1) * self.ds.field_dtype.itemsize
+        return memory_chunks(objs, lambda obj: nvalues(obj) * value_bytes, budget)
+
+    def _prefetch_chunks(self, dobj, chunks, fields):
+        """
+        Iterates over the io chunks of dobj, reading the on-disk fields needed
+        for *fields* on a background thread, ahead of the chunk being
+        processed.
+        """
+        from yt.utilities.parallel_tools import shared_memory_backend
+
+        # In parallel, chunks are usually distributed between processors by
+        # parallel_objects, and we would end up reading those of the others.
+        if (
+            ytcfg.get("yt", "internals", "parallel")
+            or shared_memory_backend.num_procs > 1
+        ):
+            yield from chunks
+            return
+        budget = ytcfg.get("yt", "prefetch_bytes")
+        fluids, particles = self._get_prefetch_fields(dobj, fields)
+        if budget <= 0 or (len(fluids) == 0 and len(particles) == 0):
+            yield from chunks
+            return
+        itemsize = self.ds.field_dtype.itemsize
+
+        def get_subchunks(chunk):
+            # This mirrors what the regular read path does once the chunk is
+            # active, and is done on the calling thread.
+            with dobj._chunked_read(chunk):
+                return chunk, list(self._chunk_io(dobj, cache=False))
+
+        def nbytes(item):
+            chunk, _ = item
+            if chunk.data_size is None or len(particles) > 0:
+                # We don't know how much data this will be, so only allow a
+                # single chunk in flight.
+                return budget
+            return chunk.data_size * itemsize * len(fluids)
+
+        def read(item):
+            chunk, subchunks = item
+            data = {}
+            with self._io_lock:
+                if len(fluids) > 0:
+                    data.update(
+                        self.io._read_fluid_selection(
+                            subchunks, dobj.selector, fluids, chunk.data_size
+                        )
+                    )
+                if len(particles) > 0:
+                    data.update(
+                        self.io._read_particle_selection(
+                            subchunks, dobj.selector, particles
+                        )
+                    )
+            return self._apply_field_dtype(data)
+
+        items = (get_subchunks(chunk) for chunk in chunks)
+        for (chunk, _), data in prefetched(items, read, nbytes, budget):
+            chunk._prefetched = data
+            yield chunk
+
+    def _preload_chunk_data(self, grids, preload_fields, max_length=256):
+        """
+        Iterates over grids, initializing their cache with preload_fields.
+        Batches of up to max_length grids are read on a background thread
+        ahead of the batch being processed.
+        """
+        budget = ytcfg.get("yt", "prefetch_bytes")
+        value_bytes = len(preload_fields) * self.ds.field_dtype.itemsize
+
+        def nbytes(batch):
+            return sum(int(g.ActiveDimensions.prod()) for g in batch) * value_bytes
+
+        def batches():
+            # Each batch takes at most half of the budget, so that the next
+            # one can be read while it is processed.
+            batch, size = [], 0
+            for g in grids:
+                gsize = nbytes([g])
+                if batch and (len(batch) == max_length or size + gsize > budget // 2):
+                    yield batch
+                    batch, size = [], 0
+                batch.append(g)
+                size += gsize
+            if batch:
+                yield batch
+
+        def read(batch):
+            chunk = YTDataChunk(None, "cache", batch, cache=False)
+            with self._io_lock:
+                return self.io._read_chunk_data(chunk, preload_fields) or {}
+
+        for batch, cache in prefetched(batches(), read, nbytes, budget):
+            for g in batch:
+                g._initialize_cache(cache.pop(g.id, {}))
+                yield g
+
     def _chunk(self, dobj, chunking_style, ngz=0, **kwargs):
         # A chunk is either None or (grids, size)
         if dobj._current_chunk is None:
@@ -297,12 +464,19 @@ class YTDataChunk:
         self._cache = cache
         self._fast_index = fast_index
 
+    @property
+    def _fast_index_ids(self):
+        # The fast index is indexed by grid position in the hierarchy; we hand
+        # it our objects, in order, so that coordinates line up with the field
+        # values read for this chunk.
+        return np.array([obj.id - obj._id_offset for obj in self.objs], dtype="int64")
+
     def _accumulate_values(self, method):
         # We call this generically.  It's somewhat slower, since we're doing
         # costly getattr functions, but this allows us to generalize.
         mname = f"select_{method}"
         arrs = []
-        for obj in self._fast_index or self.objs:
+        for obj in self.objs:
             f = getattr(obj, mname)
             arrs.append(f(self.dobj))
         if method == "dtcoords":
@@ -320,7 +494,9 @@ class YTDataChunk:
     @cacheable_property
     def fcoords(self):
         if self._fast_index is not None:
-            ci = self._fast_index.select_fcoords(self.dobj.selector, self.data_size)
+            ci = self._fast_index.select_fcoords(
+                self.dobj.selector, self.data_size, self._fast_index_ids
+            )
             ci = YTArray(ci, units="code_length", registry=self.dobj.ds.unit_registry)
             return ci
         ci = np.empty((self.data_size, 3), dtype="float64")
@@ -328,7 +504,7 @@ class YTDataChunk:
         if self.data_size == 0:
             return ci
         ind = 0
-        for obj in self._fast_index or self.objs:
+        for obj in self.objs:
             c = obj.select_fcoords(self.dobj)
             if c.shape[0] == 0:
                 continue
@@ -339,13 +515,15 @@ class YTDataChunk:
     @cacheable_property
     def icoords(self):
         if self._fast_index is not None:
-            ci = self._fast_index.select_icoords(self.dobj.selector, self.data_size)
+            ci = self._fast_index.select_icoords(
+                self.dobj.selector, self.data_size, self._fast_index_ids
+            )
             return ci
         ci = np.empty((self.data_size, 3), dtype="int64")
         if self.data_size == 0:
             return ci
         ind = 0
-        for obj in self._fast_index or self.objs:
+        for obj in self.objs:
             c = obj.select_icoords(self.dobj)
             if c.shape[0] == 0:
                 continue
@@ -356,7 +534,9 @@ class YTDataChunk:
     @cacheable_property
     def fwidth(self):
         if self._fast_index is not None:
-            ci = self._fast_index.select_fwidth(self.dobj.selector, self.data_size)
+            ci = self._fast_index.select_fwidth(
+                self.dobj.selector, self.data_size, self._fast_index_ids
+            )
             ci = YTArray(ci, units="code_length", registry=self.dobj.ds.unit_registry)
             return ci
         ci = np.empty((self.data_size, 3), dtype="float64")
@@ -364,7 +544,7 @@ class YTDataChunk:
         if self.data_size == 0:
             return ci
         ind = 0
-        for obj in self._fast_index or self.objs:
+        for obj in self.objs:
             c = obj.select_fwidth(self.dobj)
             if c.shape[0] == 0:
                 continue
@@ -376,13 +556,15 @@ class YTDataChunk:
     @cacheable_property
     def ires(self):
         if self._fast_index is not None:
-            ci = self._fast_index.select_ires(self.dobj.selector, self.data_size)
+            ci = self._fast_index.select_ires(
+                self.dobj.selector, self.data_size, self._fast_index_ids
+            )
             return ci
         ci = np.empty(self.data_size, dtype="int64")
         if self.data_size == 0:
             return ci
         ind = 0
-        for obj in self._fast_index or self.objs:
+        for obj in self.objs:
             c = obj.select_ires(self.dobj)
             if c.shape == 0:
                 continue
@@ -403,7 +585,7 @@ class YTDataChunk:
         if self.data_size == 0:
             return cdt
         ind = 0
-        for obj in self._fast_index or self.objs:
+        for obj in self.objs:
             gdt, gt = obj.select_tcoords(self.dobj)
             if gt.size == 0:
                 continue
@@ -430,40 +612,77 @@ class YTDataChunk:
         return ci
 
 
-class ChunkDataCache:
-    def __init__(self, base_iter, preload_fields, geometry_handler, max_length=256):
-        # At some point, max_length should instead become a heuristic function,
-        # potentially looking at estimated memory usage.  Note that this never
-        # initializes the iterator; it assumes the iterator is already created,
-        # and it calls next() on it.
-        self.base_iter = base_iter.__iter__()
-        self.queue = []
-        self.max_length = max_length
-        self.preload_fields = preload_fields
-        self.geometry_handler = geometry_handler
-        self.cache = {}
-
-    def __iter__(self):
-        return self
-
-    def __next__(self):
-        if len(self.queue) == 0:
-            for _ in range(self.max_length):
-                try:
-                    self.queue.append(next(self.base_iter))
-                except StopIteration:
+def memory_chunks(objs, nbytes, budget):
+    """
+    Groups consecutive objs into lists, so that the sum of nbytes(obj) over
+    each list fits within budget.  An obj larger than budget gets a list of
+    its own.
+    """
+    group = []
+    size = 0
+    for obj in objs:
+        obj_size = nbytes(obj)
+        if group and size + obj_size > budget:
+            yield group
+            group = []
+            size = 0
+        group.append(obj)
+        size += obj_size
+    if group:
+        yield group
+
+
+def _pop_prefetched(chunk, fields):
+    # Returns the fields that were read ahead of time for chunk, if any.
+    prefetched = getattr(chunk, "_prefetched", None)
+    if not prefetched:
+        return {}
+    return {f: prefetched.pop(f) for f in fields if f in prefetched}
+
+
+def prefetched(items, read, nbytes, budget):
+    """
+    Iterates over (item, read(item)) pairs, calling read on a background
+    thread ahead of the item being consumed.
+
+    Items are read ahead as long as the sum of nbytes(item) over the items
+    read but not yet consumed fits within budget, with at least one item
+    always read ahead.  A budget of zero disables prefetching, in which case
+    read is called synchronously.
+    """
+    if budget <= 0:
+        for item in items:
+            yield item, read(item)
+        return
+    items = iter(items)
+    queue = deque()
+    in_flight = 0
+    pending = None
+    exhausted = False
+    executor = ThreadPoolExecutor(1, thread_name_prefix="yt-prefetch")
+    try:
+        while True:
+            while not exhausted:
+                if pending is None:
+                    try:
+                        item = next(items)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    pending = item, nbytes(item)
+                item, size = pending
+                if queue and in_flight + size > budget:
                     break
-            # If it's still zero ...
-            if len(self.queue) == 0:
-                raise StopIteration
-            chunk = YTDataChunk(None, "cache", self.queue, cache=False)
-            self.cache = (
-                self.geometry_handler.io._read_chunk_data(chunk, self.preload_fields)
-                or {}
-            )
-        g = self.queue.pop(0)
-        g._initialize_cache(self.cache.pop(g.id, {}))
-        return g
+                queue.append((item, size, executor.submit(read, item)))
+                in_flight += size
+                pending = None
+            if not queue:
+                return
+            item, size, future = queue.popleft()
+            in_flight -= size
+            yield item, future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
 
 
 def is_curvilinear(geo):
@@ -31,6 +31,7 @@ cdef class GridTree:
     cdef int num_grids
     cdef int num_root_grids
     cdef int num_leaf_grids
+    cdef public int ref_factor
     cdef public bitarray mask
     cdef void setup_data(self, GridVisitorData *data)
     cdef void visit_grids(self, GridVisitorData *data,
@@ -42,6 +43,16 @@ cdef class GridTree:
                           SelectorObject selector,
                           GridTreeNode *grid,
                           np.uint8_t *buf = ?)
+    cdef void visit_grid_list(self,
+                          GridVisitorData *data,
+                          grid_visitor_function *func,
+                          SelectorObject selector,
+                          np.int64_t[:] grid_ids)
+    cdef void visit_selected(self,
+                          GridVisitorData *data,
+                          grid_visitor_function *func,
+                          SelectorObject selector,
+                          grid_ids)
 
 cdef class MatchPointsToGrids:
 
@@ -22,7 +22,8 @@ from yt.utilities.lib.bitarray cimport bitarray
 cdef GridTreeNode Grid_initialize(np.ndarray[np.float64_t, ndim=1] le,
                                   np.ndarray[np.float64_t, ndim=1] re,
                                   np.ndarray[np.int32_t, ndim=1] dims,
-                                  int num_children, int level, int index):
+                                  int num_children, int level, int index,
+                                  np.float64_t *dle):
 
     cdef GridTreeNode node
     cdef int i
@@ -34,7 +35,7 @@ cdef GridTreeNode Grid_initialize(np.ndarray[np.float64_t, ndim=1] le,
         node.right_edge[i] = re[i]
         node.dims[i] = dims[i]
         node.dds[i] = (re[i] - le[i])/dims[i]
-        node.start_index[i] = <np.int64_t> rint(le[i] / node.dds[i])
+        node.start_index[i] = <np.int64_t> rint((le[i] - dle[i]) / node.dds[i])
     node.num_children = num_children
     if num_children <= 0:
         node.children = NULL
@@ -57,10 +58,19 @@ cdef class GridTree:
                   np.ndarray[np.int32_t, ndim=2] dimensions,
                   np.ndarray[np.int64_t, ndim=1] parent_ind,
                   np.ndarray[np.int64_t, ndim=1] level,
-                  np.ndarray[np.int64_t, ndim=1] num_children):
+                  np.ndarray[np.int64_t, ndim=1] num_children,
+                  domain_left_edge=None, int ref_factor=2):
 
         cdef int i, j, k
         cdef np.ndarray[np.int64_t, ndim=1] child_ptr
+        cdef np.float64_t dle[3]
+
+        for i in range(3):
+            if domain_left_edge is None:
+                dle[i] = 0.0
+            else:
+                dle[i] = domain_left_edge[i]
+        self.ref_factor = ref_factor
 
         child_ptr = np.zeros(num_grids, dtype='int64')
 
@@ -76,7 +86,7 @@ cdef class GridTree:
                                             right_edge[i,:],
                                             dimensions[i,:],
                                             num_children[i],
-                                            level[i], i)
+                                            level[i], i, dle)
             if level[i] == 0:
                 self.num_root_grids += 1
             if num_children[i] == 0:
@@ -153,7 +163,7 @@ cdef class GridTree:
         data.n_tuples = 0
         data.child_tuples = NULL
         data.array = NULL
-        data.ref_factor = 2 #### FIX THIS
+        data.ref_factor = self.ref_factor
 
     cdef void visit_grids(self, GridVisitorData *data,
                           grid_visitor_function *func,
@@ -190,6 +200,35 @@ cdef class GridTree:
             self.recursively_visit_grid(data, func, selector, grid.children[i],
                                         buf)
 
+    cdef void visit_grid_list(self, GridVisitorData *data,
+                              grid_visitor_function *func,
+                              SelectorObject selector,
+                              np.int64_t[:] grid_ids):
+        # This visits an explicit, ordered list of grids rather than walking
+        # the tree.  Each grid is masked by its own children, exactly as it
+        # would be if it were selected on its own, so the order in which cells
+        # are visited matches concatenating the per-grid selections.
+        cdef np.int64_t i
+        cdef GridTreeNode *grid
+        for i in range(grid_ids.shape[0]):
+            grid = &self.grids[grid_ids[i]]
+            data.grid = grid
+            if selector.select_bbox(grid.left_edge, grid.right_edge) == 0:
+                continue
+            grid_visitors.setup_tuples(data)
+            selector.visit_grid_cells(data, func, NULL)
+        grid_visitors.free_tuples(data)
+
+    cdef void visit_selected(self, GridVisitorData *data,
+                             grid_visitor_function *func,
+                             SelectorObject selector,
+                             grid_ids):
+        if grid_ids is None:
+            self.visit_grids(data, func, selector)
+        else:
+            self.visit_grid_list(data, func, selector,
+                                 np.asarray(grid_ids, dtype="int64"))
+
     def count(self, SelectorObject selector):
         # Use the counting grid visitor
         cdef GridVisitorData data
@@ -210,60 +249,98 @@ cdef class GridTree:
         self.visit_grids(&data,  grid_visitors.count_cells, selector)
         return size
 
-    def select_icoords(self, SelectorObject selector, np.uint64_t size = -1):
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def count_grids(self, SelectorObject selector):
+        # Count the selected cells of every grid in a single pass, returning
+        # an array indexed by grid index.  Grids whose bounding box is not
+        # selected are left at zero.
+        cdef GridVisitorData data
+        cdef np.uint64_t size
+        cdef int i
+        cdef GridTreeNode *grid
+        cdef np.ndarray[np.int64_t, ndim=1] counts
+        counts = np.zeros(self.num_grids, dtype="int64")
+        self.setup_data(&data)
+        data.array = <void*>(&size)
+        for i in range(self.num_grids):
+            grid = &self.grids[i]
+            if selector.select_bbox(grid.left_edge, grid.right_edge) == 0:
+                continue
+            size = 0
+            data.grid = grid
+            grid_visitors.setup_tuples(&data)
+            selector.visit_grid_cells(&data, grid_visitors.count_cells, NULL)
+            counts[i] = size
+        grid_visitors.free_tuples(&data)
+        return counts
+
+    def select_icoords(self, SelectorObject selector, np.uint64_t size = -1,
+                       grid_ids = None):
         # Fill icoords with a selector
         cdef GridVisitorData data
         self.setup_data(&data)
         if size == -1:
             size = 0
             data.array = <void*>(&size)
-            self.visit_grids(&data,  grid_visitors.count_cells, selector)
+            self.visit_selected(&data,  grid_visitors.count_cells, selector,
+                                grid_ids)
         cdef np.ndarray[np.int64_t, ndim=2] icoords
         icoords = np.empty((size, 3), dtype="int64")
         data.array = icoords.data
-        self.visit_grids(&data, grid_visitors.icoords_cells, selector)
+        self.visit_selected(&data, grid_visitors.icoords_cells, selector,
+                            grid_ids)
         return icoords
 
-    def select_ires(self, SelectorObject selector, np.uint64_t size = -1):
+    def select_ires(self, SelectorObject selector, np.uint64_t size = -1,
+                       grid_ids = None):
         # Fill ires with a selector
         cdef GridVisitorData data
         self.setup_data(&data)
         if size == -1:
             size = 0
             data.array = <void*>(&size)
-            self.visit_grids(&data,  grid_visitors.count_cells, selector)
+            self.visit_selected(&data,  grid_visitors.count_cells, selector,
+                                grid_ids)
         cdef np.ndarray[np.int64_t, ndim=1] ires
         ires = np.empty(size, dtype="int64")
         data.array = ires.data
-        self.visit_grids(&data, grid_visitors.ires_cells, selector)
+        self.visit_selected(&data, grid_visitors.ires_cells, selector,
+                            grid_ids)
         return ires
 
-    def select_fcoords(self, SelectorObject selector, np.uint64_t size = -1):
+    def select_fcoords(self, SelectorObject selector, np.uint64_t size = -1,
+                       grid_ids = None):
         # Fill fcoords with a selector
         cdef GridVisitorData data
         self.setup_data(&data)
         if size == -1:
             size = 0
             data.array = <void*>(&size)
-            self.visit_grids(&data,  grid_visitors.count_cells, selector)
+            self.visit_selected(&data,  grid_visitors.count_cells, selector,
+                                grid_ids)
         cdef np.ndarray[np.float64_t, ndim=2] fcoords
         fcoords = np.empty((size, 3), dtype="float64")
         data.array = fcoords.data
-        self.visit_grids(&data, grid_visitors.fcoords_cells, selector)
+        self.visit_selected(&data, grid_visitors.fcoords_cells, selector,
+                            grid_ids)
         return fcoords
 
-    def select_fwidth(self, SelectorObject selector, np.uint64_t size = -1):
+    def select_fwidth(self, SelectorObject selector, np.uint64_t size = -1,
+                       grid_ids = None):
         # Fill fwidth with a selector
         cdef GridVisitorData data
         self.setup_data(&data)
         if size == -1:
             size = 0
             data.array = <void*>(&size)
-            self.visit_grids(&data,  grid_visitors.count_cells, selector)
+            self.visit_selected(&data,  grid_visitors.count_cells, selector,
+                                grid_ids)
         cdef np.ndarray[np.float64_t, ndim=2] fwidth
         fwidth = np.empty((size, 3), dtype="float64")
         data.array = fwidth.data
-        self.visit_grids(&data, grid_visitors.fwidth_cells, selector)
+        self.visit_selected(&data, grid_visitors.fwidth_cells, selector,
+                            grid_ids)
         return fwidth
 
 cdef class MatchPointsToGrids:
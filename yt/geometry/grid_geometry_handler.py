@@ -1,4 +1,7 @@
 import abc
+import json
+import os
+import shutil
 import weakref
 from collections import defaultdict
 
@@ -9,18 +12,85 @@ from yt.config import ytcfg
 from yt.fields.derived_field import ValidateSpatial
 from yt.fields.field_detector import FieldDetector
 from yt.funcs import ensure_numpy_array, iter_fields
-from yt.geometry.geometry_handler import ChunkDataCache, Index, YTDataChunk
+from yt.geometry.geometry_handler import Index, YTDataChunk
 from yt.utilities.definitions import MAXLEVEL
 from yt.utilities.logger import ytLogger as mylog
 
 from .grid_container import GridTree, MatchPointsToGrids
 
 
+class LazyGridArray:
+    """
+    A stand-in for the object array of grids of an index, which creates
+    each grid object only when it is first accessed.
+
+    Indexing with an integer returns a single grid, while indexing with a
+    slice, a boolean mask or an array of indices returns an object array of
+    grids, as it would with the array it replaces.
+    """
+
+    ndim = 1
+
+    def __init__(self, size, create_grid):
+        self._grids = np.empty(size, dtype="object")
+        self._loaded = []
+        self._create_grid = create_grid
+
+    def __len__(self):
+        return self._grids.size
+
+    @property
+    def size(self):
+        return self._grids.size
+
+    @property
+    def shape(self):
+        return self._grids.shape
+
+    def _get(self, i):
+        grid = self._grids[i]
+        if grid is None:
+            grid = self._grids[i] = self._create_grid(i)
+            self._loaded.append(i)
+        return grid
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            if key < 0:
+                key += self.size
+            if not 0 <= key < self.size:
+                raise IndexError(key)
+            return self._get(int(key))
+        inds = np.arange(self.size)[key]
+        grids = np.empty(inds.size, dtype="object")
+        for j, i in enumerate(inds):
+            grids[j] = self._get(i)
+        return grids
+
+    def __iter__(self):
+        for i in range(self.size):
+            yield self._get(i)
+
+    def tolist(self):
+        return list(self)
+
+    def loaded(self):
+        """
+        Yields the (index, grid) pairs of the grids created so far.
+        """
+        for i in self._loaded:
+            yield i, self._grids[i]
+
+
 class GridIndex(Index, abc.ABC):
     """The index class for patch and block AMR datasets."""
 
     float_type = "float64"
     _preload_implemented = False
+    # Whether self.grids is a LazyGridArray.  Frontends that support it set
+    # grid_parent_ids (and call _setup_grid_links) rather than linking grid
+    # objects together, so that selection and chunking can work from arrays.
+    _lazy_grids = False
     _index_properties = (
         "grid_left_edge",
         "grid_right_edge",
@@ -36,15 +106,136 @@ class GridIndex(Index, abc.ABC):
         mylog.debug("Initializing grid arrays.")
         self._initialize_grid_arrays()
 
-        mylog.debug("Parsing index.")
-        self._parse_index()
+        if not self._load_index_cache():
+            mylog.debug("Parsing index.")
+            self._parse_index()
+
+            mylog.debug("Constructing grid objects.")
+            self._populate_grid_objects()
 
-        mylog.debug("Constructing grid objects.")
-        self._populate_grid_objects()
+            self._save_index_cache()
 
         mylog.debug("Re-examining index")
         self._initialize_level_stats()
 
+    # The sidecar directory the parsed hierarchy is cached in, if the
+    # ``grid_index_cache`` configuration option is set.  Frontends which
+    # support it return a path here, and implement _get_index_cache_state and
+    # _set_index_cache_state.
+    _index_cache_filename = None
+    _index_cache_version = 1
+
+    @property
+    def _index_cache_files(self):
+        """
+        The files the hierarchy is parsed from.  The cache is discarded when
+        any of them changes.
+        """
+        return ()
+
+    def _index_cache_key(self):
+        return {
+            "version": self._index_cache_version,
+            "class": type(self).__name__,
+            "dataset_type": self.dataset_type,
+            "num_grids": int(self.num_grids),
+            "reconstruct_index": bool(ytcfg.get("yt", "reconstruct_index")),
+        }
+
+    @staticmethod
+    def _file_stats(filenames):
+        stats = []
+        for fn in filenames:
+            st = os.stat(fn)
+            stats.append([os.path.abspath(fn), st.st_size, st.st_mtime_ns])
+        return stats
+
+    def _get_index_cache_state(self):
+        """
+        Returns a dict of the arrays needed to rebuild the grid objects
+        without parsing the hierarchy again.
+        """
+        return {
+            field: np.asarray(getattr(self, field)) for field in self._index_properties
+        }
+
+    def _set_index_cache_state(self, state):
+        """
+        Restores the grid arrays and objects from the cached *state*, in place
+        of _parse_index and _populate_grid_objects.
+        """
+        for field in self._index_properties:
+            arr = state[field]
+            if field in ("grid_left_edge", "grid_right_edge"):
+                arr = self.ds.arr(arr, "code_length")
+            setattr(self, field, arr)
+
+    @staticmethod
+    def _pack_grid_ids(id_lists):
+        # Flattens a list of lists of grid ids into (ids, counts) arrays
+        counts = np.array([len(ids) for ids in id_lists], dtype="int64")
+        ids = np.zeros(counts.sum(), dtype="int64")
+        if ids.size > 0:
+            ids[:] = np.concatenate([np.asarray(i, dtype="int64") for i in id_lists])
+        return ids, counts
+
+    @staticmethod
+    def _unpack_grid_ids(ids, counts):
+        return np.split(np.asarray(ids), np.cumsum(counts)[:-1])
+
+    def _load_index_cache(self):
+        fn = self._index_cache_filename
+        if fn is None or not ytcfg.get("yt", "grid_index_cache"):
+            return False
+        try:
+            with open(os.path.join(fn, "index.json")) as fh:
+                meta = json.load(fh)
+            if meta["key"] != self._index_cache_key():
+                return False
+            if meta["files"] != self._file_stats(f[0] for f in meta["files"]):
+                return False
+            # Arrays are memory-mapped copy-on-write, as grids may later
+            # adjust them in place.
+            state = {
+                name: np.load(os.path.join(fn, f"{name}.npy"), mmap_mode="c")
+                for name in meta["arrays"]
+            }
+        except (OSError, ValueError, KeyError):
+            return False
+        mylog.debug("Loading the grid hierarchy from %s", fn)
+        self._set_index_cache_state(state)
+        return True
+
+    def _save_index_cache(self):
+        fn = self._index_cache_filename
+        if fn is None or not ytcfg.get("yt", "grid_index_cache"):
+            return
+        if self.comm.rank != 0:
+            return
+        state = self._get_index_cache_state()
+        meta = {
+            "key": self._index_cache_key(),
+            "files": self._file_stats(self._index_cache_files),
+            "arrays": sorted(state),
+        }
+        # The cache is written to a temporary directory first, so that
+        # concurrent jobs never see a partial one.
+        tmp = f"{fn}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(tmp, exist_ok=True)
+            for name, arr in state.items():
+                np.save(os.path.join(tmp, f"{name}.npy"), arr)
+            with open(os.path.join(tmp, "index.json"), "w") as fh:
+                json.dump(meta, fh)
+            if os.path.isdir(fn):
+                shutil.rmtree(fn)
+            os.replace(tmp, fn)
+        except OSError as e:
+            mylog.debug("Could not cache the grid hierarchy in %s: %s", fn, e)
+            shutil.rmtree(tmp, ignore_errors=True)
+            return
+        mylog.debug("Cached the grid hierarchy in %s", fn)
+
     @abc.abstractmethod
     def _count_grids(self):
         pass
@@ -95,12 +286,63 @@ class GridIndex(Index, abc.ABC):
         self.grid_levels = np.zeros((self.num_grids, 1), "int32")
         self.grid_particle_count = np.zeros((self.num_grids, 1), "int32")
 
+    def _loaded_grids(self):
+        # Grids that have not been created yet hold no data, so there is no
+        # need to create them just to update or clear them.
+        if self._lazy_grids:
+            return self.grids.loaded()
+        return enumerate(self.grids)
+
+    def _setup_grid_links(self):
+        # Stores the children of every grid, as indices into the grid arrays,
+        # from grid_parent_ids: children of grid i are
+        # _grid_children[_grid_children_offsets[i]:_grid_children_offsets[i+1]]
+        parent_ids = np.asarray(self.grid_parent_ids, dtype="int64")
+        has_parent = parent_ids >= 0
+        order = np.argsort(parent_ids, kind="stable")
+        self._grid_children = order[(~has_parent).sum() :]
+        counts = np.bincount(parent_ids[has_parent], minlength=self.num_grids)
+        self._grid_children_offsets = np.zeros(self.num_grids + 1, dtype="int64")
+        np.cumsum(counts, out=self._grid_children_offsets[1:])
+
+    def _get_grid_children(self, i):
+        offsets = self._grid_children_offsets
+        return self._grid_children[offsets[i] : offsets[i + 1]]
+
+    def _clamp_grid_edges(self):
+        # Clamps the edges of every grid to an integer multiple of the cell
+        # width of its parent, level by level, as AMRGridPatch._prepare_grid
+        # does one grid at a time.  Lazily created grids then find their edges
+        # already clamped, so that the arrays can be used for selection before
+        # any grid object exists.
+        if not ytcfg.get("yt", "reconstruct_index"):
+            return
+        LE = self.grid_left_edge.d
+        RE = self.grid_right_edge.d
+        parent_ids = self.grid_parent_ids
+        dds = (RE - LE) / self.grid_dimensions
+        DW = self.ds.domain_right_edge.d - self.ds.domain_left_edge.d
+        if self.ds.dimensionality < 3:
+            dds[:, 2] = DW[2]
+        levels = self.grid_levels[:, 0]
+        for level in range(levels.min() + 1, levels.max() + 1):
+            ind = np.flatnonzero((levels == level) & (parent_ids >= 0))
+            if ind.size == 0:
+                continue
+            pind = parent_ids[ind]
+            dds[ind] = dds[pind] / self.ds.refine_by
+            if self.ds.dimensionality < 3:
+                dds[ind, 2] = DW[2]
+            for edge in (LE, RE):
+                start = np.rint((edge[ind] - LE[pind]) / dds[pind])
+                edge[ind] = start * dds[pind] + LE[pind]
+
     def clear_all_data(self):
         """
         This routine clears all the data currently being held onto by the grids
         and the data io handler.
         """
-        for g in self.grids:
+        for _, g in self._loaded_grids():
             g.clear_data()
         self.io.queue.clear()
 
@@ -108,7 +350,8 @@ class GridIndex(Index, abc.ABC):
         """
         Returns (in code units) the smallest cell size in the simulation.
         """
-        return self.select_grids(self.grid_levels.max())[0].dds[:].min()
+        # This is the first grid on the finest level
+        return self.grids[np.argmax(self.grid_levels[:, 0])].dds[:].min()
 
     def _get_particle_type_counts(self):
         return {self.ds.particle_types_raw[0]: self.grid_particle_count.sum()}
@@ -243,32 +486,34 @@ class GridIndex(Index, abc.ABC):
         (x, y, z) points. Returns a numpy array of field values cross coords
         """
         coords = self.ds.arr(ensure_numpy_array(coords), "code_length")
-        grids = self._find_points(coords[:, 0], coords[:, 1], coords[:, 2])[0]
+        coords = coords.reshape(-1, 3)
+        grid_inds = self._find_points(coords[:, 0], coords[:, 1], coords[:, 2])[1]
+        grid_inds = np.atleast_1d(grid_inds)
         fields = list(iter_fields(fields))
-        mark = np.zeros(3, dtype="int64")
-        out = []
-
-        # create point -> grid mapping
-        grid_index = {}
-        for coord_index, grid in enumerate(grids):
-            if grid not in grid_index:
-                grid_index[grid] = []
-            grid_index[grid].append(coord_index)
 
         out = []
         for field in fields:
             funit = self.ds._get_field_info(field).units
             out.append(self.ds.arr(np.empty(len(coords)), funit))
 
-        for grid in grid_index:
+        # Group the points by the grid that contains them, so that every grid
+        # is read once and all of its points are filled in a single pass.
+        order = np.argsort(grid_inds, kind="stable")
+        splits = np.flatnonzero(np.diff(grid_inds[order])) + 1
+        for coord_inds in np.split(order, splits):
+            if coord_inds.size == 0:
+                continue
+            grid = self.grids[grid_inds[coord_inds[0]]]
             cellwidth = (grid.RightEdge - grid.LeftEdge) / grid.ActiveDimensions
+            mark = ((coords[coord_inds] - grid.LeftEdge) / cellwidth).d
+            mark = mark.astype("int64")
+            # Points on the right edge of a grid belong to its last cell
+            np.clip(mark, 0, grid.ActiveDimensions - 1, out=mark)
+            grid.get_data(fields)
             for field_index, field in enumerate(fields):
-                for coord_index in grid_index[grid]:
-                    mark = (coords[coord_index, :] - grid.LeftEdge) / cellwidth
-                    mark = np.array(mark, dtype="int64")
-                    out[field_index][coord_index] = grid[field][
-                        mark[0], mark[1], mark[2]
-                    ]
+                out[field_index][coord_inds] = grid[field][
+                    mark[:, 0], mark[:, 1], mark[:, 2]
+                ]
         if len(fields) == 1:
             return out[0]
         return out
@@ -290,6 +535,19 @@ class GridIndex(Index, abc.ABC):
         return self.grids[ind], ind
 
     def _get_grid_tree(self):
+        if self._lazy_grids:
+            # Built straight from the arrays, without creating any grid
+            return GridTree(
+                self.num_grids,
+                np.asarray(self.grid_left_edge, dtype="float64"),
+                np.asarray(self.grid_right_edge, dtype="float64"),
+                self.grid_dimensions.astype("int32"),
+                np.asarray(self.grid_parent_ids, dtype="int64"),
+                self.grid_levels[:, 0].astype("int64"),
+                np.diff(self._grid_children_offsets),
+                domain_left_edge=self.ds.domain_left_edge.d,
+                ref_factor=self.ds.refine_by,
+            )
         left_edge = self.ds.arr(np.zeros((self.num_grids, 3)), "code_length")
         right_edge = self.ds.arr(np.zeros((self.num_grids, 3)), "code_length")
         level = np.zeros((self.num_grids), dtype="int64")
@@ -316,8 +574,40 @@ class GridIndex(Index, abc.ABC):
             parent_ind,
             level,
             num_children,
+            domain_left_edge=self.ds.domain_left_edge.d,
+            ref_factor=self.ds.refine_by,
         )
 
+    # Selection types that the GridTree can count and select in a single
+    # compiled pass.  Rays are deliberately not included: their per-grid
+    # selection walks each grid once, which is much cheaper than testing
+    # every cell against the ray.
+    _fast_index_types = ("sphere", "region", "slice", "disk", "ellipsoid")
+
+    def _get_fast_index(self, dobj):
+        """
+        Return the GridTree used to count and select *dobj* in one pass over
+        the hierarchy, or None if the fast index is disabled (the default) or
+        does not apply to this kind of data object.
+        """
+        if not ytcfg.get("yt", "fast_grid_index"):
+            return None
+        if dobj._type_name not in self._fast_index_types:
+            return None
+        if getattr(self, "_grid_tree", None) is None:
+            self._grid_tree = self._get_grid_tree()
+        return self._grid_tree
+
+    def _get_grid_selection_counts(self, dobj, fast_index):
+        # Per-grid cell counts are computed once per selector and then reused
+        # for every chunk of this data object.
+        key = hash(dobj.selector)
+        cached = getattr(dobj, "_grid_selection_counts", None)
+        if cached is None or cached[0] != key:
+            cached = (key, fast_index.count_grids(dobj.selector))
+            dobj._grid_selection_counts = cached
+        return cached[1]
+
     def convert(self, unit):
         return self.dataset.conversion_factors[unit]
 
@@ -338,9 +628,8 @@ class GridIndex(Index, abc.ABC):
             dobj._chunk_info = np.empty(len(grids), dtype="object")
             for i, g in enumerate(grids):
                 dobj._chunk_info[i] = g
-        # These next two lines, when uncommented, turn "on" the fast index.
-        # if dobj._type_name != "grid":
-        #    fast_index = self._get_grid_tree()
+        if dobj._type_name != "grid":
+            fast_index = self._get_fast_index(dobj)
         if getattr(dobj, "size", None) is None:
             dobj.size = self._count_selection(dobj, fast_index=fast_index)
         if getattr(dobj, "shape", None) is None:
@@ -350,10 +639,14 @@ class GridIndex(Index, abc.ABC):
         )[0]
 
     def _count_selection(self, dobj, grids=None, fast_index=None):
-        if fast_index is not None:
-            return fast_index.count(dobj.selector)
         if grids is None:
             grids = dobj._chunk_info
+        if fast_index is not None:
+            counts = self._get_grid_selection_counts(dobj, fast_index)
+            ids = np.fromiter(
+                (g.id - g._id_offset for g in grids), dtype="int64", count=len(grids)
+            )
+            return int(counts[ids].sum())
         count = sum(g.count(dobj.selector) for g in grids)
         return count
 
@@ -364,6 +657,7 @@ class GridIndex(Index, abc.ABC):
 
     def _chunk_spatial(self, dobj, ngz, sort=None, preload_fields=None):
         gobjs = getattr(dobj._current_chunk, "objs", dobj._chunk_info)
+        fast_index = getattr(dobj._current_chunk, "_fast_index", None)
         if sort in ("+level", "level"):
             giter = sorted(gobjs, key=lambda g: g.Level)
         elif sort == "-level":
@@ -374,13 +668,13 @@ class GridIndex(Index, abc.ABC):
             preload_fields = []
         preload_fields, _ = self._split_fields(preload_fields)
         if self._preload_implemented and len(preload_fields) > 0 and ngz == 0:
-            giter = ChunkDataCache(list(giter), preload_fields, self)
+            giter = self._preload_chunk_data(list(giter), preload_fields)
         for og in giter:
             if ngz > 0:
                 g = og.retrieve_ghost_zones(ngz, [], smoothed=True)
             else:
                 g = og
-            size = self._count_selection(dobj, [og])
+            size = self._count_selection(dobj, [og], fast_index=fast_index)
             if size == 0:
                 continue
             # We don't want to cache any of the masks or icoords or fcoords for
@@ -396,9 +690,12 @@ class GridIndex(Index, abc.ABC):
         local_only=False,
         preload_fields=None,
         chunk_sizing="auto",
+        nfields=1,
     ):
         # local_only is only useful for inline datasets and requires
         # implementation by subclasses.
+        # nfields is the number of fields read for each chunk, which is only
+        # used when chunks are sized to fit in memory.
         if preload_fields is None:
             preload_fields = []
         preload_fields, _ = self._split_fields(preload_fields)
@@ -426,23 +723,31 @@ class GridIndex(Index, abc.ABC):
             size = 1
         elif chunk_sizing == "old":
             size = self._grid_chunksize
+        elif chunk_sizing == "memory":
+            size = None
         else:
             raise RuntimeError(
                 f"{chunk_sizing} is an invalid value for the 'chunk_sizing' argument."
             )
         for fn in sorted(gfiles):
             gs = gfiles[fn]
-            for grids in (gs[pos : pos + size] for pos in range(0, len(gs), size)):
+            if size is None:
+                chunks = self._memory_chunks(
+                    gs, lambda g: g.ActiveDimensions.prod(), nfields
+                )
+            else:
+                chunks = (gs[pos : pos + size] for pos in range(0, len(gs), size))
+            for grids in chunks:
                 dc = YTDataChunk(
                     dobj,
                     "io",
                     grids,
-                    self._count_selection(dobj, grids),
+                    self._count_selection(dobj, grids, fast_index=fast_index),
                     cache=cache,
                     fast_index=fast_index,
                 )
                 # We allow four full chunks to be included.
-                with self.io.preload(dc, preload_fields, 4.0 * size):
+                with self.io.preload(dc, preload_fields, 4.0 * (size or len(grids))):
                     yield dc
 
     def _icoords_to_fcoords(
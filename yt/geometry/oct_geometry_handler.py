@@ -1,7 +1,8 @@
 import numpy as np
 
 from yt.fields.field_detector import FieldDetector
-from yt.geometry.geometry_handler import Index
+from yt.funcs import ensure_numpy_array, iter_fields
+from yt.geometry.geometry_handler import Index, YTDataChunk
 from yt.utilities.logger import ytLogger as mylog
 
 
@@ -21,6 +22,23 @@ class OctreeIndex(Index):
             / (self.dataset.domain_dimensions * 2 ** (self.max_level))
         ).min()
 
+    def _chunk_io(
+        self, dobj, cache=True, local_only=False, chunk_sizing="auto", nfields=1
+    ):
+        oobjs = getattr(dobj._current_chunk, "objs", dobj._chunk_info)
+        if chunk_sizing == "auto":
+            chunks = ([subset] for subset in oobjs)
+        elif chunk_sizing == "memory":
+            chunks = self._memory_chunks(
+                oobjs, lambda s: s.oct_handler.nocts * s.nz**3, nfields
+            )
+        else:
+            raise RuntimeError(
+                f"{chunk_sizing} is an invalid value for the 'chunk_sizing' argument."
+            )
+        for subsets in chunks:
+            yield YTDataChunk(dobj, "io", subsets, None, cache=cache)
+
     def convert(self, unit):
         return self.dataset.conversion_factors[unit]
 
@@ -117,6 +135,50 @@ class OctreeIndex(Index):
             take_log=take_log,
         )
 
+    def _find_field_values_at_points(self, fields, coords):
+        r"""Find the value of fields at a set of coordinates.
+
+        Returns the values [field1, field2,...] of the fields at the given
+        (x, y, z) points. Returns a numpy array of field values cross coords
+        """
+        coords = self.ds.arr(ensure_numpy_array(coords), "code_length")
+        coords = coords.reshape(-1, 3)
+        fields = list(iter_fields(fields))
+
+        out = []
+        for field in fields:
+            funit = self.ds._get_field_info(field).units
+            out.append(self.ds.arr(np.full(len(coords), np.nan), funit))
+
+        # All the points are located in the octs of a chunk at once, and each
+        # field is then only read for the chunks that hold at least one point.
+        remaining = np.ones(len(coords), dtype=bool)
+        dobj = self.ds.all_data()
+        for _chunk in dobj.chunks([], "io"):
+            for obj in dobj._current_chunk.objs:
+                if not remaining.any():
+                    break
+                icell = (
+                    obj["index", "ones"].T.reshape(-1).astype(np.int64).cumsum().value
+                    - 1
+                )
+                found = obj.mesh_sampling_particle_field(
+                    coords[remaining], icell.astype(np.float64)
+                )
+                mask = ~np.isnan(found)
+                if not mask.any():
+                    continue
+                coord_inds = np.flatnonzero(remaining)[mask]
+                cell_inds = found[mask].astype(np.int64)
+                obj.field_parameters = dobj.field_parameters
+                for field_index, field in enumerate(fields):
+                    cell_data = obj[field].T.reshape(-1)
+                    out[field_index][coord_inds] = cell_data[cell_inds]
+                remaining[coord_inds] = False
+        if len(fields) == 1:
+            return out[0]
+        return out
+
     def _icoords_to_fcoords(
         self,
         icoords: np.ndarray,
@@ -13,6 +13,7 @@ from yt.geometry.geometry_handler import Index, YTDataChunk
 from yt.geometry.particle_oct_container import ParticleBitmap
 from yt.utilities.lib.fnv_hash import fnv_hash
 from yt.utilities.logger import ytLogger as mylog
+from yt.utilities.parallel_tools import shared_memory_backend
 from yt.utilities.parallel_tools.parallel_analysis_interface import parallel_objects
 
 
@@ -33,12 +34,14 @@ def validate_index_order(index_order):
 
 
 class ParticleIndexInfo:
-    def __init__(self, order1, order2, filename, mutable_index):
+    def __init__(self, order1, order2, filename, mutable_index, ptypes=None):
         self._order1 = order1
         self._order2 = order2
         self._order2_orig = order2
         self.filename = filename
         self.mutable_index = mutable_index
+        # The particle types indexed, all of them if None
+        self.ptypes = ptypes
         self._is_loaded = False
 
     @property
@@ -74,6 +77,8 @@ class ParticleIndex(Index):
 
     def _setup_geometry(self):
         self.regions = None
+        self.ptype_indices = None
+        self._particle_id_indices = {}
 
     def get_smallest_dx(self):
         """
@@ -175,8 +180,11 @@ class ParticleIndex(Index):
             )
             for df in self.data_files:
                 for _, ppos in self.io._yield_coordinates(df):
-                    min_ppos = np.nanmin(np.vstack([min_ppos, ppos]), axis=0)
-                    max_ppos = np.nanmax(np.vstack([max_ppos, ppos]), axis=0)
+                    if ppos.size == 0:
+                        continue
+                    # fmin and fmax ignore the NaNs we started from
+                    min_ppos = np.fmin(min_ppos, np.nanmin(ppos, axis=0))
+                    max_ppos = np.fmax(max_ppos, np.nanmax(ppos, axis=0))
             only_on_root(
                 mylog.info,
                 f"Load this dataset with bounding_box=[{min_ppos}, {max_ppos}] "
@@ -186,14 +194,54 @@ class ParticleIndex(Index):
             ds.domain_right_edge = ds.arr(1.05 * max_ppos, "code_length")
             ds.domain_width = ds.domain_right_edge - ds.domain_left_edge
 
+        # Not every particle dataset, e.g. in-memory ones, has an index_order
+        index_order = getattr(ds, "index_order", None)
+        if isinstance(index_order, dict):
+            self._initialize_ptype_indices()
+        else:
+            self.pii, self.regions = self._initialize_bitmap(index_order)
+            self.ds.index_order = (self.pii.order1, self.pii.order2)
+
+    def _initialize_ptype_indices(self):
+        # index_order maps particle types, or tuples of particle types, to the
+        # index order of a bitmap of their own.  Particle types left out of it
+        # share one more bitmap, with the default index order.
+        ds = self.dataset
+        self.pii = self.regions = None
+        self.ptype_indices = {}
+        grouped = set()
+        groups = []
+        for ptypes, index_order in ds.index_order.items():
+            if isinstance(ptypes, str):
+                ptypes = (ptypes,)
+            ptypes = tuple(ptypes)
+            groups.append((ptypes, index_order))
+            grouped.update(ptypes)
+        pcounts = self._get_particle_type_counts()
+        rest = tuple(sorted(pt for pt in pcounts if pt not in grouped))
+        if len(rest) > 0:
+            groups.append((rest, None))
+        for ptypes, index_order in groups:
+            self.ptype_indices[ptypes] = self._initialize_bitmap(index_order, ptypes)
+        ds.index_order = {
+            ptypes: (pii.order1, pii.order2)
+            for ptypes, (pii, _) in self.ptype_indices.items()
+        }
+
+    def _initialize_bitmap(self, index_order, ptypes=None):
+        # Builds the bitmap index of the particles of ptypes (of all types if
+        # None), or loads it from its sidecar file, and returns it along with
+        # its ParticleIndexInfo.
+        ds = self.dataset
+
         # use a trivial morton index for datasets containing a single chunk
         if len(self.data_files) == 1:
             order1 = 1
             order2 = 1
             mutable_index = False
         else:
-            mutable_index = ds.index_order is None
-            index_order = validate_index_order(ds.index_order)
+            mutable_index = index_order is None
+            index_order = validate_index_order(index_order)
             order1 = index_order[0]
             order2 = index_order[1]
 
@@ -207,89 +255,141 @@ class ParticleIndex(Index):
 
         # Load Morton index from file if provided
         fname = getattr(ds, "index_filename", None) or f"{ds.parameter_filename}.ewah"
+        if ptypes is not None:
+            root, ext = os.path.splitext(fname)
+            fname = f"{root}.{'-'.join(ptypes)}{ext}"
 
-        self.pii = ParticleIndexInfo(order1, order2, fname, mutable_index)
+        pii = ParticleIndexInfo(order1, order2, fname, mutable_index, ptypes)
 
-        self.regions = ParticleBitmap(
+        regions = ParticleBitmap(
             ds.domain_left_edge,
             ds.domain_right_edge,
             ds.periodicity,
             self.ds._file_hash,
             len(self.data_files),
-            index_order1=self.pii.order1,
-            index_order2=self.pii.order2_orig,
+            index_order1=pii.order1,
+            index_order2=pii.order2_orig,
         )
 
         dont_load = dont_cache and not hasattr(ds, "index_filename")
         try:
             if dont_load:
                 raise OSError
-            rflag, max_hsml = self.regions.load_bitmasks(fname)
-            if max_hsml > 0.0 and self.pii.mutable_index:
-                self._order2_update(max_hsml)
-            rflag = self.regions.check_bitmasks()
+            rflag, max_hsml = regions.load_bitmasks(fname)
+            if max_hsml > 0.0 and pii.mutable_index:
+                self._order2_update(max_hsml, pii, regions)
+            rflag = regions.check_bitmasks()
             self._initialize_frontend_specific()
             if rflag == 0:
                 raise OSError
-            self.pii._is_loaded = True
+            pii._is_loaded = True
         except (OSError, struct.error):
-            self.regions.reset_bitmasks()
-            max_hsml = self._initialize_coarse_index()
-            self._initialize_refined_index()
+            regions.reset_bitmasks()
+            max_hsml = self._initialize_coarse_index(pii, regions)
+            self._initialize_refined_index(pii, regions)
             wdir = os.path.dirname(fname)
             if not dont_cache and os.access(wdir, os.W_OK):
                 # Sometimes os mis-reports whether a directory is writable,
                 # So pass if writing the bitmask file fails.
                 try:
-                    self.regions.save_bitmasks(fname, max_hsml)
+                    regions.save_bitmasks(fname, max_hsml)
                 except OSError:
                     pass
-            rflag = self.regions.check_bitmasks()
-
-        self.ds.index_order = (self.pii.order1, self.pii.order2)
+            rflag = regions.check_bitmasks()
+        return pii, regions
 
-    def _order2_update(self, max_hsml):
+    def _order2_update(self, max_hsml, pii, regions):
         # By passing this in, we only allow index_order2 to be increased by
         # two at most, never increased.  One place this becomes particularly
         # useful is in the case of an extremely small section of gas
         # particles embedded in a much much larger domain.  The max
         # smoothing length will be quite small, so based on the larger
         # domain, it will correspond to a very very high index order, which
-        # is a large amount of memory!  Having multiple indexes, one for
-        # each particle type, would fix this.
-        new_order2 = self.regions.update_mi2(max_hsml, self.pii.order2 + 2)
-        self.pii.order2 = new_order2
+        # is a large amount of memory!  Passing a dict index_order, to get a
+        # bitmap per particle type, avoids this.
+        new_order2 = regions.update_mi2(max_hsml, pii.order2 + 2)
+        pii.order2 = new_order2
+
+    def _yield_indexed_coordinates(self, data_file, pii):
+        # Yields the coordinates of the particle types indexed by pii, along
+        # with their smoothing lengths for SPH particles.
+        ds = self.ds
+        for ptype, pos in self.io._yield_coordinates(data_file):
+            if pii.ptypes is not None and ptype not in pii.ptypes:
+                continue
+            if hasattr(ds, "_sph_ptypes") and ptype == ds._sph_ptypes[0]:
+                hsml = self.io._get_smoothing_length(data_file, pos.dtype, pos.shape)
+            else:
+                hsml = None
+            yield pos, hsml
+
+    def _coarse_index_data_file(self, data_file, pii, regions, file_id):
+        # Adds the coarse index of a file to column file_id of the masks of
+        # regions, and returns the largest smoothing length.
+        max_hsml = 0.0
+        for pos, hsml in self._yield_indexed_coordinates(data_file, pii):
+            if hsml is not None and hsml.size > 0.0:
+                max_hsml = max(max_hsml, hsml.max())
+            regions._coarse_index_data_file(pos, hsml, file_id)
+        return max_hsml
 
-    def _initialize_coarse_index(self):
+    def _initialize_coarse_index(self, pii, regions):
         max_hsml = 0.0
         pb = get_pbar("Initializing coarse index ", len(self.data_files))
-        for i, data_file in parallel_objects(enumerate(self.data_files)):
-            pb.update(i + 1)
-            for ptype, pos in self.io._yield_coordinates(data_file):
-                ds = self.ds
-                if hasattr(ds, "_sph_ptypes") and ptype == ds._sph_ptypes[0]:
-                    hsml = self.io._get_smoothing_length(
-                        data_file, pos.dtype, pos.shape
-                    )
-                    if hsml is not None and hsml.size > 0.0:
-                        max_hsml = max(max_hsml, hsml.max())
-                else:
-                    hsml = None
-                self.regions._coarse_index_data_file(pos, hsml, data_file.file_id)
+        if self.comm.size == 1 and not shared_memory_backend.is_active():
+            for i, data_file in enumerate(self.data_files):
+                pb.update(i + 1)
+                file_max_hsml = self._coarse_index_data_file(
+                    data_file, pii, regions, data_file.file_id
+                )
+                max_hsml = max(max_hsml, file_max_hsml)
+        else:
+            max_hsml = self._parallel_coarse_index(pii, regions, pb)
         pb.finish()
-        self.regions.masks = self.comm.mpi_allreduce(self.regions.masks, op="sum")
-        self.regions.particle_counts = self.comm.mpi_allreduce(
-            self.regions.particle_counts, op="sum"
-        )
         for data_file in self.data_files:
-            self.regions._set_coarse_index_data_file(data_file.file_id)
-        self.regions.find_collisions_coarse()
-        if max_hsml > 0.0 and self.pii.mutable_index:
-            self._order2_update(max_hsml)
+            regions._set_coarse_index_data_file(data_file.file_id)
+        regions.find_collisions_coarse()
+        if max_hsml > 0.0 and pii.mutable_index:
+            self._order2_update(max_hsml, pii, regions)
         return max_hsml
 
-    def _initialize_refined_index(self):
-        mask = self.regions.masks.sum(axis=1).astype("uint8")
+    def _parallel_coarse_index(self, pii, regions, pb):
+        # Files are indexed by separate processes into a single-file bitmap,
+        # allocated once and reset between files.  The coarse cells touched
+        # by each file, the number of particles in each and the largest
+        # smoothing length are handed back and merged into the index.
+        ds = self.ds
+        scratch = ParticleBitmap(
+            ds.domain_left_edge,
+            ds.domain_right_edge,
+            ds.periodicity,
+            ds._file_hash,
+            1,
+            index_order1=pii.order1,
+            index_order2=pii.order2_orig,
+        )
+        storage = {}
+        for sto, (i, data_file) in parallel_objects(
+            enumerate(self.data_files), storage=storage
+        ):
+            pb.update(i + 1)
+            file_max_hsml = self._coarse_index_data_file(data_file, pii, scratch, 0)
+            # Particle counts are only ever added where the mask is set
+            mi = np.flatnonzero(scratch.masks[:, 0])
+            sto.result_id = i
+            sto.result = (mi, scratch.particle_counts[mi], file_max_hsml)
+            scratch.masks[mi, 0] = 0
+            scratch.particle_counts[mi] = 0
+        max_hsml = 0.0
+        for i in sorted(storage):
+            mi, counts, file_max_hsml = storage.pop(i)
+            regions.masks[mi, self.data_files[i].file_id] = 1
+            regions.particle_counts[mi] += counts
+            max_hsml = max(max_hsml, file_max_hsml)
+        return max_hsml
+
+    def _initialize_refined_index(self, pii, regions):
+        mask = regions.masks.sum(axis=1).astype("uint8")
         max_npart = max(sum(d.total_particles.values()) for d in self.data_files) * 28
         sub_mi1 = np.zeros(max_npart, "uint64")
         sub_mi2 = np.zeros(max_npart, "uint64")
@@ -303,7 +403,7 @@ class ParticleIndex(Index):
         )
         total_refined = 0
         total_coarse_refined = (
-            (mask >= 2) & (self.regions.particle_counts > count_threshold)
+            (mask >= 2) & (regions.particle_counts > count_threshold)
         ).sum()
         mylog.debug(
             "This should produce roughly %s zones, for %s of the domain",
@@ -317,16 +417,10 @@ class ParticleIndex(Index):
             coll = None
             pb.update(i + 1)
             nsub_mi = 0
-            for ptype, pos in self.io._yield_coordinates(data_file):
+            for pos, hsml in self._yield_indexed_coordinates(data_file, pii):
                 if pos.size == 0:
                     continue
-                if hasattr(self.ds, "_sph_ptypes") and ptype == self.ds._sph_ptypes[0]:
-                    hsml = self.io._get_smoothing_length(
-                        data_file, pos.dtype, pos.shape
-                    )
-                else:
-                    hsml = None
-                nsub_mi, coll = self.regions._refined_index_data_file(
+                nsub_mi, coll = regions._refined_index_data_file(
                     coll,
                     pos,
                     hsml,
@@ -350,8 +444,75 @@ class ParticleIndex(Index):
             file_id, coll_str = storage[i]
             coll = BoolArrayCollection()
             coll.loads(coll_str)
-            self.regions.bitmasks.append(file_id, coll)
-        self.regions.find_collisions_refined()
+            regions.bitmasks.append(file_id, coll)
+        regions.find_collisions_refined()
+
+    def _get_particle_id_index(self, field):
+        # Returns the particle ids of field, sorted, along with the id of the
+        # data file holding each of them.  They are read once, and cached in a
+        # sidecar file next to the bitmap index.
+        if field in self._particle_id_indices:
+            return self._particle_id_indices[field]
+        ds = self.dataset
+        if not hasattr(ds, "_file_hash"):
+            ds._file_hash = self._generate_hash()
+        fname = getattr(ds, "index_filename", None) or f"{ds.parameter_filename}.ewah"
+        fname = "{}.{}.{}.npz".format(os.path.splitext(fname)[0], *field)
+        rv = None
+        if os.path.exists(fname):
+            with np.load(fname) as f:
+                if f["file_hash"] == ds._file_hash and f["nfiles"] == len(
+                    self.data_files
+                ):
+                    rv = f["ids"], f["file_ids"]
+        if rv is None:
+            rv = self._build_particle_id_index(field)
+            if os.access(os.path.dirname(os.path.abspath(fname)), os.W_OK):
+                try:
+                    np.savez(
+                        fname,
+                        ids=rv[0],
+                        file_ids=rv[1],
+                        file_hash=ds._file_hash,
+                        nfiles=len(self.data_files),
+                    )
+                except OSError:
+                    pass
+        self._particle_id_indices[field] = rv
+        return rv
+
+    def _build_particle_id_index(self, field):
+        mylog.info("Building the particle id index of %s", field)
+        dd = self.dataset.all_data()
+        ids = []
+        file_ids = []
+        for chunk in dd.chunks([], "io", chunk_sizing="auto"):
+            # Each of these io chunks holds a single container, which holds a
+            # single data file
+            (container,) = chunk._current_chunk.objs
+            (data_file,) = container.data_files
+            chunk_ids = chunk[field].d.astype("int64")
+            ids.append(chunk_ids)
+            file_ids.append(np.full(chunk_ids.size, data_file.file_id, "int32"))
+        ids = np.concatenate(ids)
+        order = np.argsort(ids, kind="stable")
+        return ids[order], np.concatenate(file_ids)[order]
+
+    def _select_particle_ids(self, dobj, field, ids):
+        """
+        Restricts dobj to the data files holding the particles whose field
+        (typically particle_index) is one of ids, so that reading fields from
+        it skips every other file.
+        """
+        if len(self.data_files) < 2:
+            return
+        index_ids, file_ids = self._get_particle_id_index(field)
+        file_ids = np.unique(file_ids[np.isin(index_ids, np.asarray(ids, "int64"))])
+        data_files = {data_file.file_id: data_file for data_file in self.data_files}
+        dobj._chunk_info = [
+            ParticleContainer(dobj, dobj.selector, [data_files[file_id]], domain_id=i)
+            for i, file_id in enumerate(file_ids, start=1)
+        ]
 
     def _detect_output_fields(self):
         # TODO: Add additional fields
@@ -386,13 +547,11 @@ class ParticleIndex(Index):
             else:
                 # TODO: only return files
                 if getattr(dobj.selector, "is_all_data", False):
-                    nfiles = self.regions.nfiles
+                    nfiles = len(self.data_files)
                     dfi = np.arange(nfiles)
                 else:
-                    dfi, file_masks, addfi = self.regions.identify_file_masks(
-                        dobj.selector
-                    )
-                    nfiles = len(file_masks)
+                    dfi = self._identify_data_files(dobj.selector)
+                    nfiles = len(dfi)
                 dobj._chunk_info = [None for _ in range(nfiles)]
 
                 # The following was moved here from ParticleContainer in order
@@ -423,6 +582,49 @@ class ParticleIndex(Index):
                 # like.
         (dobj._current_chunk,) = self._chunk_all(dobj)
 
+    def _identify_data_files(self, selector, ptypes=None):
+        # Returns the indices of the data files that may hold particles of
+        # ptypes (of any type if None) selected by selector, querying only the
+        # bitmaps that index these types.
+        if self.ptype_indices is None:
+            return self.regions.identify_file_masks(selector)[0]
+        dfi = [
+            regions.identify_file_masks(selector)[0]
+            for group, (_, regions) in self.ptype_indices.items()
+            if ptypes is None or not ptypes.isdisjoint(group)
+        ]
+        if len(dfi) == 0:
+            return np.empty(0, dtype="uint32")
+        return np.unique(np.concatenate(dfi))
+
+    def _particle_chunk_io(self, dobj, fields):
+        chunks = self._chunk_io(dobj, cache=False)
+        if self.ptype_indices is None or getattr(dobj.selector, "is_all_data", False):
+            return chunks
+        unions = self.ds.particle_unions
+        ptypes = set()
+        for ptype, _ in fields:
+            ptypes.update(unions[ptype] if ptype in unions else (ptype,))
+        ptypes = frozenset(ptypes)
+        if all(not ptypes.isdisjoint(group) for group in self.ptype_indices):
+            return chunks
+        # The files holding these particle types are looked up once per data
+        # object, rather than for every io chunk read.
+        cache = dobj.__dict__.setdefault("_ptype_file_ids", {})
+        if ptypes not in cache:
+            file_ids = self._identify_data_files(dobj.selector, ptypes)
+            cache[ptypes] = {self.data_files[i].file_id for i in file_ids}
+        file_ids = cache[ptypes]
+        return (
+            chunk
+            for chunk in chunks
+            if any(
+                data_file.file_id in file_ids
+                for obj in chunk.objs
+                for data_file in obj.data_files
+            )
+        )
+
     def _chunk_all(self, dobj):
         oobjs = getattr(dobj._current_chunk, "objs", dobj._chunk_info)
         yield YTDataChunk(dobj, "all", oobjs, None)
@@ -437,10 +639,24 @@ class ParticleIndex(Index):
                     g = og
                 yield YTDataChunk(dobj, "spatial", [g])
 
-    def _chunk_io(self, dobj, cache=True, local_only=False):
+    def _chunk_io(
+        self, dobj, cache=True, local_only=False, chunk_sizing="auto", nfields=1
+    ):
         oobjs = getattr(dobj._current_chunk, "objs", dobj._chunk_info)
-        for container in oobjs:
-            yield YTDataChunk(dobj, "io", [container], None, cache=cache)
+        if chunk_sizing == "auto":
+            chunks = ([container] for container in oobjs)
+        elif chunk_sizing == "memory":
+            # Particle positions are read alongside the fields, for selection.
+            chunks = self._memory_chunks(oobjs, self._count_container, nfields + 3)
+        else:
+            raise RuntimeError(
+                f"{chunk_sizing} is an invalid value for the 'chunk_sizing' argument."
+            )
+        for containers in chunks:
+            yield YTDataChunk(dobj, "io", containers, None, cache=cache)
+
+    def _count_container(self, container):
+        return sum(sum(df.total_particles.values()) for df in container.data_files)
 
     def _generate_hash(self):
         # Generate an FNV hash by creating a byte array containing the
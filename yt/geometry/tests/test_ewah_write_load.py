@@ -1,3 +1,5 @@
+import numpy as np
+
 from yt.loaders import load
 from yt.sample_data.api import _get_test_data_dir_path
 from yt.testing import assert_array_equal, requires_file
@@ -30,3 +32,27 @@ def test_ewah_write_load(tmp_path):
         masses.append(mass)
 
     assert_array_equal(masses[0], masses[1:])
+
+
+@requires_file("TNGHalo/halo_59.hdf5")
+def test_ptype_index_order(tmp_path):
+    mock_file = tmp_path / "halo_59.hdf5"
+    mock_file.symlink_to(_get_test_data_dir_path() / "TNGHalo" / "halo_59.hdf5")
+
+    ref = load(mock_file)
+    ds = load(mock_file, index_order={"PartType0": (5, 3)})
+    assert ds.index.regions is None
+    groups = list(ds.index.ptype_indices)
+    assert groups[0] == ("PartType0",)
+    assert ds.index_order[groups[0]] == (5, 3)
+    for ptypes in groups[1:]:
+        assert "PartType0" not in ptypes
+        assert (tmp_path / f"halo_59.hdf5.{'-'.join(ptypes)}.ewah").exists()
+
+    _, c = ref.find_max(("gas", "density"))
+    c += ref.quan(0.5, "Mpc")
+    for ptype in ref.particle_types_raw:
+        field = (ptype, "particle_mass")
+        v1 = ds.sphere(c, (20.0, "kpc"))[field]
+        v2 = ref.sphere(c, (20.0, "kpc"))[field]
+        assert_array_equal(np.sort(v1), np.sort(v2))
@@ -3,6 +3,7 @@ import random
 import numpy as np
 from numpy.testing import assert_equal, assert_raises
 
+from yt.config import ytcfg
 from yt.loaders import load_amr_grids
 
 
@@ -142,3 +143,39 @@ def test_grid_arrays_view():
     assert_equal(grid_arr["right_edge"], ds.index.grid_right_edge)
     assert_equal(grid_arr["dims"], ds.index.grid_dimensions)
     assert_equal(grid_arr["level"], ds.index.grid_levels[:, 0])
+
+
+def test_fast_index_selection():
+    ds = setup_test_ds()
+    c = ds.domain_center
+    objs = [
+        lambda: ds.sphere(c, 0.2),
+        lambda: ds.region(c, [0.1, 0.2, 0.3], [0.6, 0.7, 0.55]),
+        lambda: ds.slice(2, 0.5),
+    ]
+    fields = [("index", f) for f in ("x", "y", "z", "dx", "grid_level", "ones")]
+    fields.append(("gas", "density"))
+    old_value = ytcfg["yt", "fast_grid_index"]
+    try:
+        for make_obj in objs:
+            # The reference is fully evaluated before the fast index is
+            # enabled, since selection happens lazily.
+            ytcfg["yt", "fast_grid_index"] = False
+            ref = make_obj()
+            ref_fields = {f: ref[f] for f in fields}
+            ref_chunks = [
+                (chunk.fcoords, chunk.icoords, chunk.ires)
+                for chunk in ref.chunks([], "io")
+            ]
+            ytcfg["yt", "fast_grid_index"] = True
+            obj = make_obj()
+            assert ds.index._get_fast_index(obj) is not None
+            for field in fields:
+                assert_equal(obj[field], ref_fields[field])
+            for ref_chunk, chunk in zip(ref_chunks, obj.chunks([], "io"), strict=True):
+                assert obj._current_chunk._fast_index is not None
+                assert_equal(chunk.fcoords, ref_chunk[0])
+                assert_equal(chunk.icoords, ref_chunk[1])
+                assert_equal(chunk.ires, ref_chunk[2])
+    finally:
+        ytcfg["yt", "fast_grid_index"] = old_value
@@ -0,0 +1,88 @@
+import threading
+
+import numpy as np
+import pytest
+from numpy.testing import assert_equal
+
+from yt.config import ytcfg
+from yt.geometry.geometry_handler import prefetched
+from yt.testing import fake_random_ds
+
+
+@pytest.fixture
+def prefetch_bytes():
+    old_value = ytcfg["yt", "prefetch_bytes"]
+    yield
+    ytcfg["yt", "prefetch_bytes"] = old_value
+
+
+def test_prefetched_order():
+    items = list(range(20))
+    rv = list(prefetched(items, lambda i: i * 2, lambda i: 1, 4))
+    assert_equal(rv, [(i, i * 2) for i in items])
+    rv = list(prefetched(items, lambda i: i * 2, lambda i: 1, 0))
+    assert_equal(rv, [(i, i * 2) for i in items])
+
+
+def test_prefetched_budget():
+    lock = threading.Lock()
+    read = []
+
+    def read_item(i):
+        with lock:
+            read.append(i)
+        return i
+
+    for item, _ in prefetched(range(20), read_item, lambda i: 1, 3):
+        # Nothing beyond the budget is read ahead of the item being consumed
+        with lock:
+            assert max(read) <= item + 3
+
+
+def test_prefetch_results(prefetch_bytes):
+    ds = fake_random_ds(32, nprocs=8)
+    fields = [("gas", "density"), ("gas", "velocity_x")]
+
+    def compute():
+        sp = ds.sphere("c", 0.3)
+        prof = sp.profile(("gas", "density"), [("gas", "velocity_x")], n_bins=16)
+        return (
+            sp.quantities.weighted_average_quantity(fields, ("gas", "cell_mass")),
+            sp.quantities.extrema(fields),
+            prof["gas", "velocity_x"],
+            ds.proj(("gas", "density"), 0, data_source=sp)["gas", "density"],
+        )
+
+    ytcfg["yt", "prefetch_bytes"] = 0
+    ref = compute()
+    # A budget of a single chunk and one covering all of them
+    for budget in (32**3, 2**28):
+        ytcfg["yt", "prefetch_bytes"] = budget
+        for v, r in zip(compute(), ref, strict=True):
+            assert_equal(v, r)
+
+
+def test_prefetch_derived_quantities(prefetch_bytes):
+    ds = fake_random_ds(16, nprocs=8, particles=16**3)
+    ad = ds.all_data()
+    quantities = [
+        ("CenterOfMass", (), {"use_particles": True, "particle_type": "io"}),
+        ("BulkVelocity", (), {}),
+        ("AngularMomentumVector", (), {"use_particles": False}),
+        ("SpinParameter", (), {"use_particles": False}),
+        ("MaxLocation", (("gas", "density"),), {}),
+        ("MinLocation", (("gas", "density"),), {}),
+    ]
+    for name, args, kwargs in quantities:
+        dq = ad.quantities[name]
+        dq.count_values(*args, **kwargs)
+        fields = dq.prefetch_fields(*args, **kwargs)
+        assert len(fields) > 0
+        if name.endswith("Location"):
+            # These prefetch the field along with the positions they sample
+            assert len(fields) == 4
+
+        ytcfg["yt", "prefetch_bytes"] = 0
+        ref = np.asarray(ad.quantities[name](*args, **kwargs))
+        ytcfg["yt", "prefetch_bytes"] = 2**28
+        assert_equal(np.asarray(ad.quantities[name](*args, **kwargs)), ref)
@@ -75,8 +75,23 @@ class UnstructuredIndex(Index):
                 continue
             yield YTDataChunk(dobj, "spatial", [g], size)
 
-    def _chunk_io(self, dobj, cache=True, local_only=False):
+    def _chunk_io(
+        self, dobj, cache=True, local_only=False, chunk_sizing="auto", nfields=1
+    ):
         oobjs = getattr(dobj._current_chunk, "objs", dobj._chunk_info)
-        for subset in oobjs:
-            s = self._count_selection(dobj, oobjs)
-            yield YTDataChunk(dobj, "io", [subset], s, cache=cache)
+        if chunk_sizing == "auto":
+            chunks = ([subset] for subset in oobjs)
+        elif chunk_sizing == "memory":
+            chunks = self._memory_chunks(oobjs, self._count_mesh_values, nfields)
+        else:
+            raise RuntimeError(
+                f"{chunk_sizing} is an invalid value for the 'chunk_sizing' argument."
+            )
+        for subsets in chunks:
+            s = self._count_selection(dobj, subsets)
+            yield YTDataChunk(dobj, "io", subsets, s, cache=cache)
+
+    def _count_mesh_values(self, mesh):
+        # Nodal fields have a value per vertex of each element, which bounds
+        # the number of values of any field of this mesh.
+        return mesh.connectivity_indices.size
@@ -22,7 +22,7 @@ from yt._maintenance.deprecation import (
     issue_deprecation_warning,
 )
 from yt._typing import AnyFieldKey, AxisOrder, FieldKey
-from yt.data_objects.static_output import Dataset
+from yt.data_objects.static_output import Dataset, requested_field_dtype
 from yt.funcs import levenshtein_distance
 from yt.sample_data.api import lookup_on_disk_data
 from yt.utilities.decompose import decompose_array, get_psize
@@ -53,7 +53,13 @@ if TYPE_CHECKING:
 
 # FUTURE: embedded warnings need to have their stacklevel decremented when this decorator is removed
 @future_positional_only({0: "fn"}, since="4.2")
-def load(fn: Union[str, "os.PathLike[str]"], *args, hint: str | None = None, **kwargs):
+def load(
+    fn: Union[str, "os.PathLike[str]"],
+    *args,
+    hint: str | None = None,
+    field_dtype=None,
+    **kwargs,
+):
     """
     Load a Dataset or DatasetSeries object.
     The data format is automatically discovered, and the exact return type is the
@@ -72,6 +78,12 @@ def load(fn: Union[str, "os.PathLike[str]"], *args, hint: str | None = None, **k
         a YTAmbiguousDataType exception, this argument can be used to lift ambiguity.
         Hints are case insensitive.
 
+    field_dtype : str or numpy dtype, optional
+        The floating point precision fields are read and derived in, either
+        "float64" (the default) or "float32".  Single precision halves the
+        memory used by fields; positions, index fields, particle fields and
+        reductions are still computed in double precision.
+
     Additional arguments, if any, are passed down to the return class.
 
     Returns
@@ -100,9 +112,18 @@ def load(fn: Union[str, "os.PathLike[str]"], *args, hint: str | None = None, **k
     _input_fn = fn
     fn = os.path.expanduser(fn)
 
+    if field_dtype is not None:
+        field_dtype = np.dtype(field_dtype)
+        if field_dtype not in (np.float32, np.float64):
+            raise ValueError(
+                f"field_dtype must be float32 or float64, got {field_dtype}"
+            )
+
     if any(wildcard in fn for wildcard in "[]?!*"):
         from yt.data_objects.time_series import DatasetSeries
 
+        if field_dtype is not None:
+            kwargs["field_dtype"] = field_dtype
         return DatasetSeries(fn, *args, hint=hint, **kwargs)
 
     # This will raise FileNotFoundError if the path isn't matched
@@ -138,7 +159,8 @@ def load(fn: Union[str, "os.PathLike[str]"], *args, hint: str | None = None, **k
                 "Please verify your installation.",
                 stacklevel=3,
             )
-        return cls(fn, *args, **kwargs)
+        with requested_field_dtype(field_dtype):
+            return cls(fn, *args, **kwargs)
 
     if len(candidates) > 1:
         raise YTAmbiguousDataType(_input_fn, candidates)
@@ -245,8 +245,12 @@ class AMRKDTree(ParallelAnalysisInterface):
             return
         self.set_fields(fields, log_fields, no_ghost)
 
-    def traverse(self, viewpoint=None):
-        for node in self.tree.trunk.kd_traverse(viewpoint=viewpoint):
+    def traverse(self, viewpoint=None, front_to_back=False):
+        nodes = self.tree.trunk.kd_traverse(viewpoint=viewpoint)
+        if front_to_back:
+            # The viewpoint traversal starts from the furthest nodes
+            nodes = reversed(list(nodes))
+        for node in nodes:
             yield self.get_brick_data(node)
 
     def slice_traverse(self, viewpoint=None):
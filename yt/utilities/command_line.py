@@ -786,26 +786,30 @@ class YTMapserverCmd(YTCommand):
         p.set_log("all", args.takelog)
         p.set_cmap("all", args.cmap)
 
-        PannableMapServer(p.data_source, args.field, args.takelog, args.cmap)
+        mapserver = PannableMapServer(
+            p.data_source, args.field, args.takelog, args.cmap
+        )
         try:
             import bottle
         except ImportError as e:
+            mapserver.close()
             raise ImportError(
                 "The mapserver functionality requires the bottle "
                 "package to be installed. Please install using `pip "
                 "install bottle`."
             ) from e
         bottle.debug(True)
-        if args.host is not None:
-            colonpl = args.host.find(":")
-            if colonpl >= 0:
-                port = int(args.host.split(":")[-1])
-                args.host = args.host[:colonpl]
+        with mapserver:
+            if args.host is not None:
+                colonpl = args.host.find(":")
+                if colonpl >= 0:
+                    port = int(args.host.split(":")[-1])
+                    args.host = args.host[:colonpl]
+                else:
+                    port = 8080
+                bottle.run(server="auto", host=args.host, port=port)
             else:
-                port = 8080
-            bottle.run(server="auto", host=args.host, port=port)
-        else:
-            bottle.run(server="auto")
+                bottle.run(server="auto")
 
 
 class YTPastebinCmd(YTCommand):
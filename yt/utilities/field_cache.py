@@ -0,0 +1,226 @@
+"""
+A persistent, on-disk cache of field arrays.
+
+Arrays are stored as ``.npy`` files in a directory set by the
+``field_cache_dir`` configuration option.  Each entry is keyed by the hash of
+the dataset, the hash of the selector, the objects making up the chunk that
+was read and the field name.  Entries are read back memory-mapped, and the
+least recently used ones are evicted once the cache grows beyond
+``field_cache_max_bytes``.
+
+"""
+
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from yt.config import ytcfg
+from yt.fields.field_info_container import FieldInfoContainer
+from yt.utilities.logger import ytLogger as mylog
+
+_field_cache = None
+
+
+def get_field_cache():
+    """
+    Returns the on-disk field cache, or None if ``field_cache_dir`` is not set.
+    """
+    global _field_cache
+    path = ytcfg.get("yt", "field_cache_dir")
+    if not path:
+        return None
+    max_bytes = ytcfg.get("yt", "field_cache_max_bytes")
+    if _field_cache is None or _field_cache.path != path:
+        _field_cache = OnDiskFieldCache(path, max_bytes)
+    _field_cache.max_bytes = max_bytes
+    return _field_cache
+
+
+def _chunk_key(objs):
+    # Keys have to be stable between processes, so we rely on reprs of
+    # identifiers rather than on Python's (salted) hash.
+    key = []
+    for obj in objs:
+        data_files = getattr(obj, "data_files", None)
+        if data_files is not None:
+            key.append(
+                tuple((df.filename, df.file_id, df.start, df.end) for df in data_files)
+            )
+        else:
+            key.append((getattr(obj, "id", None), getattr(obj, "domain_id", None)))
+    return repr(key)
+
+
+def _function_key(finfo):
+    # Derived fields are also keyed by their definition, so that redefining a
+    # field does not serve stale values.  Returns None if the field cannot be
+    # cached, because its function captures values we cannot key.
+    func = getattr(finfo, "_function", None)
+    if getattr(func, "__code__", None) is None:
+        return ""
+    return _code_key(func, set())
+
+
+def _code_key(func, seen):
+    code = func.__code__
+    parts = [code.co_code, repr(code.co_consts).encode()]
+    # Fields made by the same factory share their code, and only differ by
+    # the values they capture.
+    seen.add(id(func))
+    for cell in func.__closure__ or ():
+        try:
+            value = cell.cell_contents
+        except ValueError:
+            # The cell is still empty
+            value = None
+        key = _value_key(value, seen)
+        if key is None:
+            return None
+        parts.append(key.encode())
+    return hashlib.md5(b"\n".join(parts)).hexdigest()
+
+
+def _value_key(value, seen):
+    if value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+        return repr(value)
+    if isinstance(value, np.generic):
+        return f"{value.dtype.str}:{value!r}"
+    if isinstance(value, np.ndarray):
+        if value.dtype.hasobject:
+            return None
+        digest = hashlib.md5(np.ascontiguousarray(value).tobytes()).hexdigest()
+        units = getattr(value, "units", "")
+        return f"{value.dtype.str}:{value.shape}:{units}:{digest}"
+    if isinstance(value, (tuple, list)):
+        keys = [_value_key(v, seen) for v in value]
+        if None in keys:
+            return None
+        return repr(keys)
+    if isinstance(value, FieldInfoContainer):
+        # Field factories capture the registry of the dataset they add their
+        # fields to, which is keyed by the hash of that dataset.
+        return f"registry:{value.ds._hash()}"
+    if getattr(value, "__code__", None) is not None:
+        if id(value) in seen:
+            return repr(value.__qualname__)
+        return _code_key(value, seen)
+    return None
+
+
+class OnDiskFieldCache:
+    def __init__(self, path, max_bytes):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._hits = 0
+        self._misses = 0
+        # A running estimate of the size of the cache, so that it is only
+        # walked once the budget seems to be exceeded.
+        self._total_bytes = None
+
+    def entry_key(self, dobj, field):
+        """
+        Returns the key under which *field* of the current chunk of *dobj* is
+        cached, or None if it cannot be cached.
+        """
+        chunk = dobj._current_chunk
+        if chunk is None or chunk.chunk_type not in ("all", "io"):
+            return None
+        finfo = dobj.ds._get_field_info(field)
+        parts = [
+            dobj.ds._hash(),
+            repr(hash(dobj.selector)),
+            _chunk_key(chunk.objs),
+            repr(field),
+            dobj.ds.field_dtype.str,
+        ]
+        if finfo.is_alias or field not in dobj.ds.field_list:
+            function_key = _function_key(finfo)
+            if function_key is None:
+                return None
+            parts.append(function_key)
+            parts.append(
+                repr(sorted((k, repr(v)) for k, v in dobj.field_parameters.items()))
+            )
+        return hashlib.md5("\n".join(parts).encode("utf-8")).hexdigest()
+
+    def _filenames(self, key):
+        base = os.path.join(self.path, key[:2], key)
+        return base + ".npy", base + ".json"
+
+    def load(self, key):
+        """
+        Returns a (copy-on-write memory-mapped array, units) pair, or None on
+        a miss.
+        """
+        fn, meta_fn = self._filenames(key)
+        try:
+            with open(meta_fn) as fh:
+                meta = json.load(fh)
+            arr = np.load(fn, mmap_mode="c")
+        except (OSError, ValueError):
+            self._misses += 1
+            return None
+        # Touch the entry so that eviction is least-recently-used
+        os.utime(fn)
+        self._hits += 1
+        return arr, meta["units"]
+
+    def store(self, key, arr):
+        fn, meta_fn = self._filenames(key)
+        os.makedirs(os.path.dirname(fn), exist_ok=True)
+        # Write to temporary files first, so that concurrent jobs sharing the
+        # cache never see a partial entry.
+        tmp = f"{fn}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as fh:
+            np.save(fh, np.asarray(arr))
+        os.replace(tmp, fn)
+        tmp = f"{meta_fn}.{os.getpid()}.tmp"
+        with open(tmp, "w") as fh:
+            json.dump({"units": str(getattr(arr, "units", "dimensionless"))}, fh)
+        os.replace(tmp, meta_fn)
+        if self._total_bytes is None:
+            self.evict()
+        else:
+            self._total_bytes += os.path.getsize(fn)
+            if self._total_bytes > self.max_bytes:
+                self.evict()
+
+    def evict(self):
+        """
+        Removes the least recently used entries until the cache fits within
+        its byte budget.
+        """
+        entries = []
+        total = 0
+        for root, _dirs, files in os.walk(self.path):
+            for name in files:
+                if not name.endswith(".npy"):
+                    continue
+                fn = os.path.join(root, name)
+                try:
+                    st = os.stat(fn)
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, fn))
+                total += st.st_size
+        entries.sort()
+        for _mtime, size, fn in entries:
+            if total <= self.max_bytes:
+                break
+            mylog.debug("Evicting %s from the field cache", fn)
+            for f in (fn, fn[: -len(".npy")] + ".json"):
+                try:
+                    os.remove(f)
+                except OSError:
+                    pass
+            total -= size
+        self._total_bytes = total
+
+    def clear(self):
+        max_bytes, self.max_bytes = self.max_bytes, -1
+        try:
+            self.evict()
+        finally:
+            self.max_bytes = max_bytes
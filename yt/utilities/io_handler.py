@@ -7,6 +7,7 @@ from functools import _make_key, lru_cache
 import numpy as np
 
 from yt._typing import FieldKey, ParticleCoordinateTuple
+from yt.config import ytcfg
 from yt.geometry.selection_routines import GridSelector
 from yt.utilities.on_demand_imports import _h5py as h5py
 
@@ -21,6 +22,49 @@ def _make_io_key(args, *_args, **kwargs):
     return _make_key((obj.id, field), *_args, **kwargs)
 
 
+@lru_cache(maxsize=32)
+def _mapped_file(filename, mtime):
+    # The modification time is part of the key, so that a file rewritten on
+    # disk is mapped again.
+    return np.memmap(filename, dtype="u1", mode="r")
+
+
+def mmap_hdf5_dataset(dset):
+    """
+    Returns a read-only memory-mapped view of an HDF5 dataset, or None if the
+    dataset cannot be mapped.
+
+    Only floating point datasets stored contiguously and without filters
+    (compression, checksums, ...) in a file opened with the default driver
+    can be mapped; the view then reads straight from the file's pages,
+    without going through an intermediate buffer.
+
+    Parameters
+    ----------
+    dset : h5py.Dataset or h5py.h5d.DatasetID
+        The dataset to map.
+    """
+    if not isinstance(dset, h5py.Dataset):
+        dset = h5py.Dataset(dset)
+    if dset.dtype.kind != "f" or dset.file.driver != "sec2":
+        return None
+    dcpl = dset.id.get_create_plist()
+    if (
+        dcpl.get_layout() != h5py.h5d.CONTIGUOUS
+        or dcpl.get_nfilters() > 0
+        or dcpl.get_external_count() > 0
+    ):
+        return None
+    offset = dset.id.get_offset()
+    if offset is None:
+        # Storage has not been allocated
+        return None
+    filename = dset.file.filename
+    buf = _mapped_file(filename, os.stat(filename).st_mtime_ns)
+    nbytes = dset.size * dset.dtype.itemsize
+    return buf[offset : offset + nbytes].view(dset.dtype).reshape(dset.shape)
+
+
 class BaseIOHandler:
     _vector_fields: dict[str, int] = {}
     _dataset_type: str
@@ -90,6 +134,13 @@ class BaseIOHandler:
         else:
             return self._read_data(grid, field)
 
+    def _mmap_hdf5_dataset(self, dset):
+        # Returns a memory-mapped view of an HDF5 dataset if the mmap_hdf5
+        # option is on and the dataset can be mapped, and None otherwise.
+        if not ytcfg.get("yt", "mmap_hdf5"):
+            return None
+        return mmap_hdf5_dataset(dset)
+
     # Now we define our interface
     def _read_data(self, grid, field):
         pass
@@ -104,22 +155,27 @@ class BaseIOHandler:
         # the base class.
         rv = {}
         nodal_fields = []
+        field_dtype = self.ds.field_dtype
         for field in fields:
             finfo = self.ds.field_info[field]
             nodal_flag = finfo.nodal_flag
             if np.any(nodal_flag):
                 num_nodes = 2 ** sum(nodal_flag)
-                rv[field] = np.empty((size, num_nodes), dtype="=f8")
+                rv[field] = np.empty((size, num_nodes), dtype=field_dtype)
                 nodal_fields.append(field)
             else:
-                rv[field] = np.empty(size, dtype="=f8")
+                rv[field] = np.empty(size, dtype=field_dtype)
         ind = dict.fromkeys(fields, 0)
         for field, obj, data in self.io_iter(chunks, fields):
             if data is None:
                 continue
             if isinstance(selector, GridSelector) and field not in nodal_fields:
                 ind[field] += data.size
-                rv[field] = data.copy()
+                # This also turns memory-mapped data into a native array
+                dtype = data.dtype.newbyteorder("=")
+                if field_dtype == np.float32 and dtype.kind == "f":
+                    dtype = field_dtype
+                rv[field] = np.array(data, dtype=dtype)
             else:
                 ind[field] += obj.select(selector, data, rv[field], ind[field])
         return rv
@@ -135,8 +191,8 @@ class BaseIOHandler:
         sl = [slice(None), slice(None), slice(None)]
         sl[axis] = slice(coord, coord + 1)
         tr = self._read_data_set(grid, field)[tuple(sl)]
-        if tr.dtype == "float32":
-            tr = tr.astype("float64")
+        if tr.dtype.kind == "f" and tr.dtype != self.ds.field_dtype:
+            tr = tr.astype(self.ds.field_dtype)
         return tr
 
     def _read_field_names(self, grid):
@@ -109,6 +109,36 @@ cdef inline void FIT_eval_transfer(
             ta = fmax(1.0-dt*trgba[i], 0.0)
             rgba[i] = dt*trgba[i] + ta*rgba[i]
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cdef inline void FIT_eval_transfer_front_to_back(
+        const np.float64_t dt, np.float64_t *dvs,
+        np.float64_t *rgba, const int n_fits,
+        const FieldInterpolationTable fits[6],
+        const int field_table_ids[6]) noexcept nogil:
+    # The same as FIT_eval_transfer with grey opacity, but for samples taken
+    # *behind* what has been accumulated so far, which are attenuated by the
+    # transmittance 1 - rgba[3] in front of them.
+    cdef int i, fid
+    cdef np.float64_t ta, tr
+    cdef np.float64_t istorage[6]
+    cdef np.float64_t trgba[6]
+    for i in range(n_fits):
+        istorage[i] = FIT_get_value(&fits[i], dvs)
+    for i in range(n_fits):
+        fid = fits[i].weight_table_id
+        if fid != -1:
+            istorage[i] *= istorage[fid]
+    for i in range(6):
+        trgba[i] = istorage[field_table_ids[i]]
+
+    ta = fmax(1.0 - dt*trgba[3], 0.0)
+    tr = 1.0 - rgba[3]
+    for i in range(3):
+        rgba[i] += tr*dt*trgba[i]
+    rgba[3] = 1.0 - tr*ta
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
@@ -57,6 +57,8 @@ cdef class ImageSampler:
     cdef np.float64_t width[3]
     cdef public object lens_type
     cdef public str volume_method
+    cdef public int front_to_back
+    cdef public np.float64_t opacity_threshold
     cdef calculate_extent_function *extent_function
     cdef generate_vector_info_function *vector_function
     cdef void setup(self, PartitionedGrid pg)
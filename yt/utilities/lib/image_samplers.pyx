@@ -23,6 +23,7 @@ from yt.utilities.lib.fp_utils cimport fclip, i64clip, imin
 from .field_interpolation_tables cimport (
     FieldInterpolationTable,
     FIT_eval_transfer,
+    FIT_eval_transfer_front_to_back,
     FIT_eval_transfer_with_light,
     FIT_initialize_table,
 )
@@ -53,6 +54,8 @@ cdef struct VolumeRenderAccumulator:
     np.float64_t *light_dir
     np.float64_t *light_rgba
     int grey_opacity
+    int front_to_back
+    np.float64_t opacity_threshold
 
 
 cdef class ImageSampler:
@@ -71,6 +74,11 @@ cdef class ImageSampler:
         cdef int i
 
         self.volume_method = volume_method
+        # Rays can instead be walked from the front of the volume, in which
+        # case those that are more opaque than opacity_threshold are no
+        # longer sampled.
+        self.front_to_back = kwargs.pop("front_to_back", 0)
+        self.opacity_threshold = kwargs.pop("opacity_threshold", 1.0)
         camera_data = kwargs.pop("camera_data", None)
         if camera_data is not None:
             self.camera_data = camera_data
@@ -183,6 +191,13 @@ cdef class ImageSampler:
                 for i in range(Nch):
                     idata.rgba[i] = self.image[vi, vj, i]
                 max_t = fclip(self.zbuffer[vi, vj], 0.0, 1.0)
+                if self.front_to_back:
+                    if idata.rgba[3] >= self.opacity_threshold:
+                        continue
+                    # Walk the same segment of the ray in the other direction
+                    for i in range(3):
+                        v_pos[i] += max_t * v_dir[i]
+                        v_dir[i] = -v_dir[i]
                 walk_volume(vc, v_pos, v_dir, self.sample,
                             (<void *> idata), NULL, max_t)
                 if (j % (10*chunksize)) == 0:
@@ -421,6 +436,10 @@ cdef class VolumeRenderSampler(ImageSampler):
                                x_vec, y_vec, width, volume_method, **kwargs)
         cdef int i
         cdef np.ndarray[np.float64_t, ndim=1] temp
+        if self.front_to_back and not getattr(tf_obj, "grey_opacity", 0):
+            raise ValueError(
+                "Front to back rendering requires a transfer function "
+                "with grey opacity.")
         # Now we handle tf_obj
         self.vra = <VolumeRenderAccumulator *> \
             malloc(sizeof(VolumeRenderAccumulator))
@@ -430,6 +449,8 @@ cdef class VolumeRenderSampler(ImageSampler):
         assert(self.vra.n_fits <= 6)
         self.vra.grey_opacity = getattr(tf_obj, "grey_opacity", 0)
         self.vra.n_samples = n_samples
+        self.vra.front_to_back = self.front_to_back
+        self.vra.opacity_threshold = self.opacity_threshold
         self.my_field_tables = []
         for i in range(self.vra.n_fits):
             temp = tf_obj.tables[i].y
@@ -468,6 +489,8 @@ cdef class VolumeRenderSampler(ImageSampler):
                         + index[1] * (vc.dims[2]) + index[2]
         if vc.mask[cell_offset] != 1:
             return
+        if vri.front_to_back and im.rgba[3] >= vri.opacity_threshold:
+            return
         cdef np.float64_t dp[3]
         cdef np.float64_t ds[3]
         cdef np.float64_t dt = (exit_t - enter_t) / vri.n_samples
@@ -481,12 +504,18 @@ cdef class VolumeRenderSampler(ImageSampler):
             for j in range(vc.n_fields):
                 dvs[j] = offset_interpolate(vc.dims, dp,
                         vc.data[j] + offset)
-            FIT_eval_transfer(dt, dvs, im.rgba, vri.n_fits,
-                    vri.fits, vri.field_table_ids, vri.grey_opacity)
+            if vri.front_to_back:
+                FIT_eval_transfer_front_to_back(dt, dvs, im.rgba, vri.n_fits,
+                        vri.fits, vri.field_table_ids)
+            else:
+                FIT_eval_transfer(dt, dvs, im.rgba, vri.n_fits,
+                        vri.fits, vri.field_table_ids, vri.grey_opacity)
             for j in range(3):
                 dp[j] += ds[j]
 
     def __dealloc__(self):
+        if self.vra == NULL:
+            return
         for i in range(self.vra.n_fits):
             free(self.vra.fits[i].d0)
             free(self.vra.fits[i].dy)
@@ -277,6 +277,127 @@ def pixelize_cartesian(np.float64_t[:,:] buff,
     if return_mask:
         return mask_arr.astype("bool")
 
+@cython.cdivision(True)
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def pixelize_cartesian_multi(np.float64_t[:,:,:] buff,
+                             any_float[:] px,
+                             any_float[:] py,
+                             any_float[:] pdx,
+                             any_float[:] pdy,
+                             np.float64_t[:,:] data,
+                             bounds,
+                             int antialias = 1,
+                             period = None,
+                             int check_period = 1,
+                             *,
+                             int return_mask = 0,
+):
+    # This is pixelize_cartesian for several fields at once: data holds the
+    # values of a field in each of its columns, and buff an image of each of
+    # them along its last axis.  The pixels each cell overlaps, and the
+    # overlaps themselves, are only computed once for all of the fields.
+    cdef np.float64_t x_min, x_max, y_min, y_max
+    cdef np.float64_t period_x = 0.0, period_y = 0.0
+    cdef np.float64_t width, height, px_dx, px_dy, ipx_dx, ipx_dy
+    cdef int i, j, k, p, xi, yi, nf
+    cdef int lc, lr, rc, rr
+    cdef np.float64_t lypx, rypx, lxpx, rxpx, overlap1, overlap2
+    cdef np.float64_t oxsp, oysp, xsp, ysp, dxsp, dysp
+    cdef int xiter[2]
+    cdef int yiter[2]
+    cdef np.float64_t xiterv[2]
+    cdef np.float64_t yiterv[2]
+
+    cdef np.ndarray[np.uint8_t, ndim=2] mask_arr = np.zeros(
+        (buff.shape[0], buff.shape[1]), dtype="uint8")
+    cdef np.uint8_t[:, :] mask = mask_arr
+
+    if period is not None:
+        period_x = period[0]
+        period_y = period[1]
+    x_min = bounds[0]
+    x_max = bounds[1]
+    y_min = bounds[2]
+    y_max = bounds[3]
+    width = x_max - x_min
+    height = y_max - y_min
+    px_dx = width / (<np.float64_t> buff.shape[1])
+    px_dy = height / (<np.float64_t> buff.shape[0])
+    ipx_dx = 1.0 / px_dx
+    ipx_dy = 1.0 / px_dy
+    nf = buff.shape[2]
+    if px.shape[0] != py.shape[0] or \
+       px.shape[0] != pdx.shape[0] or \
+       px.shape[0] != pdy.shape[0] or \
+       px.shape[0] != data.shape[0] or \
+       data.shape[1] != nf:
+        raise YTPixelizeError("Arrays are not of correct shape.")
+    xiter[0] = yiter[0] = 0
+    xiterv[0] = yiterv[0] = 0.0
+    # See pixelize_cartesian for the details of the traversal.
+    with nogil:
+        for p in range(px.shape[0]):
+            xiter[1] = yiter[1] = 999
+            xiterv[1] = yiterv[1] = 0.0
+            oxsp = px[p]
+            oysp = py[p]
+            dxsp = pdx[p]
+            dysp = pdy[p]
+            if check_period == 1:
+                if (oxsp - dxsp < x_min):
+                    xiter[1] = +1
+                    xiterv[1] = period_x
+                elif (oxsp + dxsp > x_max):
+                    xiter[1] = -1
+                    xiterv[1] = -period_x
+                if (oysp - dysp < y_min):
+                    yiter[1] = +1
+                    yiterv[1] = period_y
+                elif (oysp + dysp > y_max):
+                    yiter[1] = -1
+                    yiterv[1] = -period_y
+            overlap1 = overlap2 = 1.0
+            for xi in range(2):
+                if xiter[xi] == 999: continue
+                xsp = oxsp + xiterv[xi]
+                if (xsp + dxsp < x_min) or (xsp - dxsp > x_max): continue
+                for yi in range(2):
+                    if yiter[yi] == 999: continue
+                    ysp = oysp + yiterv[yi]
+                    if (ysp + dysp < y_min) or (ysp - dysp > y_max): continue
+                    lc = <int> fmax(((xsp-dxsp-x_min)*ipx_dx),0)
+                    lr = <int> fmax(((ysp-dysp-y_min)*ipx_dy),0)
+                    rc = <int> fmin(((xsp+dxsp-x_min)*ipx_dx + 1), buff.shape[1])
+                    rr = <int> fmin(((ysp+dysp-y_min)*ipx_dy + 1), buff.shape[0])
+                    for i in range(lr, rr):
+                        lypx = px_dy * i + y_min
+                        rypx = px_dy * (i+1) + y_min
+                        if antialias == 1:
+                            overlap2 = ((fmin(rypx, ysp+dysp)
+                                       - fmax(lypx, (ysp-dysp)))*ipx_dy)
+                        if overlap2 < 0.0: continue
+                        for j in range(lc, rc):
+                            lxpx = px_dx * j + x_min
+                            rxpx = px_dx * (j+1) + x_min
+                            if antialias == 1:
+                                overlap1 = ((fmin(rxpx, xsp+dxsp)
+                                           - fmax(lxpx, (xsp-dxsp)))*ipx_dx)
+                                if overlap1 < 0.0: continue
+                                if overlap1 * overlap2 < 1.e-6: continue
+                                for k in range(nf):
+                                    if buff[i,j,k] != buff[i,j,k]:
+                                        buff[i,j,k] = 0.0
+                                    buff[i,j,k] += (data[p,k] * overlap1) * overlap2
+                                mask[i,j] = 1
+                            else:
+                                for k in range(nf):
+                                    buff[i,j,k] = data[p,k]
+                                mask[i,j] = 1
+
+    if return_mask:
+        return mask_arr.astype("bool")
+
 @cython.cdivision(True)
 @cython.boundscheck(False)
 @cython.wraparound(False)
@@ -551,9 +551,12 @@ cdef void QTN_merge_nodes(QuadTreeNode *n1, QuadTreeNode *n2, int nvals,
     # 3. If n2 has refinement and n1 does not, we detach n2's children and
     #    attach them to n1.
     # 4. If n1 has refinement and n2 does not, we add the value of n2 to n1.
+    # A node of n2 that was never given a value (it has no weight) is not
+    # combined, as its zero value would otherwise win a min or max merge.
     cdef int i, j
 
-    func(n1, n2.val, n2.weight_val, nvals)
+    if n2.weight_val != 0.0:
+        func(n1, n2.val, n2.weight_val, nvals)
     if n1.children[0][0] == n2.children[0][0] == NULL:
         pass
     elif n1.children[0][0] != NULL and n2.children[0][0] != NULL:
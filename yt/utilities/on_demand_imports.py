@@ -462,6 +462,18 @@ class requests_imports(OnDemand):
 
         return exceptions
 
+    @safe_import
+    def Session(self):
+        from requests import Session
+
+        return Session
+
+    @safe_import
+    def adapters(self):
+        from requests import adapters
+
+        return adapters
+
 
 _requests = requests_imports()
 
@@ -68,12 +68,21 @@ def default_mpi_excepthook(exception_type, exception_value, tb):
     MPI.COMM_WORLD.Abort(1)
 
 
-def enable_parallelism(suppress_logging: bool = False, communicator=None) -> bool:
+def enable_parallelism(
+    suppress_logging: bool = False,
+    communicator=None,
+    backend: str = "mpi",
+    num_procs: int | None = None,
+) -> bool:
     """
     This method is used inside a script to turn on MPI parallelism, via
     mpi4py.  More information about running yt in parallel can be found
     here: https://yt-project.org/docs/3.0/analyzing/parallel_computation.html
 
+    Alternatively, with backend="multiprocessing", parallel_objects and
+    DatasetSeries.piter are parallelized over processes forked on the
+    current node, and the script does not need to be launched with mpirun.
+
     Parameters
     ----------
     suppress_logging : bool
@@ -84,12 +93,25 @@ def enable_parallelism(suppress_logging: bool = False, communicator=None) -> boo
         The MPI communicator to use. This controls which processes yt can see.
         If not specified, will be set to COMM_WORLD.
 
+    backend : str
+        Either "mpi" (the default) or "multiprocessing".
+
+    num_procs : int
+        The number of worker processes used by the "multiprocessing" backend.
+        If not specified, will be set to the number of available CPUs.
+
     Returns
     -------
     parallel_capable: bool
         True if the call was successful. False otherwise.
     """
     global parallel_capable, MPI
+    if backend == "multiprocessing":
+        from . import shared_memory_backend
+
+        return shared_memory_backend.enable(num_procs)
+    elif backend != "mpi":
+        raise ValueError(f"Unknown parallel backend {backend!r}")
     try:
         from mpi4py import MPI as _MPI
     except ImportError:
@@ -502,7 +524,8 @@ def parallel_objects(objects, njobs=0, storage=None, barrier=True, dynamic=False
         This governs whether or not dynamic load balancing will be enabled.
         This requires one dedicated processor; if this is enabled with a set of
         128 processors available, only 127 will be available to iterate over
-        objects as one will be load balancing the rest.
+        objects as one will be load balancing the rest.  With the
+        multiprocessing backend no processor is dedicated to load balancing.
 
 
     Examples
@@ -528,6 +551,20 @@ def parallel_objects(objects, njobs=0, storage=None, barrier=True, dynamic=False
     ...
 
     """
+    from . import shared_memory_backend
+
+    # Forked workers can only hand back what the loop body puts in storage,
+    # so loops without it keep running serially on this process.
+    if (
+        not parallel_capable
+        and storage is not None
+        and shared_memory_backend.is_active()
+    ):
+        yield from shared_memory_backend.shared_memory_parallel_objects(
+            objects, njobs=njobs, storage=storage, dynamic=dynamic
+        )
+        return
+
     if dynamic:
         from .task_queue import dynamic_parallel_objects
 
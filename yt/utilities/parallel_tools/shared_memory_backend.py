@@ -0,0 +1,320 @@
+"""
+A single-node alternative to the MPI backend of parallel_objects.
+
+Rather than launching the script under mpirun, the process that reaches
+parallel_objects forks a pool of workers.  Each worker resumes the loop body
+for its own share of the objects, exactly as an MPI rank would, and then hands
+its results back to the parent before exiting.  Arrays above a small size
+threshold are passed back through shared memory segments instead of being
+pickled through the pipe.
+
+"""
+
+import itertools
+import multiprocessing
+import os
+import sys
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+from yt.data_objects.image_array import ImageArray
+from yt.units.unit_registry import UnitRegistry  # type: ignore
+from yt.units.yt_array import YTArray
+from yt.utilities.logger import ytLogger as mylog
+
+# Number of worker processes to fork; 0 means the backend is disabled.
+num_procs = 0
+# Set in the forked workers, so that nested calls run serially.
+_worker_rank = None
+# Arrays smaller than this many bytes are simply pickled.
+shared_memory_threshold = 1 << 16
+
+_ops = {"sum": np.add, "min": np.minimum, "max": np.maximum}
+
+
+def enable(nprocs=None):
+    global num_procs
+    if not hasattr(os, "fork"):
+        mylog.error(
+            "Could not enable parallelism: the multiprocessing backend "
+            "requires a platform that supports fork"
+        )
+        return False
+    if nprocs is None:
+        nprocs = os.cpu_count() or 1
+    num_procs = int(nprocs)
+    mylog.info("Shared-memory parallel computation enabled: %s workers", num_procs)
+    return True
+
+
+def is_active():
+    return num_procs > 1 and _worker_rank is None
+
+
+class _SharedArray:
+    """
+    A pickleable reference to an array living in a shared memory segment.
+    """
+
+    def __init__(self, arr):
+        self.shape = arr.shape
+        self.dtype = arr.dtype.str
+        if isinstance(arr, YTArray):
+            self.unit_metadata = (str(arr.units), arr.units.registry.lut)
+            if isinstance(arr, ImageArray):
+                self.unit_metadata += ("ImageArray",)
+            else:
+                self.unit_metadata += ("YTArray",)
+        else:
+            self.unit_metadata = ()
+        shm = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+        buf = np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)
+        buf[...] = arr.view(np.ndarray)
+        self.name = shm.name
+        del buf
+        # The receiving end is responsible for unlinking the segment, so we
+        # must not let the tracker of a worker that is about to exit remove it.
+        resource_tracker.unregister(shm._name, "shared_memory")
+        shm.close()
+
+    def retrieve(self):
+        shm = shared_memory.SharedMemory(name=self.name)
+        try:
+            arr = np.ndarray(self.shape, dtype=self.dtype, buffer=shm.buf).copy()
+        finally:
+            shm.close()
+            shm.unlink()
+        if len(self.unit_metadata) == 3:
+            units, lut, kind = self.unit_metadata
+            registry = UnitRegistry(lut=lut, add_default_symbols=False)
+            if kind == "ImageArray":
+                arr = ImageArray(arr, units=units, registry=registry)
+            else:
+                arr = YTArray(arr, units, registry=registry)
+        return arr
+
+
+def _pack(data):
+    if isinstance(data, np.ndarray):
+        if data.dtype.hasobject or data.nbytes < shared_memory_threshold:
+            return data
+        return _SharedArray(data)
+    if isinstance(data, dict):
+        return {k: _pack(v) for k, v in data.items()}
+    if isinstance(data, (list, tuple)):
+        return type(data)(_pack(v) for v in data)
+    return data
+
+
+def _unpack(data):
+    if isinstance(data, _SharedArray):
+        return data.retrieve()
+    if isinstance(data, dict):
+        return {k: _unpack(v) for k, v in data.items()}
+    if isinstance(data, (list, tuple)):
+        return type(data)(_unpack(v) for v in data)
+    return data
+
+
+class SharedMemoryCommunicator:
+    """
+    This provides collective operations between the parent process (rank 0)
+    and its forked workers.  Each worker holds one end of a pipe to the
+    parent; collectives gather to the parent, combine and send the result back
+    out.
+
+    While the body of a loop runs, as with MPI, the communicator of the job
+    is on top of the communication system and this one is right below it, so
+    that it can be reached with ``communication_system.communicators[-2]``.
+    Like any collective, its operations must be called by every process, the
+    same number of times.
+    """
+
+    def __init__(self, rank, size, conns):
+        self.rank = rank
+        self.size = size
+        # On the parent this is a list of the connections to ranks 1..size-1;
+        # on a worker it is a single-element list holding the parent end.
+        self.conns = conns
+
+    def _gather(self, data):
+        # Returns the list of contributions, ordered by rank, on the parent
+        # and None on the workers.
+        if self.rank != 0:
+            self.conns[0].send(_pack(data))
+            return None
+        values = [data]
+        for i, conn in enumerate(self.conns):
+            try:
+                values.append(_unpack(conn.recv()))
+            except EOFError:
+                raise RuntimeError(
+                    f"Worker {i + 1} exited before sending its results."
+                ) from None
+        return values
+
+    def _bcast(self, data):
+        if self.rank != 0:
+            return _unpack(self.conns[0].recv())
+        for conn in self.conns:
+            conn.send(_pack(data))
+        return data
+
+    def barrier(self):
+        self._bcast(self._gather(None))
+
+    def mpi_bcast(self, data, root=0):
+        values = self._gather(data if self.rank == root else None)
+        if values is not None:
+            data = values[root]
+        return self._bcast(data)
+
+    def par_combine_object(self, data, op, datatype=None):
+        if datatype is None:
+            if isinstance(data, dict):
+                datatype = "dict"
+            elif isinstance(data, np.ndarray):
+                datatype = "array"
+            elif isinstance(data, list):
+                datatype = "list"
+        values = self._gather(data)
+        if values is not None:
+            if datatype == "dict" and op == "join":
+                data = {}
+                for v in values:
+                    data.update(v)
+            elif datatype == "dict" and op == "cat":
+                data = {
+                    key: np.concatenate([v[key] for v in values], axis=-1)
+                    for key in sorted(values[0])
+                }
+            elif datatype == "array" and op == "cat":
+                data = np.concatenate([v for v in values if v is not None], axis=-1)
+            elif datatype == "list" and op == "cat":
+                data = list(itertools.chain.from_iterable(values))
+            else:
+                raise NotImplementedError
+        return self._bcast(data)
+
+    def mpi_allreduce(self, data, dtype=None, op="sum"):
+        values = self._gather(data)
+        if values is not None:
+            data = values[0]
+            if isinstance(data, np.ndarray) and dtype is not None:
+                data = data.astype(dtype)
+            for v in values[1:]:
+                data = _ops[op](data, v)
+        return self._bcast(data)
+
+
+def _fork_workers(nprocs):
+    """
+    Fork nprocs - 1 workers.  Returns the communicator for the calling process
+    and, on the parent, the list of worker process ids.
+    """
+    global _worker_rank
+    ctx = multiprocessing.get_context("fork")
+    parent_conns = []
+    pids = []
+    for rank in range(1, nprocs):
+        parent_end, child_end = ctx.Pipe()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pid = os.fork()
+        if pid == 0:
+            for conn in parent_conns:
+                conn.close()
+            parent_end.close()
+            _worker_rank = rank
+            return SharedMemoryCommunicator(rank, nprocs, [child_end]), None
+        child_end.close()
+        parent_conns.append(parent_end)
+        pids.append(pid)
+    return SharedMemoryCommunicator(0, nprocs, parent_conns), pids
+
+
+def _exit_worker(comm, status):
+    sys.stdout.flush()
+    sys.stderr.flush()
+    for conn in comm.conns:
+        conn.close()
+    os._exit(status)
+
+
+def shared_memory_parallel_objects(objects, njobs=0, storage=None, dynamic=False):
+    """
+    The fork-based counterpart of
+    :func:`~yt.utilities.parallel_tools.parallel_analysis_interface.parallel_objects`.
+
+    Objects are dealt out round-robin to the workers or, if *dynamic* is
+    set, claimed one at a time from a shared counter, so that no processor
+    needs to be dedicated to load balancing.  Because the loop body runs in
+    forked workers, it must not ``break`` out of the loop, and any state it
+    modifies outside of *storage* is only seen by the worker that ran it.
+    For this reason, parallel_objects only uses this backend for loops that
+    are given a *storage* dictionary.
+    """
+    from .parallel_analysis_interface import (
+        Communicator,
+        ResultsStorage,
+        communication_system,
+    )
+
+    nprocs = num_procs if njobs <= 0 else min(njobs, num_procs)
+    if dynamic:
+        ctx = multiprocessing.get_context("fork")
+        counter = ctx.Value("q", 0)
+
+        def claim():
+            with counter.get_lock():
+                val = counter.value
+                counter.value += 1
+            return val
+
+    comm, pids = _fork_workers(nprocs)
+    # Like parallel_objects with MPI, every job gets its own communicator,
+    # stacked on top of the one shared by all of the processes.
+    communication_system.communicators.append(comm)
+    communication_system.push(Communicator(None))
+    to_share = {}
+    try:
+        if dynamic:
+            oiter = _claimed(enumerate(objects), claim)
+        else:
+            oiter = itertools.islice(enumerate(objects), comm.rank, None, nprocs)
+        for result_id, obj in oiter:
+            if storage is not None:
+                rstore = ResultsStorage()
+                rstore.result_id = result_id
+                yield rstore, obj
+                to_share[rstore.result_id] = rstore.result
+            else:
+                yield obj
+        if comm.rank != 0:
+            comm._gather(to_share)
+            _exit_worker(comm, 0)
+        new_storage = comm._gather(to_share)
+    except BaseException:
+        if comm.rank != 0:
+            _exit_worker(comm, 1)
+        raise
+    finally:
+        communication_system.pop()
+        communication_system.pop()
+        if pids is not None:
+            for conn in comm.conns:
+                conn.close()
+            for pid in pids:
+                os.waitpid(pid, 0)
+    if storage is not None:
+        for values in new_storage:
+            storage.update(values)
+
+
+def _claimed(oiter, claim):
+    my_id = claim()
+    for result_id, obj in oiter:
+        if result_id == my_id:
+            yield result_id, obj
+            my_id = claim()
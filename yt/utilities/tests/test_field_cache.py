@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_equal
+
+from yt.config import ytcfg
+from yt.testing import fake_random_ds
+from yt.utilities.field_cache import get_field_cache
+
+
+@pytest.fixture
+def field_cache(tmp_path):
+    old_dir = ytcfg["yt", "field_cache_dir"]
+    ytcfg["yt", "field_cache_dir"] = str(tmp_path)
+    yield get_field_cache()
+    ytcfg["yt", "field_cache_dir"] = old_dir
+
+
+def test_field_cache_roundtrip(field_cache):
+    ds = fake_random_ds(16, nprocs=4)
+    fields = [("gas", "density"), ("gas", "velocity_magnitude")]
+    ref = {f: ds.sphere("c", 0.3)[f] for f in fields}
+    assert field_cache._hits == 0
+
+    sp = ds.sphere("c", 0.3)
+    for f in fields:
+        assert_equal(sp[f], ref[f])
+        assert sp[f].units == ref[f].units
+    assert field_cache._hits == len(fields)
+
+    # A different selector does not hit the cached entries
+    hits = field_cache._hits
+    ds.sphere("c", 0.2)["gas", "density"]
+    assert field_cache._hits == hits
+
+
+def test_field_cache_eviction(field_cache):
+    ds = fake_random_ds(16)
+    ds.all_data()["gas", "density"]
+    field_cache.max_bytes = 0
+    field_cache.evict()
+    field_cache.max_bytes = ytcfg["yt", "field_cache_max_bytes"]
+    hits = field_cache._hits
+    ds.all_data()["gas", "density"]
+    assert field_cache._hits == hits
+
+
+def test_field_cache_store_walks_once(field_cache, monkeypatch):
+    walks = []
+    evict = field_cache.evict
+
+    def counting_evict():
+        walks.append(None)
+        evict()
+
+    monkeypatch.setattr(field_cache, "evict", counting_evict)
+    field_cache._total_bytes = None
+    for i in range(10):
+        field_cache.store(f"{i:032x}", np.arange(10.0))
+    # The cache is only walked to initialize its size, below its budget
+    assert len(walks) == 1
+    assert field_cache._total_bytes > 0
+
+    field_cache.max_bytes = field_cache._total_bytes
+    field_cache.store(f"{10:032x}", np.arange(10.0))
+    assert len(walks) == 2
+    assert field_cache._total_bytes <= field_cache.max_bytes
+    field_cache.max_bytes = ytcfg["yt", "field_cache_max_bytes"]
+
+
+def test_field_cache_closures(field_cache):
+    ds = fake_random_ds(16)
+
+    def make_field(factor):
+        def _scaled_density(field, data):
+            return factor * data["gas", "density"]
+
+        return _scaled_density
+
+    density = ds.all_data()["gas", "density"]
+    # Redefining the field from the same factory does not serve the values
+    # cached for the previous definition
+    for factor in (2.0, 3.0, 2.0):
+        ds.add_field(
+            ("gas", "scaled_density"),
+            make_field(factor),
+            sampling_type="cell",
+            units="g/cm**3",
+            force_override=True,
+        )
+        assert_equal(ds.all_data()["gas", "scaled_density"], factor * density)
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_equal
+
+from yt.config import ytcfg
+from yt.loaders import load
+from yt.testing import fake_random_ds, requires_module_pytest as requires_module
+from yt.utilities.grid_data_format.writer import write_to_gdf
+from yt.utilities.io_handler import mmap_hdf5_dataset
+from yt.utilities.on_demand_imports import _h5py as h5py
+
+
+@pytest.fixture
+def mmap_hdf5():
+    old = ytcfg["yt", "mmap_hdf5"]
+    ytcfg["yt", "mmap_hdf5"] = True
+    yield
+    ytcfg["yt", "mmap_hdf5"] = old
+
+
+@requires_module("h5py")
+def test_mmap_hdf5_dataset(tmp_path):
+    fn = str(tmp_path / "test.h5")
+    arr = np.random.random((4, 5, 6))
+    with h5py.File(fn, mode="w") as f:
+        f.create_dataset("contiguous", data=arr)
+        f.create_dataset("big_endian", data=arr.astype(">f4"))
+        f.create_dataset("chunked", data=arr, chunks=(2, 5, 6))
+        f.create_dataset("compressed", data=arr, compression="gzip")
+        f.create_dataset("integer", data=np.arange(10))
+        f.create_dataset("empty", shape=(10,), dtype="f8")
+
+    with h5py.File(fn, mode="r") as f:
+        mapped = mmap_hdf5_dataset(f["contiguous"])
+        assert_equal(mapped, arr)
+        assert not mapped.flags.writeable
+        assert_equal(mmap_hdf5_dataset(f["big_endian"].id), arr.astype(">f4"))
+        for name in ("chunked", "compressed", "integer", "empty"):
+            assert mmap_hdf5_dataset(f[name]) is None
+
+
+@requires_module("h5py")
+def test_mmap_hdf5_gdf(tmp_path, mmap_hdf5):
+    fn = str(tmp_path / "test_gdf.h5")
+    write_to_gdf(fake_random_ds(32, nprocs=8), fn)
+    ds = load(fn)
+    ad = ds.all_data()
+    sp = ds.sphere("c", 0.3)
+    mapped = [ad["gdf", "density"], sp["gdf", "density"]]
+    grid = ds.index.grids[0]
+    mapped_grid = grid["gdf", "density"]
+
+    ytcfg["yt", "mmap_hdf5"] = False
+    ds = load(fn)
+    assert_equal(mapped[0], ds.all_data()["gdf", "density"])
+    assert_equal(mapped[1], ds.sphere("c", 0.3)["gdf", "density"])
+    assert_equal(mapped_grid, ds.index.grids[0]["gdf", "density"])
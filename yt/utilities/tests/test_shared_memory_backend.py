@@ -0,0 +1,89 @@
+import os
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_equal
+
+from yt.data_objects.profiles import create_profile
+from yt.testing import fake_random_ds
+from yt.utilities.parallel_tools import shared_memory_backend
+from yt.utilities.parallel_tools.parallel_analysis_interface import (
+    communication_system,
+    parallel_objects,
+)
+
+
+@pytest.fixture
+def multiprocessing_backend():
+    if not hasattr(os, "fork"):
+        pytest.skip("fork is not available on this platform")
+    old_value = shared_memory_backend.num_procs
+    shared_memory_backend.enable(3)
+    yield
+    shared_memory_backend.num_procs = old_value
+
+
+@pytest.mark.parametrize("dynamic", [False, True])
+def test_parallel_objects_storage(multiprocessing_backend, dynamic):
+    storage = {}
+    objs = list(range(10))
+    for sto, obj in parallel_objects(objs, storage=storage, dynamic=dynamic):
+        rank = communication_system.communicators[-2].rank
+        # The last entry is large enough to go through shared memory.
+        sto.result = (obj, rank, np.full(100000, obj, dtype="float64"))
+    assert sorted(storage) == objs
+    for i, (obj, rank, arr) in storage.items():
+        assert obj == i
+        assert_equal(arr, np.full(100000, i, dtype="float64"))
+        if not dynamic:
+            # Objects are dealt out round-robin
+            assert rank == i % 3
+
+
+def test_parallel_objects_reductions(multiprocessing_backend):
+    # The communicator of all of the processes can be reached from the body
+    # of the loop, while that of the job only holds the process itself.
+    ncomms = len(communication_system.communicators)
+    storage = {}
+    for sto, obj in parallel_objects(range(6), storage=storage):
+        assert communication_system.communicators[-1].size == 1
+        comm = communication_system.communicators[-2]
+        total = comm.mpi_allreduce(np.array([obj]), op="sum")
+        objs = comm.par_combine_object([obj], op="cat", datatype="list")
+        sto.result = (int(total[0]), objs, comm.mpi_bcast(obj, root=1))
+    assert storage[0] == storage[1] == storage[2] == (3, [0, 1, 2], 1)
+    assert storage[3] == storage[4] == storage[5] == (12, [3, 4, 5], 4)
+    assert len(communication_system.communicators) == ncomms
+
+
+def test_parallel_objects_without_storage(multiprocessing_backend):
+    # Without storage, results can only be kept by running in this process
+    pids = set()
+    seen = []
+    for obj in parallel_objects(range(10)):
+        pids.add(os.getpid())
+        seen.append(obj)
+    assert pids == {os.getpid()}
+    assert seen == list(range(10))
+
+
+def test_profile(multiprocessing_backend):
+    ds = fake_random_ds(32, nprocs=8)
+    ad = ds.all_data()
+    fields = [("gas", "density"), ("gas", "velocity_x")]
+    kwargs = {"n_bins": 16, "weight_field": None}
+    prof = create_profile(ad, ("gas", "density"), fields, **kwargs)
+    # Every chunk has been binned, not only those of one worker
+    assert_allclose(prof["gas", "density"].sum(), ad["gas", "density"].sum())
+    shared_memory_backend.num_procs = 0
+    ref = create_profile(ad, ("gas", "density"), fields, **kwargs)
+    for field in fields:
+        assert_equal(prof[field], ref[field])
+
+
+def test_communicator_reductions():
+    comm = shared_memory_backend.SharedMemoryCommunicator(0, 1, [])
+    data = np.arange(5)
+    assert_equal(comm.mpi_allreduce(data, op="max"), data)
+    assert comm.par_combine_object({1: 2}, op="join") == {1: 2}
+    assert comm.par_combine_object([1, 2], op="cat") == [1, 2]
@@ -4,12 +4,14 @@ from functools import partial
 from typing import TYPE_CHECKING
 
 import numpy as np
+from unyt.exceptions import UnitConversionError
 
 from yt._maintenance.deprecation import issue_deprecation_warning
 from yt._typing import FieldKey, MaskT
 from yt.data_objects.image_array import ImageArray
 from yt.frontends.ytdata.utilities import save_as_dataset
 from yt.funcs import get_output_filename, iter_fields, mylog
+from yt.geometry.api import Geometry
 from yt.loaders import load_uniform_grid
 from yt.utilities.lib.api import (  # type: ignore
     CICDeposit_2,
@@ -170,24 +172,60 @@ class FixedResolutionBuffer:
             self.buff_size[0],
             self.buff_size[1],
         )
+        buff, mask = self._pixelize(item, self._code_bounds(), self.buff_size)
+        self._set_image_and_mask(item, buff, mask)
+
+    def _render_fields(self, items):
+        # Pixelizes the fields of items that are not pixelized yet together,
+        # in a single pass over the data source where the coordinate handler
+        # supports it.
+        items = list(dict.fromkeys(items))
+        items = [item for item in items if not (item in self.data and self._data_valid)]
+        if (
+            len(items) < 2
+            or type(self)._generate_image_and_mask
+            is not FixedResolutionBuffer._generate_image_and_mask
+        ):
+            for item in items:
+                self.render(item)
+            return
+        mylog.info(
+            "Making a fixed resolution buffer of (%s) %d by %d",
+            ", ".join(str(item) for item in items),
+            self.buff_size[0],
+            self.buff_size[1],
+        )
+        images = self.ds.coordinates.pixelize_multi(
+            self.data_source.axis,
+            self.data_source,
+            items,
+            self._code_bounds(),
+            self.buff_size,
+            int(self.antialias),
+        )
+        for item, (buff, mask) in zip(items, images, strict=True):
+            self._set_image_and_mask(item, buff, mask)
+
+    def _code_bounds(self):
         bounds = []
         for b in self.bounds:
             if hasattr(b, "in_units"):
                 b = float(b.in_units("code_length"))
             bounds.append(b)
+        return bounds
 
-        buff, mask = self.ds.coordinates.pixelize(
+    def _pixelize(self, item, bounds, size):
+        return self.ds.coordinates.pixelize(
             self.data_source.axis,
             self.data_source,
             item,
             bounds,
-            self.buff_size,
+            size,
             int(self.antialias),
             return_mask=True,
         )
 
-        buff = self._apply_filters(buff)
-
+    def _get_units(self, item):
         # FIXME FIXME FIXME we shouldn't need to do this for projections
         # but that will require fixing data object access for particle
         # projections
@@ -196,14 +234,86 @@ class FixedResolutionBuffer:
                 it = item.name
             else:
                 it = item
-            units = self.data_source._projected_units[it]
+            return self.data_source._projected_units[it]
         except (KeyError, AttributeError):
-            units = self.data_source[item].units
+            return self.data_source[item].units
 
+    def _set_image_and_mask(self, item, buff, mask):
+        buff = self._apply_filters(buff)
+        units = self._get_units(item)
+        buff = buff.astype(self.ds.field_dtype, copy=False)
         self.data[item] = ImageArray(buff, units=units, info=self._get_info(item))
         self.mask[item] = mask
         self._data_valid = True
 
+    def _reuse_images(self, other):
+        """
+        Fills the images of this buffer from those of other, a buffer of the
+        same data source and pixel size, shifted from this one by a nonzero
+        whole number of pixels.  Only the strips of pixels other does not cover are
+        pixelized.  Returns the fields that were filled.
+        """
+        if not (
+            type(self) is type(other) is FixedResolutionBuffer
+            and other.data_source is self.data_source
+            and other.buff_size == self.buff_size
+            and bool(other.antialias) == bool(self.antialias)
+            and not self._filters
+            and not other._filters
+            and self.data_source.axis in (0, 1, 2)
+            and self.ds.geometry is Geometry.CARTESIAN
+        ):
+            return []
+        nx, ny = self.buff_size
+        x0, x1, y0, y1 = self._code_bounds()
+        ox0, ox1, oy0, oy1 = other._code_bounds()
+        dx = (x1 - x0) / nx
+        dy = (y1 - y0) / ny
+        # Pixels are only reused when both grids of pixels line up
+        sx = (x0 - ox0) / dx
+        sy = (y0 - oy0) / dy
+        ix = int(round(sx))
+        iy = int(round(sy))
+        if (
+            not np.isclose((ox1 - ox0) / nx, dx, rtol=1e-10, atol=0)
+            or not np.isclose((oy1 - oy0) / ny, dy, rtol=1e-10, atol=0)
+            or abs(sx - ix) > 1e-6
+            or abs(sy - iy) > 1e-6
+            or abs(ix) >= nx
+            or abs(iy) >= ny
+            or (ix, iy) == (0, 0)
+        ):
+            return []
+
+        # The rows and columns of this buffer covered by other
+        c0, c1 = max(0, -ix), min(nx, nx - ix)
+        r0, r1 = max(0, -iy), min(ny, ny - iy)
+        # The strips of rows, spanning the whole width, and of columns,
+        # spanning the covered rows, left to pixelize
+        strips = [(0, nx, 0, r0), (0, nx, r1, ny), (0, c0, r0, r1), (c1, nx, r0, r1)]
+        strips = [(i0, i1, j0, j1) for i0, i1, j0, j1 in strips if i1 > i0 and j1 > j0]
+
+        reused = []
+        for item, image in other.data.items():
+            if item not in other.mask:
+                continue
+            try:
+                old = image.to_value(self._get_units(item))
+            except UnitConversionError:
+                continue
+            buff = np.empty((ny, nx), dtype="float64")
+            mask = np.empty((ny, nx), dtype=other.mask[item].dtype)
+            buff[r0:r1, c0:c1] = old[r0 + iy : r1 + iy, c0 + ix : c1 + ix]
+            mask[r0:r1, c0:c1] = other.mask[item][r0 + iy : r1 + iy, c0 + ix : c1 + ix]
+            for i0, i1, j0, j1 in strips:
+                bounds = (x0 + i0 * dx, x0 + i1 * dx, y0 + j0 * dy, y0 + j1 * dy)
+                sbuff, smask = self._pixelize(item, bounds, (i1 - i0, j1 - j0))
+                buff[j0:j1, i0:i1] = sbuff
+                mask[j0:j1, i0:i1] = smask
+            self._set_image_and_mask(item, buff, mask)
+            reused.append(item)
+        return reused
+
     def __getitem__(self, item):
         # backward compatibility
         return self.get_image(item)
@@ -239,9 +349,11 @@ class FixedResolutionBuffer:
         exclude = self.data_source._key_fields + list(self._exclude_fields)
         fields = getattr(self.data_source, "fields", [])
         fields += getattr(self.data_source, "field_data", {}).keys()
-        for f in fields:
-            if f not in exclude and f[0] not in self.data_source.ds.particle_types:
-                self.render(f)
+        self._render_fields(
+            f
+            for f in fields
+            if f not in exclude and f[0] not in self.data_source.ds.particle_types
+        )
 
     def _get_info(self, item):
         info = {}
@@ -383,6 +495,7 @@ class FixedResolutionBuffer:
         """
         if fields is None:
             fields = list(self.data.keys())
+        self._render_fields(fields)
         output = h5py.File(filename, mode="a")
         for field in fields:
             output.create_dataset("_".join(field), data=self[field])
@@ -423,6 +536,7 @@ class FixedResolutionBuffer:
                 "object."
             )
 
+        self._render_fields(fields)
         fid = FITSImageData(self, fields=fields, length_unit=length_unit)
         if other_keys is not None:
             for k, v in other_keys.items():
@@ -1,4 +1,10 @@
+import hashlib
 import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 
 import bottle
@@ -28,10 +34,116 @@ def exc_writeout(f):
     return func
 
 
+class TileCache:
+    """
+    A least recently used store of rendered tiles, kept as PNG files in a
+    directory.  Tiles left in the directory by an earlier session are reused.
+
+    Parameters
+    ----------
+    path : str
+        The directory tiles are stored in.
+    max_tiles : int
+        The number of tiles beyond which the least recently used ones are
+        removed.
+    """
+
+    def __init__(self, path, max_tiles):
+        self.path = path
+        self.max_tiles = max_tiles
+        self._lock = threading.Lock()
+        os.makedirs(path, exist_ok=True)
+        tiles = sorted(
+            (os.path.getmtime(os.path.join(path, fn)), fn[:-4])
+            for fn in os.listdir(path)
+            if fn.endswith(".png")
+        )
+        self._tiles = OrderedDict((key, None) for _, key in tiles)
+        self._evict()
+
+    def _filename(self, key):
+        return os.path.join(self.path, f"{key}.png")
+
+    def _evict(self):
+        while len(self._tiles) > self.max_tiles:
+            key, _ = self._tiles.popitem(last=False)
+            try:
+                os.remove(self._filename(key))
+            except OSError:
+                pass
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._tiles:
+                return None
+            self._tiles.move_to_end(key)
+        try:
+            with open(self._filename(key), "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def put(self, key, png):
+        fn = self._filename(key)
+        # Tiles are written under a temporary name first, so that a tile being
+        # read is never a partially written one.
+        tmp = f"{fn}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(png)
+        os.replace(tmp, fn)
+        with self._lock:
+            self._tiles[key] = None
+            self._tiles.move_to_end(key)
+            self._evict()
+
+
 class PannableMapServer:
+    """
+    Serves the tiles of a pannable, zoomable map of a slice or projection.
+
+    Tiles form a pyramid, where level L covers the domain with 2**L by 2**L
+    tiles of 256 by 256 pixels.  It is filled lazily, as tiles are requested:
+    tiles are rendered by a pool of threads, alongside the tiles surrounding
+    them, and stored in a :class:`TileCache`.  Color bounds are computed once
+    per field and level.
+
+    Parameters
+    ----------
+    data : YTSelectionContainer2D
+        The slice or projection to serve.
+    field : str or tuple of str
+        The field initially displayed.
+    takelog : bool
+        Whether the field is displayed in log scale.
+    cmap : str
+        The colormap the field is displayed with.
+    route_prefix : str, optional
+        The prefix of the routes the map is served from.
+    cache_dir : str, optional
+        The directory rendered tiles are stored in, and reused from by later
+        sessions.  Defaults to a new temporary directory, which is removed
+        when the server is closed.
+    max_tiles : int, optional
+        The number of tiles kept in the cache.  Default: 4096.
+    max_workers : int, optional
+        The number of threads tiles are rendered by.  Defaults to the number
+        of CPUs.
+    """
+
     _widget_name = "pannable_map"
+    _tile_size = 256
 
-    def __init__(self, data, field, takelog, cmap, route_prefix=""):
+    def __init__(
+        self,
+        data,
+        field,
+        takelog,
+        cmap,
+        route_prefix="",
+        cache_dir=None,
+        max_tiles=4096,
+        max_workers=None,
+    ):
         self.data = data
         self.ds = data.ds
         self.field = field
@@ -49,7 +161,18 @@ class PannableMapServer:
         bottle.route(f"{route_prefix}/static/:path", "GET")(self.static)
 
         self.takelog = takelog
-        self._lock = False
+        # Guards reading fields into the data object and the color bounds
+        self._lock = threading.Lock()
+        self._color_bounds = {}
+        # Guards the tiles being rendered
+        self._pending_lock = threading.Lock()
+        self._pending = {}
+        self._executor = ThreadPoolExecutor(max_workers)
+        self._tmpdir = None
+        if cache_dir is None:
+            cache_dir = self._tmpdir = tempfile.mkdtemp(prefix="yt_mapserver_")
+        self.tiles = TileCache(cache_dir, max_tiles)
+        self._tile_prefix = f"{self.ds._hash()}:{self.data._hash}:{takelog}:{cmap}"
 
         for unit in ["Gpc", "Mpc", "kpc", "pc"]:
             v = self.ds.domain_width[0].in_units(unit).value
@@ -58,62 +181,140 @@ class PannableMapServer:
         self.unit = unit
         self.px2unit = self.ds.domain_width[0].in_units(unit).value / 256
 
-    def lock(self):
-        import time
+    def close(self):
+        """
+        Stops the threads rendering tiles, and removes the tile cache if it
+        is a temporary one.
+        """
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        if self._tmpdir is not None:
+            shutil.rmtree(self._tmpdir, ignore_errors=True)
+            self._tmpdir = None
 
-        while self._lock:
-            time.sleep(0.01)
-        self._lock = True
+    def __enter__(self):
+        return self
 
-    def unlock(self):
-        self._lock = False
+    def __exit__(self, *args):
+        self.close()
 
-    def map(self, field, L, x, y):
-        if "," in field:
-            field = tuple(field.split(","))
-        cmap = self.cmap
-        dd = 1.0 / (2.0 ** (int(L)))
-        relx = int(x) * dd
-        rely = int(y) * dd
+    def _read_field(self, field):
+        # Fields are read from disk once, before tiles are rendered from them
+        # concurrently.
+        with self._lock:
+            self.data[field]
+
+    def _get_color_bounds(self, field, L):
+        # The bounds only depend on the level, through the smallest cells
+        # taken into account.
+        with self._lock:
+            if (field, L) not in self._color_bounds:
+                dd = 1.0 / (2.0**L)
+                DW = self.ds.domain_right_edge - self.ds.domain_left_edge
+                self._color_bounds[field, L] = get_color_bounds(
+                    self.data["px"],
+                    self.data["py"],
+                    self.data["pdx"],
+                    self.data["pdy"],
+                    self.data[field],
+                    self.ds.domain_left_edge[0],
+                    self.ds.domain_right_edge[0],
+                    self.ds.domain_left_edge[1],
+                    self.ds.domain_right_edge[1],
+                    dd * DW[0] / (64 * 256),
+                    dd * DW[0],
+                )
+            return self._color_bounds[field, L]
+
+    def _render_tile(self, field, L, x, y):
+        dd = 1.0 / (2.0**L)
+        relx = x * dd
+        rely = y * dd
         DW = self.ds.domain_right_edge - self.ds.domain_left_edge
         xl = self.ds.domain_left_edge[0] + relx * DW[0]
         yl = self.ds.domain_left_edge[1] + rely * DW[1]
         xr = xl + dd * DW[0]
         yr = yl + dd * DW[1]
-        try:
-            self.lock()
-            w = 256  # pixels
-            data = self.data[field]
-            frb = FixedResolutionBuffer(self.data, (xl, xr, yl, yr), (w, w))
-            cmi, cma = get_color_bounds(
-                self.data["px"],
-                self.data["py"],
-                self.data["pdx"],
-                self.data["pdy"],
-                data,
-                self.ds.domain_left_edge[0],
-                self.ds.domain_right_edge[0],
-                self.ds.domain_left_edge[1],
-                self.ds.domain_right_edge[1],
-                dd * DW[0] / (64 * 256),
-                dd * DW[0],
-            )
-        finally:
-            self.unlock()
+        cmi, cma = self._get_color_bounds(field, L)
+        # Once the fields are read, pixelizing only reads from them, so
+        # tiles can be rendered concurrently.
+        w = self._tile_size  # pixels
+        frb = FixedResolutionBuffer(self.data, (xl, xr, yl, yr), (w, w))
 
         if self.takelog:
             cmi = np.log10(cmi)
             cma = np.log10(cma)
             to_plot = apply_colormap(
-                np.log10(frb[field]), color_bounds=(cmi, cma), cmap_name=cmap
+                np.log10(frb[field]), color_bounds=(cmi, cma), cmap_name=self.cmap
             )
         else:
             to_plot = apply_colormap(
-                frb[field], color_bounds=(cmi, cma), cmap_name=cmap
+                frb[field], color_bounds=(cmi, cma), cmap_name=self.cmap
             )
 
-        rv = write_png_to_string(to_plot)
-        return rv
+        return write_png_to_string(to_plot)
+
+    def _get_tile(self, key, field, L, x, y):
+        png = self.tiles.get(key)
+        if png is None:
+            png = self._render_tile(field, L, x, y)
+            self.tiles.put(key, png)
+        return png
+
+    def _pop_pending(self, key):
+        with self._pending_lock:
+            self._pending.pop(key, None)
+
+    def _submit(self, field, L, x, y):
+        # Returns the future of a tile, shared by all of the requests for it
+        # while it is being rendered.
+        key = f"{self._tile_prefix}:{field}:{L}:{x}:{y}"
+        key = hashlib.md5(key.encode("utf-8")).hexdigest()
+        with self._pending_lock:
+            future = self._pending.get(key)
+            if future is not None:
+                return future
+            future = self._executor.submit(self._get_tile, key, field, L, x, y)
+            self._pending[key] = future
+        future.add_done_callback(lambda f: self._pop_pending(key))
+        return future
+
+    def prerender(self, max_level, field=None):
+        """
+        Renders all of the tiles of the levels up to max_level ahead of time.
+
+        Parameters
+        ----------
+        max_level : int
+            The deepest level rendered.
+        field : str or tuple of str, optional
+            The field rendered.  Defaults to the field initially displayed.
+        """
+        if field is None:
+            field = self.field
+        self._read_field(field)
+        futures = [
+            self._submit(field, L, x, y)
+            for L in range(max_level + 1)
+            for x in range(2**L)
+            for y in range(2**L)
+        ]
+        for future in futures:
+            future.result()
+
+    def map(self, field, L, x, y):
+        if "," in field:
+            field = tuple(field.split(","))
+        self._read_field(field)
+        L, x, y = int(L), int(x), int(y)
+        future = self._submit(field, L, x, y)
+        # The tiles around the requested one are likely to be requested next,
+        # as the map is panned.
+        ntiles = 2**L
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                if (dx, dy) != (0, 0) and 0 <= x + dx < ntiles and 0 <= y + dy < ntiles:
+                    self._submit(field, L, x + dx, y + dy)
+        return future.result()
 
     def index(self, field=None):
         if field is not None:
@@ -224,6 +224,7 @@ class PlotWindow(ImagePlotContainer, abc.ABC):
         self.override_fields = list(set(fields).intersection(set(skip)))
         self.fields = [f for f in fields if f not in skip]
         self._frb: FixedResolutionBuffer | None = None
+        self._reuse_pixels = False
         super().__init__(data_source, window_size, fontsize)
 
         self._set_window(bounds)  # this automatically updates the data and plot
@@ -316,6 +317,7 @@ class PlotWindow(ImagePlotContainer, abc.ABC):
     def _recreate_frb(self):
         old_fields = None
         old_filters = []
+        old_frb = self._frb
         # If we are regenerating an frb, we want to know what fields we had before
         if self._frb is not None:
             old_fields = list(self._frb.data.keys())
@@ -337,8 +339,13 @@ class PlotWindow(ImagePlotContainer, abc.ABC):
             periodic=self._periodic,
             filters=old_filters,
         )
+        if old_frb is not None and self._reuse_pixels:
+            # The pixels the new frb shares with the old one, after a pan,
+            # are copied over rather than pixelized again.
+            self._frb._reuse_images(old_frb)
 
         # At this point the frb has the valid bounds, size, aliasing, etc.
+        self._frb._render_fields((old_fields or []) + list(self.override_fields))
         if old_fields is not None:
             # Restore the old fields
             for key, units in zip(old_fields, old_units, strict=False):
@@ -764,6 +771,22 @@ class PlotWindow(ImagePlotContainer, abc.ABC):
         """
         self.antialias = aa
 
+    def set_pixel_reuse(self, reuse=True):
+        """Turn the reuse of pixels between successive views on or off.
+
+        When on, panning the plot by a whole number of pixels, with
+        :meth:`pan`, :meth:`pan_rel` or :meth:`set_center`, shifts the pixels
+        of the current fixed resolution buffer, and only pixelizes the strips
+        of pixels uncovered, rather than the whole view.  This only applies
+        to on-axis plots of cartesian datasets, without filters.
+
+        parameters
+        ----------
+        reuse : boolean
+        """
+        self._reuse_pixels = reuse
+        return self
+
     @invalidate_data
     def set_buff_size(self, size):
         """Sets a new buffer size for the fixed resolution buffer
@@ -1018,6 +1041,7 @@ class PWViewerMPL(PlotWindow):
             self._recreate_frb()
         self._colorbar_valid = True
         field_list = list(set(self.data_source._determine_fields(self.fields)))
+        self.frb._render_fields(field_list)
         for f in field_list:
             axis_index = self.data_source.axis
 
@@ -0,0 +1,20 @@
+import os
+
+from yt.testing import fake_random_ds, requires_module
+
+
+@requires_module("bottle")
+def test_pannable_map_server():
+    from yt.visualization.mapserver.pannable_map import PannableMapServer
+
+    ds = fake_random_ds(16)
+    slc = ds.slice(2, 0.5)
+    with PannableMapServer(slc, ("gas", "density"), True, "viridis") as server:
+        cache_dir = server.tiles.path
+        png = server.map("gas,density", "1", "0", "1")
+        assert png.startswith(b"\x89PNG")
+        # The tile is now served from the cache
+        assert server.map("gas,density", "1", "0", "1") == png
+        assert len(os.listdir(cache_dir)) > 0
+    # The temporary cache is removed along with the server
+    assert not os.path.exists(cache_dir)
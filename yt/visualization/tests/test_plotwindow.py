@@ -32,6 +32,7 @@ from yt.utilities.answer_testing.framework import (
     requires_ds,
 )
 from yt.utilities.exceptions import YTInvalidFieldType
+from yt.visualization.fixed_resolution import FixedResolutionBuffer
 from yt.visualization.plot_window import (
     AxisAlignedProjectionPlot,
     AxisAlignedSlicePlot,
@@ -927,3 +928,37 @@ def test_set_font():
             "color": "blue",
         }
     )
+
+
+def test_pixel_reuse():
+    # Panning by whole pixels shifts the pixels of the previous view, which
+    # gives the same image as pixelizing the new view from scratch.
+    ds = fake_random_ds(64)
+    field = ("gas", "density")
+    kwargs = {"width": (0.5, "unitary"), "buff_size": (128, 96)}
+    slc = SlicePlot(ds, "z", field, **kwargs)
+    slc.set_pixel_reuse()
+    slc.set_unit(field, "kg/m**3")
+    slc.frb[field]
+    old_frb = slc.frb
+    dx = 0.5 / 128
+    dy = 0.5 / 96
+    for deltas in [(10 * dx, -7 * dy), (-3 * dx, 0.0), (0.0, 40 * dy)]:
+        slc.pan(deltas)
+        (x0, x1), (y0, y1) = slc.xlim, slc.ylim
+        center = ((x0 + x1).d / 2, (y0 + y1).d / 2, 0.5)
+        ref = SlicePlot(ds, "z", field, center=center, **kwargs)
+        ref.set_unit(field, "kg/m**3")
+        assert slc.frb is not old_frb
+        assert_array_almost_equal(slc.frb[field].d / ref.frb[field].d, 1.0, 10)
+        assert_array_equal(slc.frb.get_mask(field), ref.frb.get_mask(field))
+        old_frb = slc.frb
+
+    x0, x1, y0, y1 = old_frb._code_bounds()
+    bounds = (x0 + 5 * dx, x1 + 5 * dx, y0, y1)
+    frb = FixedResolutionBuffer(old_frb.data_source, bounds, old_frb.buff_size)
+    assert frb._reuse_images(old_frb) == [field]
+    # Views that are not shifted by whole pixels are pixelized from scratch
+    bounds = (x0 + 0.5 * dx, x1 + 0.5 * dx, y0, y1)
+    frb = FixedResolutionBuffer(old_frb.data_source, bounds, old_frb.buff_size)
+    assert frb._reuse_images(old_frb) == []
@@ -545,6 +545,58 @@ class VolumeSource(RenderSource, abc.ABC):
 class KDTreeVolumeSource(VolumeSource):
     volume_method = "KDTree"
 
+    # Rays are walked front to back, and no longer sampled once their opacity
+    # reaches this value.  This requires a transfer function with grey opacity.
+    opacity_threshold = None
+    _max_level = None
+
+    @property
+    def max_level(self):
+        """The finest level of the AMR hierarchy that is rendered
+
+        If None, the finest level of the dataset is used.
+        """
+        return self._max_level
+
+    @max_level.setter
+    @invalidate_volume
+    def max_level(self, value):
+        self._max_level = value
+
+    def set_max_level(self, max_level):
+        """Set the finest level of the AMR hierarchy to render
+
+        Regions refined beyond this level are rendered from the data of their
+        coarser grids, which makes for quick previews of deep hierarchies.
+
+        Parameters
+        ----------
+
+        max_level: int or None
+            The finest level to render. If None, all levels are rendered.
+        """
+        self.max_level = max_level
+        return self
+
+    def set_opacity_threshold(self, opacity_threshold):
+        """Set the opacity at which rays are no longer sampled
+
+        When set, rays are walked through the volume from the front to the
+        back, and are not sampled any further once their accumulated opacity
+        reaches ``opacity_threshold``. This requires a transfer function with
+        ``grey_opacity=True``, and is ignored for other transfer functions.
+
+        Parameters
+        ----------
+
+        opacity_threshold: float or None
+            The opacity, between 0 and 1, past which rays are terminated. A
+            value close to 1, such as 0.99, leaves the image visually
+            unchanged. If None, rays are sampled through the whole volume.
+        """
+        self.opacity_threshold = opacity_threshold
+        return self
+
     def _get_volume(self):
         """The abstract volume associated with this VolumeSource
 
@@ -554,7 +606,11 @@ class KDTreeVolumeSource(VolumeSource):
 
         if self._volume is None:
             mylog.info("Creating volume")
-            volume = AMRKDTree(self.data_source.ds, data_source=self.data_source)
+            volume = AMRKDTree(
+                self.data_source.ds,
+                max_level=self._max_level,
+                data_source=self.data_source,
+            )
             self._volume = volume
 
         return self._volume
@@ -591,11 +647,23 @@ class KDTreeVolumeSource(VolumeSource):
                     if np.any(np.isnan(data)):
                         raise RuntimeError
 
-        for brick in self.volume.traverse(camera.lens.viewpoint):
+        front_to_back = bool(getattr(self.sampler, "front_to_back", 0))
+        if front_to_back:
+            # Rays accumulate from the front, so whatever is already in the
+            # image is composited behind the volume once it is rendered.
+            background = self.sampler.aimage.copy()
+            self.sampler.aimage[:] = 0.0
+
+        for brick in self.volume.traverse(
+            camera.lens.viewpoint, front_to_back=front_to_back
+        ):
             mylog.debug("Using sampler %s", self.sampler)
             self.sampler(brick, num_threads=self.num_threads)
             total_cells += np.prod(brick.my_data[0].shape)
         mylog.debug("Done casting rays")
+        if front_to_back:
+            image = self.sampler.aimage
+            image += (1.0 - image[..., 3:]) * background
         self.current_image = self.finalize_image(camera, self.sampler.aimage)
 
         if zbuffer is None:
@@ -605,6 +673,45 @@ class KDTreeVolumeSource(VolumeSource):
 
         return self.current_image
 
+    def render_progressive(self, camera, levels=None):
+        """Renders a sequence of images, refining the AMR hierarchy each time
+
+        The first image is rendered from the coarsest levels only, which is
+        quick even for deep hierarchies, and every following image adds
+        finer levels. Since this is a generator, the finer levels are only
+        read and rendered when the next image is requested.
+
+        Parameters
+        ----------
+        camera: :class:`yt.visualization.volume_rendering.camera.Camera`
+            A volume rendering camera. Can be any type of camera.
+        levels: iterable of int, optional
+            The finest level rendered in each successive image. Defaults to
+            every level from 0 to the finest level of the dataset.
+
+        Yields
+        ------
+        The finest level rendered and a
+        :class:`yt.data_objects.image_array.ImageArray` containing the image.
+        The source is left set to render the last level that was requested.
+
+        Examples
+        --------
+
+        >>> import yt
+        >>> ds = yt.load("IsolatedGalaxy/galaxy0030/galaxy0030")
+        >>> sc = yt.create_scene(ds)
+        >>> source = sc[0]
+        >>> for level, im in source.render_progressive(sc.camera):
+        ...     im.write_png(f"preview_{level}.png")
+
+        """
+        if levels is None:
+            levels = range(self.data_source.ds.index.max_level + 1)
+        for level in levels:
+            self.max_level = level
+            yield level, self.render(camera)
+
     def finalize_image(self, camera, image):
         if self._volume is not None:
             image = self.volume.reduce_tree_images(
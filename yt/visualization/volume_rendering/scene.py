@@ -1,5 +1,8 @@
+import copy
 import functools
-from collections import OrderedDict
+import os
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
@@ -10,6 +13,9 @@ from yt.units.dimensions import length  # type: ignore
 from yt.units.unit_registry import UnitRegistry  # type: ignore
 from yt.units.yt_array import YTArray, YTQuantity
 from yt.utilities.exceptions import YTNotInsideNotebook
+from yt.utilities.parallel_tools.parallel_analysis_interface import (
+    communication_system,
+)
 from yt.visualization._commons import get_canvas, validate_image_name
 
 from .camera import Camera
@@ -224,6 +230,116 @@ class Scene:
         self._last_render = bmp
         return bmp
 
+    def render_path(
+        self,
+        cameras,
+        fname: str = "frame_%04i.png",
+        sigma_clip: float | None = None,
+        max_workers: int | None = None,
+    ) -> list[str]:
+        r"""Render a sequence of frames, one for each camera, and save them.
+
+        The sources of the scene are set up once, when the first frame is
+        rendered, and their bricks are shared by all of the frames that follow,
+        which are rendered concurrently by a pool of threads.  Finished frames
+        are written to disk in order as soon as they are available, so that
+        only a few of them are held in memory at any time.
+
+        Parameters
+        ----------
+        cameras: iterable of :class:`Camera`
+            The cameras to render each frame with.  These may also be the same
+            camera yielded repeatedly, modified between frames, as is done by
+            :meth:`Camera.iter_move` for instance.
+        fname: string, optional
+            The filename pattern of the frames, which is formatted with the
+            index of each frame.  The file format is inferred from its suffix.
+            Default: "frame_%04i.png"
+        sigma_clip: float, optional
+            Image values greater than this number times the standard deviation
+            plus the mean of the image will be clipped before saving.
+            Default: None
+        max_workers: int, optional
+            The number of frames rendered concurrently.  Each of them is then
+            rendered with a single OpenMP thread, unless the ``num_threads``
+            of the source has been set.  Frames are rendered one at a time
+            when running in parallel with MPI.  Defaults to the number of
+            cores.
+
+        Returns
+        -------
+        The list of the filenames of the frames.
+
+        Examples
+        --------
+
+        >>> import yt
+        >>> ds = yt.load("IsolatedGalaxy/galaxy0030/galaxy0030")
+        >>> sc = yt.create_scene(ds)
+        >>> cam = sc.camera
+
+        >>> def cameras():
+        ...     for _ in cam.iter_rotate(np.pi, 90):
+        ...         yield cam
+
+        >>> sc.render_path(cameras(), "rotation_%04i.png", sigma_clip=4.0)
+
+        """
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        if communication_system.communicators[-1].size > 1:
+            # Every frame is reduced across the processors, which has to
+            # happen in the same order on all of them.
+            max_workers = 1
+        self._validate()
+        filenames = []
+
+        def write(im):
+            filename = validate_image_name(fname % len(filenames))
+            self._write_image(im, filename, sigma_clip)
+            self._last_render = im
+            filenames.append(filename)
+
+        cameras = iter(cameras)
+        camera = next(cameras, None)
+        if camera is None:
+            return filenames
+        # The first frame is rendered by the sources themselves, which sets up
+        # their volumes and transfer functions for the frames that follow.
+        write(self.composite(camera=camera))
+        if max_workers == 1:
+            for camera in cameras:
+                write(self.composite(camera=camera))
+            return filenames
+
+        def copy_source(source):
+            # Each frame is rendered by shallow copies of the sources, which
+            # share their bricks but keep their own sampler and image.
+            source = copy.copy(source)
+            if getattr(source, "num_threads", None) == 0:
+                source.num_threads = 1
+            return source
+
+        def render_frame(camera):
+            return self._composite(
+                camera,
+                [copy_source(source) for _, source in self.opaque_sources],
+                [copy_source(source) for _, source in self.transparent_sources],
+            )
+
+        with ThreadPoolExecutor(max_workers) as executor:
+            queue = deque()
+            for camera in cameras:
+                # The camera may be modified once the next one is requested
+                camera = _snapshot(camera)
+                camera.lens = _snapshot(camera.lens)
+                queue.append(executor.submit(render_frame, camera))
+                if len(queue) >= 2 * max_workers:
+                    write(queue.popleft().result())
+            while queue:
+                write(queue.popleft().result())
+        return filenames
+
     def _render_on_demand(self, render):
         # checks for existing render before rendering, in most cases we want to
         # render every time, but in some cases pulling the previous render is
@@ -331,21 +447,23 @@ class Scene:
 
         """
         fname = self._setup_save(fname, render)
+        self._write_image(self._last_render, fname, sigma_clip)
 
+    def _write_image(self, im, fname, sigma_clip):
         # We can render pngs natively but for other formats we defer to
         # matplotlib.
         if fname.endswith(".png"):
-            self._last_render.write_png(fname, sigma_clip=sigma_clip)
+            im.write_png(fname, sigma_clip=sigma_clip)
         else:
             from matplotlib.figure import Figure
 
-            shape = self._last_render.shape
+            shape = im.shape
             fig = Figure((shape[0] / 100.0, shape[1] / 100.0))
             canvas = get_canvas(fig, fname)
 
             ax = fig.add_axes((0, 0, 1, 1))
             ax.set_axis_off()
-            out = self._last_render
+            out = im
             if sigma_clip is not None:
                 max_val = out._clipping_value(sigma_clip)
             else:
@@ -609,14 +727,21 @@ class Scene:
         """
         if camera is None:
             camera = self.camera
+        return self._composite(
+            camera,
+            [source for _, source in self.opaque_sources],
+            [source for _, source in self.transparent_sources],
+        )
+
+    def _composite(self, camera, opaque_sources, transparent_sources):
         empty = camera.lens.new_image(camera)
         opaque = ZBuffer(empty, np.full(empty.shape[:2], np.inf))
 
-        for _, source in self.opaque_sources:
+        for source in opaque_sources:
             source.render(camera, zbuffer=opaque)
             im = source.zbuffer.rgba
 
-        for _, source in self.transparent_sources:
+        for source in transparent_sources:
             im = source.render(camera, zbuffer=opaque)
             opaque.rgba = im
 
@@ -1021,3 +1146,13 @@ class Scene:
         disp += "Camera: \n"
         disp += f"    {self.camera}"
         return disp
+
+
+def _snapshot(obj):
+    # A shallow copy of obj that does not share the arrays the original
+    # modifies in place, like the width of a camera as it is zoomed.
+    obj = copy.copy(obj)
+    for attr, value in list(vars(obj).items()):
+        if isinstance(value, np.ndarray):
+            vars(obj)[attr] = value.copy()
+    return obj
@@ -43,3 +43,56 @@ class SaveRenderTest(TestCase):
         # save a different format with/without sigma clips
         sc.save(os.path.join(self.tmpdir, "no_clip.jpg"), render=False)
         sc.save(os.path.join(self.tmpdir, "clip_2.jpg"), sigma_clip=2, render=False)
+
+    def test_render_path(self):
+        ds = fake_random_ds(ndims=32)
+        sc = yt.create_scene(ds)
+        sc.annotate_domain(ds)
+        cam = sc.camera
+        cam.resolution = (64, 64)
+        positions = [ds.arr([2.0, 0.25 * i, 0.5], "unitary") for i in range(5)]
+
+        def cameras():
+            for position in positions:
+                cam.set_position(position, north_vector=[0.0, 0.0, 1.0])
+                yield cam
+
+        ref = []
+        for i, _ in enumerate(cameras()):
+            fn = os.path.join(self.tmpdir, f"ref_{i}.png")
+            sc.save(fn)
+            ref.append(fn)
+
+        for max_workers in (1, 2):
+            fname = os.path.join(self.tmpdir, f"path_{max_workers}_%02i.png")
+            frames = sc.render_path(cameras(), fname, max_workers=max_workers)
+            assert len(frames) == len(ref)
+            for frame, fn in zip(frames, ref, strict=True):
+                with open(frame, "rb") as f1, open(fn, "rb") as f2:
+                    assert f1.read() == f2.read()
+
+    def test_render_path_zoom(self):
+        ds = fake_random_ds(ndims=32)
+        sc = yt.create_scene(ds)
+        sc.annotate_domain(ds)
+        cam = sc.camera
+        cam.resolution = (64, 64)
+        width = cam.width.copy()
+
+        def cameras():
+            # Zooming modifies the width of the camera in place
+            cam.width = width.copy()
+            for _ in cam.iter_zoom(4.0, 4):
+                yield cam
+
+        ref = []
+        for i, _ in enumerate(cameras()):
+            fn = os.path.join(self.tmpdir, f"zoom_ref_{i}.png")
+            sc.save(fn)
+            ref.append(fn)
+
+        fname = os.path.join(self.tmpdir, "zoom_%02i.png")
+        frames = sc.render_path(cameras(), fname, max_workers=2)
+        for frame, fn in zip(frames, ref, strict=True):
+            with open(frame, "rb") as f1, open(fn, "rb") as f2:
+                assert f1.read() == f2.read()
@@ -6,7 +6,7 @@ from unittest import TestCase
 import numpy as np
 
 import yt
-from yt.testing import fake_random_ds
+from yt.testing import fake_amr_ds, fake_random_ds
 from yt.visualization.volume_rendering.api import Scene, create_volume_source
 
 
@@ -137,3 +137,37 @@ class VariousVRTests(TestCase):
         assert source.volume._initialized
         assert source.volume.fields == [("gas", "velocity_x")]
         assert source.volume.log_fields == [False]
+
+    def test_progressive_rendering(self):
+        ds = fake_amr_ds(fields=["density"], units=["g/cm**3"])
+        sc = yt.create_scene(ds, ("gas", "density"))
+        source = sc[0]
+        ref = source.render(sc.camera).copy()
+
+        images = list(source.render_progressive(sc.camera))
+        assert [level for level, _ in images] == list(range(ds.index.max_level + 1))
+        assert source.max_level == ds.index.max_level
+        np.testing.assert_allclose(images[-1][1], ref)
+
+        source.set_max_level(0)
+        assert source._volume is None
+        source.render(sc.camera)
+        assert source.volume.tree.max_level == 0
+        grid_ids = {brick.parent_grid_id for brick in source.volume.bricks}
+        assert grid_ids <= {grid.id for grid in ds.index.select_grids(0)}
+
+    def test_early_ray_termination(self):
+        ds = fake_amr_ds(fields=["density"], units=["g/cm**3"])
+        sc = yt.create_scene(ds, ("gas", "density"))
+        source = sc[0]
+        source.transfer_function.grey_opacity = True
+        ref = sc.render().copy()
+
+        # Without any terminated ray, rendering front to back is the same, up
+        # to the rounding of the compositing
+        source.set_opacity_threshold(1.0)
+        np.testing.assert_allclose(sc.render(), ref, atol=1e-10 * ref.max())
+
+        # Every ray is terminated before it is sampled
+        source.set_opacity_threshold(0.0)
+        assert np.all(sc.render() == 0)
@@ -75,6 +75,11 @@ def new_volume_render_sampler(camera, render_source):
     }
     if "camera_data" in params:
         kwargs["camera_data"] = params["camera_data"]
+    opacity_threshold = getattr(render_source, "opacity_threshold", None)
+    tf = params["transfer_function"]
+    if opacity_threshold is not None and getattr(tf, "grey_opacity", False):
+        kwargs["front_to_back"] = 1
+        kwargs["opacity_threshold"] = opacity_threshold
     if render_source.zbuffer is not None:
         kwargs["zbuffer"] = render_source.zbuffer.z
         args[4][:] = np.reshape(